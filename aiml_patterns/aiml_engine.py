@@ -1,46 +1,46 @@
 """
 Advanced AIML Engine for Intelligent Conversation Handling
 """
-import aiml
 import os
 import re
 import json
 from typing import Dict, List, Optional, Any
 import streamlit as st
 from datetime import datetime
+from utils.tech_stack_parser import ParsedTechStack, tech_stack_parser
+from aiml_patterns.brain_snapshot import load_or_compile
+from aiml_patterns.pattern_graph import AIMLMatcher, PatternGraph, tokenize
+from utils.session_store import SessionStore, session_store
+
+# Session store namespaces
+CONTEXT_NAMESPACE = 'aiml_context'
+MESSAGES_NAMESPACE = 'aiml_messages'
+FEEDBACK_NAMESPACE = 'aiml_feedback'
 
 class AIMLEngine:
     """Advanced AIML engine with context awareness and learning capabilities"""
     
-    def __init__(self):
-        self.kernel = aiml.Kernel()
-        self.conversation_context = {}
-        self.learning_data = {}
+    def __init__(self, store: Optional[SessionStore] = None):
+        self.matcher = AIMLMatcher(PatternGraph())
+        # Conversation context, transcript and feedback live in the session store
+        self.store = store or session_store
         self.pattern_cache = {}
         self.initialize_aiml()
     
     def initialize_aiml(self):
-        """Initialize AIML kernel with patterns"""
+        """Initialize the compiled AIML pattern graph"""
         try:
-            # Load AIML patterns
-            aiml_dir = os.path.join(os.path.dirname(__file__))
-            pattern_files = [
-                os.path.join(aiml_dir, "hiring_patterns.aiml"),
-                os.path.join(aiml_dir, "advanced_patterns.aiml")
-            ]
-            
-            for pattern_file in pattern_files:
-                if os.path.exists(pattern_file):
-                    self.kernel.learn(pattern_file)
-                    print(f"✅ Loaded AIML patterns from {pattern_file}")
-                else:
-                    print(f"⚠️ AIML pattern file not found: {pattern_file}")
+            # Load the compiled brain snapshot, re-compiling the patterns if stale
+            graph, used_snapshot = load_or_compile()
+            self.matcher = AIMLMatcher(graph)
+            if used_snapshot:
+                print(f"✅ Loaded AIML brain snapshot ({graph.num_categories()} categories)")
             
             # Set initial bot predicates
-            self.kernel.setBotPredicate("name", "TalentScout Assistant")
-            self.kernel.setBotPredicate("age", "1")
-            self.kernel.setBotPredicate("location", "Cloud")
-            self.kernel.setBotPredicate("master", "TalentScout Team")
+            self.matcher.set_bot_predicate("name", "TalentScout Assistant")
+            self.matcher.set_bot_predicate("age", "1")
+            self.matcher.set_bot_predicate("location", "Cloud")
+            self.matcher.set_bot_predicate("master", "TalentScout Team")
             
         except Exception as e:
             print(f"❌ Error initializing AIML: {e}")
@@ -48,27 +48,32 @@ class AIMLEngine:
     def process_input(self, user_input: str, session_id: str = "default") -> Dict[str, Any]:
         """Process user input through AIML with context awareness"""
         try:
-            # Normalize input
-            normalized_input = self.normalize_input(user_input)
+            # Normalize input in a single tokenizer pass
+            words = tokenize(user_input)
+            normalized_input = " ".join(words)
+            
+            # Get AIML response using the session's stored predicates
+            session_state = self._load_session_state(session_id)
+            aiml_response = self.matcher.respond_words(words, session_state['predicates'], 0)
             
-            # Get AIML response
-            aiml_response = self.kernel.respond(normalized_input)
+            # Parse technology mentions once and share the result
+            parsed_stack = tech_stack_parser.parse(user_input)
             
             # Extract context from response
-            context = self.extract_context(aiml_response, user_input)
+            context = self.extract_context(aiml_response, user_input, parsed_stack)
             
             # Store conversation context
-            self.update_context(session_id, user_input, aiml_response, context)
+            self.update_context(session_id, user_input, aiml_response, context, session_state)
             
             # Enhance response with dynamic content
-            enhanced_response = self.enhance_response(aiml_response, context, session_id)
+            enhanced_response = self.enhance_response(aiml_response, context, session_id, session_state)
             
             return {
                 "response": enhanced_response,
                 "context": context,
                 "confidence": self.calculate_confidence(normalized_input, aiml_response),
                 "intent": self.detect_intent(user_input),
-                "entities": self.extract_entities(user_input)
+                "entities": self.extract_entities(user_input, parsed_stack)
             }
             
         except Exception as e:
@@ -83,52 +88,19 @@ class AIMLEngine:
     
     def normalize_input(self, user_input: str) -> str:
         """Normalize user input for better pattern matching"""
-        # Convert to uppercase for AIML processing
-        normalized = user_input.upper()
-        
-        # Handle common contractions
-        contractions = {
-            "I'M": "I AM",
-            "I'VE": "I HAVE",
-            "I'D": "I WOULD",
-            "I'LL": "I WILL",
-            "DON'T": "DO NOT",
-            "CAN'T": "CAN NOT",
-            "WON'T": "WILL NOT",
-            "SHOULDN'T": "SHOULD NOT",
-            "WOULDN'T": "WOULD NOT",
-            "COULDN'T": "COULD NOT"
-        }
-        
-        for contraction, expansion in contractions.items():
-            normalized = normalized.replace(contraction, expansion)
-        
-        # Clean up extra spaces and punctuation
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        
-        return normalized
+        return " ".join(tokenize(user_input))
     
-    def extract_context(self, aiml_response: str, user_input: str) -> Dict[str, Any]:
+    def extract_context(self, aiml_response: str, user_input: str,
+                        parsed_stack: Optional[ParsedTechStack] = None) -> Dict[str, Any]:
         """Extract context information from the conversation"""
         context = {}
         
-        # Extract technical skills mentioned - dynamically build patterns from config
-        from config import Config
-        tech_patterns = {}
-        
-        # Build regex patterns for each category from config
-        for category, technologies in Config.COMMON_TECHNOLOGIES.items():
-            # Escape special regex characters and create pattern
-            escaped_techs = [re.escape(tech) for tech in technologies]
-            pattern = r'\b(' + '|'.join(escaped_techs) + r')\b'
-            tech_patterns[category] = pattern
+        # Extract technical skills mentioned using the shared tech stack parser
+        if parsed_stack is None:
+            parsed_stack = tech_stack_parser.parse(user_input)
+        context.update(parsed_stack.by_category())
         
         user_lower = user_input.lower()
-        for category, pattern in tech_patterns.items():
-            matches = re.findall(pattern, user_lower, re.IGNORECASE)
-            if matches:
-                context[category] = list(set(matches))
         
         # Extract experience level
         exp_match = re.search(r'(\d+)\s*years?\s*(of\s*)?(experience|exp)', user_lower)
@@ -173,21 +145,14 @@ class AIMLEngine:
         
         return 'general'
     
-    def extract_entities(self, user_input: str) -> Dict[str, List[str]]:
+    def extract_entities(self, user_input: str,
+                         parsed_stack: Optional[ParsedTechStack] = None) -> Dict[str, List[str]]:
         """Extract named entities from user input"""
-        entities = {}
+        # Technology entities - same normalized output as the tech stack parser
+        if parsed_stack is None:
+            parsed_stack = tech_stack_parser.parse(user_input)
         
-        # Technology entities - use config for comprehensive coverage
-        from config import Config
-        tech_entities = Config.COMMON_TECHNOLOGIES
-        
-        user_lower = user_input.lower()
-        for category, items in tech_entities.items():
-            found_items = [item for item in items if item in user_lower]
-            if found_items:
-                entities[category] = found_items
-        
-        return entities
+        return parsed_stack.by_category()
     
     def calculate_confidence(self, normalized_input: str, aiml_response: str) -> float:
         """Calculate confidence score for the response"""
@@ -204,18 +169,26 @@ class AIMLEngine:
             # Lower confidence for fallback responses
             return 0.2
     
-    def update_context(self, session_id: str, user_input: str, aiml_response: str, context: Dict[str, Any]):
-        """Update conversation context for the session"""
-        if session_id not in self.conversation_context:
-            self.conversation_context[session_id] = {
-                'messages': [],
+    def _load_session_state(self, session_id: str) -> Dict[str, Any]:
+        """Stored context for the session, starting a fresh one if needed"""
+        session_state = self.store.get(session_id, CONTEXT_NAMESPACE)
+        if session_state is None:
+            session_state = {
                 'extracted_data': {},
                 'conversation_state': 'greeting',
-                'start_time': datetime.now().isoformat()
+                'start_time': datetime.now().isoformat(),
+                'predicates': {}
             }
+        return session_state
+    
+    def update_context(self, session_id: str, user_input: str, aiml_response: str, context: Dict[str, Any],
+                       session_state: Optional[Dict[str, Any]] = None):
+        """Update conversation context for the session"""
+        if session_state is None:
+            session_state = self._load_session_state(session_id)
         
-        # Add message to history
-        self.conversation_context[session_id]['messages'].append({
+        # Add message to history (appended, earlier messages are not rewritten)
+        self.store.append(session_id, MESSAGES_NAMESPACE, {
             'timestamp': datetime.now().isoformat(),
             'user_input': user_input,
             'bot_response': aiml_response,
@@ -223,25 +196,29 @@ class AIMLEngine:
         })
         
         # Update extracted data
-        self.conversation_context[session_id]['extracted_data'].update(context)
+        session_state['extracted_data'].update(context)
         
         # Update conversation state based on context
         if context.get('name'):
-            self.conversation_context[session_id]['conversation_state'] = 'collecting_info'
+            session_state['conversation_state'] = 'collecting_info'
         elif context.get('experience_years'):
-            self.conversation_context[session_id]['conversation_state'] = 'tech_stack_collection'
+            session_state['conversation_state'] = 'tech_stack_collection'
         else:
             from config import Config
             if any(key in context for key in Config.COMMON_TECHNOLOGIES.keys()):
-                self.conversation_context[session_id]['conversation_state'] = 'technical_questions'
+                session_state['conversation_state'] = 'technical_questions'
+        
+        self.store.put(session_id, CONTEXT_NAMESPACE, session_state)
     
-    def enhance_response(self, aiml_response: str, context: Dict[str, Any], session_id: str) -> str:
+    def enhance_response(self, aiml_response: str, context: Dict[str, Any], session_id: str,
+                         session_state: Optional[Dict[str, Any]] = None) -> str:
         """Enhance AIML response with dynamic content"""
         enhanced = aiml_response
         
         # Get session context
-        session_context = self.conversation_context.get(session_id, {})
-        extracted_data = session_context.get('extracted_data', {})
+        if session_state is None:
+            session_state = self.store.get(session_id, CONTEXT_NAMESPACE) or {}
+        extracted_data = session_state.get('extracted_data', {})
         
         # Replace placeholders with actual data
         if '{name}' in enhanced and extracted_data.get('name'):
@@ -266,32 +243,31 @@ class AIMLEngine:
     
     def get_session_context(self, session_id: str) -> Dict[str, Any]:
         """Get conversation context for a session"""
-        return self.conversation_context.get(session_id, {})
+        session_state = self.store.get(session_id, CONTEXT_NAMESPACE)
+        if session_state is None:
+            return {}
+        return dict(session_state, messages=self.store.read_log(session_id, MESSAGES_NAMESPACE))
     
     def reset_session(self, session_id: str):
         """Reset conversation context for a session"""
-        if session_id in self.conversation_context:
-            del self.conversation_context[session_id]
+        self.store.delete(session_id)
     
     def learn_from_feedback(self, session_id: str, feedback: Dict[str, Any]):
         """Learn from user feedback to improve responses"""
-        if session_id not in self.learning_data:
-            self.learning_data[session_id] = []
-        
-        self.learning_data[session_id].append({
+        self.store.append(session_id, FEEDBACK_NAMESPACE, {
             'timestamp': datetime.now().isoformat(),
             'feedback': feedback
         })
     
     def get_conversation_summary(self, session_id: str) -> Dict[str, Any]:
         """Generate a summary of the conversation"""
-        session_context = self.conversation_context.get(session_id, {})
+        session_context = self.store.get(session_id, CONTEXT_NAMESPACE)
         
         if not session_context:
             return {}
         
         extracted_data = session_context.get('extracted_data', {})
-        messages = session_context.get('messages', [])
+        message_count = self.store.log_length(session_id, MESSAGES_NAMESPACE)
         
         # Check for tech stack mentions using all categories from config
         from config import Config
@@ -300,7 +276,7 @@ class AIMLEngine:
         return {
             'session_id': session_id,
             'start_time': session_context.get('start_time'),
-            'message_count': len(messages),
+            'message_count': message_count,
             'conversation_state': session_context.get('conversation_state'),
             'candidate_data': extracted_data,
             'tech_stack_mentioned': tech_stack_mentioned,
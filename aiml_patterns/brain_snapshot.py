@@ -0,0 +1,158 @@
+"""
+Compiled AIML brain snapshots for fast warm starts
+
+Parsing the .aiml sources is the slowest part of building an AIMLEngine.
+A snapshot stores the compiled PatternGraph (pickled) next to a small JSON
+manifest that records the snapshot format, the Python version and a content
+hash of the .aiml sources and of the graph compiler. At startup the snapshot
+is loaded only if the manifest still matches; otherwise the sources are
+compiled again and a fresh snapshot is written.
+
+Compile ahead of time (e.g. in a container build) with:
+
+    python -m aiml_patterns.brain_snapshot
+"""
+import hashlib
+import json
+import os
+import pickle
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiml_patterns import pattern_graph
+from aiml_patterns.pattern_graph import PatternGraph, compile_aiml_files
+
+# Bump whenever the snapshot layout or the way it is produced changes
+BRAIN_FORMAT_VERSION = 2
+
+AIML_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PATTERN_FILES = [
+    os.path.join(AIML_DIR, "hiring_patterns.aiml"),
+    os.path.join(AIML_DIR, "advanced_patterns.aiml")
+]
+
+DEFAULT_BRAIN_FILE = os.path.join(AIML_DIR, "brain", "talentscout.brn")
+
+
+def get_brain_path() -> str:
+    """Snapshot location, overridable through the AIML_BRAIN_FILE setting"""
+    from config import Config
+    return Config.AIML_BRAIN_FILE or DEFAULT_BRAIN_FILE
+
+
+def source_hash(pattern_files: List[str]) -> str:
+    """Content hash over every existing pattern file (name and bytes)
+
+    The graph compiler is hashed too, since the snapshot pickles its classes.
+    """
+    digest = hashlib.sha256()
+    for pattern_file in list(pattern_files) + [pattern_graph.__file__]:
+        if not os.path.exists(pattern_file):
+            continue
+        digest.update(os.path.basename(pattern_file).encode('utf-8'))
+        with open(pattern_file, 'rb') as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+
+def _manifest_path(brain_path: str) -> str:
+    return brain_path + ".json"
+
+
+def _expected_manifest(pattern_files: List[str]) -> Dict[str, Any]:
+    return {
+        'format_version': BRAIN_FORMAT_VERSION,
+        'python_version': f"{sys.version_info[0]}.{sys.version_info[1]}",
+        'source_hash': source_hash(pattern_files)
+    }
+
+
+def read_manifest(brain_path: str) -> Optional[Dict[str, Any]]:
+    """Read the manifest written next to a snapshot, if any"""
+    try:
+        with open(_manifest_path(brain_path), 'r', encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def is_snapshot_current(brain_path: str, pattern_files: List[str]) -> bool:
+    """True when the snapshot exists and was built from the current sources"""
+    if not os.path.exists(brain_path):
+        return False
+
+    manifest = read_manifest(brain_path)
+    if not manifest:
+        return False
+
+    expected = _expected_manifest(pattern_files)
+    return all(manifest.get(key) == value for key, value in expected.items())
+
+
+def save_snapshot(graph: PatternGraph, brain_path: str, pattern_files: List[str]):
+    """Write the compiled graph and its manifest atomically"""
+    os.makedirs(os.path.dirname(brain_path) or '.', exist_ok=True)
+
+    temp_brain = brain_path + ".tmp"
+    with open(temp_brain, 'wb') as handle:
+        pickle.dump(graph, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    manifest = _expected_manifest(pattern_files)
+    manifest['categories'] = graph.num_categories()
+    manifest['created_at'] = datetime.now().isoformat()
+
+    temp_manifest = _manifest_path(brain_path) + ".tmp"
+    with open(temp_manifest, 'w', encoding='utf-8') as handle:
+        json.dump(manifest, handle, indent=2)
+
+    # Replace the brain first so a stale manifest can never vouch for it
+    os.replace(temp_brain, brain_path)
+    os.replace(temp_manifest, _manifest_path(brain_path))
+
+
+def load_or_compile(pattern_files: List[str] = None,
+                    brain_path: Optional[str] = None) -> Tuple[PatternGraph, bool]:
+    """Load the compiled graph from the snapshot, re-compiling if it is stale
+
+    Returns the graph and True when the snapshot was used (warm start) or
+    False when the sources had to be compiled (cold start).
+    """
+    pattern_files = pattern_files or PATTERN_FILES
+    brain_path = brain_path or get_brain_path()
+
+    if is_snapshot_current(brain_path, pattern_files):
+        try:
+            with open(brain_path, 'rb') as handle:
+                graph = pickle.load(handle)
+            if isinstance(graph, PatternGraph):
+                return graph, True
+            print("⚠️ AIML brain snapshot is not a pattern graph, re-compiling")
+        except Exception as e:
+            print(f"⚠️ Could not load AIML brain snapshot, re-compiling: {e}")
+
+    graph = compile_aiml_files(pattern_files)
+
+    try:
+        save_snapshot(graph, brain_path, pattern_files)
+    except OSError as e:
+        # A read-only filesystem should not prevent the engine from starting
+        print(f"⚠️ Could not write AIML brain snapshot: {e}")
+
+    return graph, False
+
+
+def compile_brain(pattern_files: List[str] = None, brain_path: Optional[str] = None) -> Dict[str, Any]:
+    """Compile the sources and write a fresh snapshot unconditionally"""
+    pattern_files = pattern_files or PATTERN_FILES
+    brain_path = brain_path or get_brain_path()
+
+    save_snapshot(compile_aiml_files(pattern_files), brain_path, pattern_files)
+    return read_manifest(brain_path)
+
+
+if __name__ == "__main__":
+    manifest = compile_brain()
+    print(f"🧠 Wrote AIML brain snapshot to {get_brain_path()}")
+    print(json.dumps(manifest, indent=2))
@@ -0,0 +1,454 @@
+"""
+Compiled AIML pattern graph
+Matches normalized input against the categories in aiml_patterns/*.aiml
+without the python-aiml kernel
+"""
+import random
+import re
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+# Maximum nesting of <srai> redirects before a response is abandoned
+MAX_SRAI_DEPTH = 100
+
+# Single pass tokenizer: words made of letters and digits, optionally joined
+# by an apostrophe. Everything else (punctuation, underscores) separates words.
+_TOKEN_RE = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+
+# Contractions and colloquialisms that are expanded before matching. This
+# covers the contractions the engine used to expand plus the python-aiml
+# default substitutions that can still apply to punctuation-free input.
+_EXPANSIONS = {
+    "I'M": ("I", "AM"),
+    "I'VE": ("I", "HAVE"),
+    "I'D": ("I", "WOULD"),
+    "I'LL": ("I", "WILL"),
+    "DON'T": ("DO", "NOT"),
+    "CAN'T": ("CAN", "NOT"),
+    "WON'T": ("WILL", "NOT"),
+    "SHOULDN'T": ("SHOULD", "NOT"),
+    "WOULDN'T": ("WOULD", "NOT"),
+    "COULDN'T": ("COULD", "NOT"),
+    "CANNOT": ("CAN", "NOT"),
+    "WANNA": ("WANT", "TO"),
+    "GONNA": ("GOING", "TO")
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Normalize free text into the upper-case words used for matching"""
+    words = []
+    for token in _TOKEN_RE.findall(text.upper()):
+        if "'" in token or "’" in token:
+            token = token.replace("’", "'")
+            expansion = _EXPANSIONS.get(token)
+            if expansion:
+                words.extend(expansion)
+            else:
+                # Unknown contractions split like any other punctuation
+                words.extend(token.split("'"))
+        else:
+            expansion = _EXPANSIONS.get(token)
+            if expansion:
+                words.extend(expansion)
+            else:
+                words.append(token)
+    return words
+
+
+# Template renderers ----------------------------------------------------------
+#
+# Templates are compiled once into small renderer objects. Text is stored with
+# its whitespace already collapsed, and <srai> with constant content is linked
+# straight to its target template when the graph is built.
+
+class _Render:
+    """Per-response state threaded through the renderers"""
+    __slots__ = ('matcher', 'predicates', 'words', 'stars', 'depth')
+
+    def __init__(self, matcher, predicates: Dict[str, str], words: List[str],
+                 stars: List[Tuple[int, int]], depth: int):
+        self.matcher = matcher
+        self.predicates = predicates
+        self.words = words
+        self.stars = stars
+        self.depth = depth
+
+
+def _render_all(nodes: tuple, state: _Render) -> str:
+    return "".join([node.render(state) for node in nodes])
+
+
+class Text:
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def render(self, state: _Render) -> str:
+        return self.text
+
+
+class Star:
+    __slots__ = ('index',)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def render(self, state: _Render) -> str:
+        if self.index > len(state.stars):
+            return ""
+        start, end = state.stars[self.index - 1]
+        return " ".join(state.words[start:end])
+
+
+class Get:
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def render(self, state: _Render) -> str:
+        return state.predicates.get(self.name, "")
+
+
+class Bot:
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def render(self, state: _Render) -> str:
+        return state.matcher.bot_predicates.get(self.name, "")
+
+
+class Set:
+    __slots__ = ('name', 'children')
+
+    def __init__(self, name: str, children: tuple):
+        self.name = name
+        self.children = children
+
+    def render(self, state: _Render) -> str:
+        value = _render_all(self.children, state)
+        state.predicates[self.name] = value
+        return value
+
+
+class Think:
+    __slots__ = ('children',)
+
+    def __init__(self, children: tuple):
+        self.children = children
+
+    def render(self, state: _Render) -> str:
+        _render_all(self.children, state)
+        return ""
+
+
+class Random:
+    __slots__ = ('options',)
+
+    def __init__(self, options: tuple):
+        self.options = options
+
+    def render(self, state: _Render) -> str:
+        if not self.options:
+            return ""
+        # Shuffle-and-take-first keeps the same random stream as python-aiml
+        options = list(self.options)
+        random.shuffle(options)
+        return _render_all(options[0], state)
+
+
+class Condition:
+    """<condition> in block form (name and value) or list form (<li> items)"""
+    __slots__ = ('name', 'items', 'default')
+
+    def __init__(self, name: Optional[str], items: tuple, default: Optional[tuple]):
+        self.name = name
+        self.items = items  # ((predicate name, value, children), ...)
+        self.default = default
+
+    def render(self, state: _Render) -> str:
+        for name, value, children in self.items:
+            if state.predicates.get(name, "") == value:
+                return _render_all(children, state)
+        if self.default is not None:
+            return _render_all(self.default, state)
+        return ""
+
+
+class Srai:
+    __slots__ = ('children', 'words', 'target', 'stars')
+
+    def __init__(self, children: tuple):
+        self.children = children
+        # Constant redirects are tokenized now and linked by PatternGraph.link()
+        self.words = None
+        self.target = None
+        self.stars = []
+        if all(isinstance(child, Text) for child in children):
+            self.words = tokenize(_render_all(children, None))
+
+    def render(self, state: _Render) -> str:
+        if self.target is not None:
+            return state.matcher.render_template(self.target, state.predicates, self.words, self.stars, state.depth + 1)
+        words = self.words if self.words is not None else tokenize(_render_all(self.children, state))
+        return state.matcher.respond_words(words, state.predicates, state.depth + 1)
+
+
+class Template:
+    __slots__ = ('pattern', 'children')
+
+    def __init__(self, pattern: str, children: tuple):
+        self.pattern = pattern
+        self.children = children
+
+
+# Compiler --------------------------------------------------------------------
+
+def _collapse(text: Optional[str]) -> str:
+    return _WHITESPACE_RE.sub(" ", text) if text else ""
+
+
+def _compile_children(element) -> tuple:
+    """Compile the mixed text/element content of an XML element"""
+    nodes = []
+    if element.text:
+        nodes.append(Text(_collapse(element.text)))
+    for child in element:
+        nodes.append(_compile_element(child))
+        if child.tail:
+            nodes.append(Text(_collapse(child.tail)))
+
+    # Merge adjacent text so rendering does as little work as possible
+    merged = []
+    for node in nodes:
+        if node is None:
+            continue
+        if isinstance(node, Text) and merged and isinstance(merged[-1], Text):
+            merged[-1] = Text(merged[-1].text + node.text)
+        else:
+            merged.append(node)
+    return tuple(merged)
+
+
+def _list_items(element) -> List:
+    return [child for child in element if child.tag == 'li']
+
+
+def _compile_element(element):
+    tag = element.tag
+    if tag == 'star':
+        return Star(int(element.get('index', 1)))
+    if tag == 'get':
+        return Get(element.get('name'))
+    if tag == 'bot':
+        return Bot(element.get('name'))
+    if tag == 'set':
+        return Set(element.get('name'), _compile_children(element))
+    if tag == 'think':
+        return Think(_compile_children(element))
+    if tag == 'srai':
+        return Srai(_compile_children(element))
+    if tag == 'sr':
+        return Srai((Star(1),))
+    if tag == 'random':
+        return Random(tuple(_compile_children(li) for li in _list_items(element)))
+    if tag == 'condition':
+        name = element.get('name')
+        if name is not None and element.get('value') is not None:
+            return Condition(None, ((name, element.get('value'), _compile_children(element)),), None)
+
+        items, default = [], None
+        list_items = _list_items(element)
+        for position, li in enumerate(list_items):
+            if not li.attrib and position == len(list_items) - 1:
+                default = _compile_children(li)
+            else:
+                items.append((li.get('name', name), li.get('value'), _compile_children(li)))
+        return Condition(name, tuple(items), default)
+
+    print(f"⚠️ Unsupported AIML element <{tag}> ignored")
+    return None
+
+
+class _Node:
+    __slots__ = ('words', 'star', 'underscore', 'template')
+
+    def __init__(self):
+        self.words = {}
+        self.star = None
+        self.underscore = None
+        self.template = None
+
+    def is_leaf(self) -> bool:
+        return not self.words and self.star is None and self.underscore is None
+
+
+class PatternGraph:
+    """Word-level trie of AIML patterns with '*' and '_' wildcard edges"""
+
+    def __init__(self):
+        self.root = _Node()
+        self._category_count = 0
+
+    def add_category(self, pattern: str, template: Template):
+        """Add a category; a repeated pattern replaces the earlier template"""
+        node = self.root
+        for word in pattern.split():
+            if word == '*':
+                node.star = node.star or _Node()
+                node = node.star
+            elif word == '_':
+                node.underscore = node.underscore or _Node()
+                node = node.underscore
+            else:
+                node = node.words.setdefault(word, _Node())
+
+        if node.template is None:
+            self._category_count += 1
+        node.template = template
+
+    def num_categories(self) -> int:
+        return self._category_count
+
+    def match(self, words: List[str]) -> Tuple[Optional[Template], List[Tuple[int, int]]]:
+        """Find the best template for the words and the (start, end) span of each wildcard
+
+        Preference at every position is '_', then the exact word, then '*';
+        wildcards take as few words as possible, as in python-aiml.
+        """
+        if not words:
+            return None, []
+        stars = []
+        template = self._match(self.root, words, 0, stars)
+        stars.reverse()
+        return template, stars
+
+    def _match(self, node: _Node, words: List[str], position: int, stars: List) -> Optional[Template]:
+        if position == len(words):
+            return node.template
+
+        for wildcard in (node.underscore, None, node.star):
+            if wildcard is None:
+                child = node.words.get(words[position])
+                if child is not None:
+                    template = self._match(child, words, position + 1, stars)
+                    if template is not None:
+                        return template
+                continue
+
+            # A trailing wildcard can only end at the last word
+            first_end = len(words) if wildcard.is_leaf() else position + 1
+            for end in range(first_end, len(words) + 1):
+                template = self._match(wildcard, words, end, stars)
+                if template is not None:
+                    stars.append((position, end))
+                    return template
+        return None
+
+    def templates(self):
+        """Iterate over every compiled template"""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.template is not None:
+                yield node.template
+            stack.extend(node.words.values())
+            stack.extend(child for child in (node.star, node.underscore) if child is not None)
+
+    def link(self):
+        """Point constant <srai> redirects straight at their target templates"""
+        for template in self.templates():
+            for srai in _iter_srai(template.children):
+                if srai.words is not None:
+                    srai.target, srai.stars = self.match(srai.words)
+
+
+def _iter_srai(nodes: tuple):
+    for node in nodes:
+        if isinstance(node, Srai):
+            yield node
+        children = getattr(node, 'children', None)
+        if children:
+            yield from _iter_srai(children)
+        if isinstance(node, Random):
+            for option in node.options:
+                yield from _iter_srai(option)
+        elif isinstance(node, Condition):
+            for _, _, item in node.items:
+                yield from _iter_srai(item)
+            if node.default:
+                yield from _iter_srai(node.default)
+
+
+def compile_aiml_files(pattern_files: List[str]) -> PatternGraph:
+    """Parse AIML files into a linked PatternGraph"""
+    graph = PatternGraph()
+    for pattern_file in pattern_files:
+        root = ET.parse(pattern_file).getroot()
+        for category in root.iter('category'):
+            if category.find('that') is not None:
+                print(f"⚠️ <that> is not supported, skipping category in {pattern_file}")
+                continue
+            pattern = " ".join((category.findtext('pattern') or "").split())
+            template = category.find('template')
+            if not pattern or template is None:
+                continue
+            graph.add_category(pattern, Template(pattern, _compile_children(template)))
+        print(f"✅ Loaded AIML patterns from {pattern_file}")
+    graph.link()
+    return graph
+
+
+# Runtime ---------------------------------------------------------------------
+
+class AIMLMatcher:
+    """Responds to input using a compiled PatternGraph
+
+    Session predicates (<set>/<get>) are kept per session id. The graph is
+    read-only after compilation, so one matcher can serve many sessions
+    concurrently without a global lock.
+    """
+
+    def __init__(self, graph: PatternGraph):
+        self.graph = graph
+        self.bot_predicates: Dict[str, str] = {}
+        self.sessions: Dict[str, Dict[str, str]] = {}
+
+    def set_bot_predicate(self, name: str, value: str):
+        self.bot_predicates[name] = value
+
+    def get_predicate(self, name: str, session_id: str) -> str:
+        return self.sessions.get(session_id, {}).get(name, "")
+
+    def delete_session(self, session_id: str):
+        self.sessions.pop(session_id, None)
+
+    def respond(self, text: str, session_id: str = "default") -> str:
+        """Tokenize free text and return the response for the session"""
+        return self.respond_to_words(tokenize(text), session_id)
+
+    def respond_to_words(self, words: List[str], session_id: str = "default") -> str:
+        """Return the response for already tokenized input"""
+        predicates = self.sessions.setdefault(session_id, {})
+        return self.respond_words(words, predicates, 0)
+
+    def respond_words(self, words: List[str], predicates: Dict[str, str], depth: int) -> str:
+        if depth > MAX_SRAI_DEPTH:
+            return ""
+        template, stars = self.graph.match(words)
+        if template is None:
+            return ""
+        return self.render_template(template, predicates, words, stars, depth)
+
+    def render_template(self, template: Template, predicates: Dict[str, str],
+                        words: List[str], stars: List[Tuple[int, int]], depth: int) -> str:
+        if depth > MAX_SRAI_DEPTH:
+            return ""
+        state = _Render(self, predicates, words, stars, depth)
+        return _render_all(template.children, state).strip()
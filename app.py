@@ -6,9 +6,13 @@ import json
 import time
 from datetime import datetime
 from typing import Dict, List, Any
-from chatbot.aiml_conversation_manager import AIMLConversationManager as ConversationManager, ConversationState
-from chatbot.llm_integration import LLMIntegration
+from chatbot.aiml_conversation_manager import SAVED_MESSAGES_KEY, ConversationState
+from chatbot.resources import (
+    get_conversation_manager, get_llm_integration, get_question_generator,
+    reset_session_resources, begin_request, request_scratch
+)
 from config import Config
+from utils.communication_stats import CommunicationStats
 
 # Page configuration
 st.set_page_config(
@@ -408,8 +412,10 @@ class TalentScoutApp:
     """Main application class"""
     
     def __init__(self):
-        self.conversation_manager = ConversationManager()
-        self.llm_integration = LLMIntegration()
+        # Heavy components are shared across reruns; see chatbot/resources.py
+        begin_request()
+        self.conversation_manager = get_conversation_manager()
+        self.llm_integration = get_llm_integration()
         self.conversation_manager.initialize_session_state()
     
     def run(self):
@@ -614,9 +620,9 @@ class TalentScoutApp:
                 insights.append("🚀 Uses modern technologies - up-to-date skills")
         
         # Communication insights
-        user_messages = [msg for msg in st.session_state.messages if msg['role'] == 'user']
-        if user_messages:
-            avg_length = sum(len(msg['content'].split()) for msg in user_messages) / len(user_messages)
+        communication_stats = self._communication_stats()
+        if communication_stats.user_messages:
+            avg_length = communication_stats.average_words
             if avg_length > 15:
                 insights.append("💬 Detailed communicator - good for client-facing roles")
             elif avg_length > 8:
@@ -681,6 +687,59 @@ class TalentScoutApp:
                 else:
                     st.write(f"⏳ {step}")
     
+    def _user_message_html(self, content) -> str:
+        """HTML for a user chat bubble"""
+        return f"""
+                            <div class="chat-message user-message">
+                                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                                    <div style="width: 36px; height: 36px; border-radius: 50%; background: rgba(255,255,255,0.2); display: flex; align-items: center; justify-content: center; margin-right: 0.75rem;">
+                                        <span style="font-size: 1rem;">👤</span>
+                                    </div>
+                                    <strong style="font-weight: 600; font-size: 0.9rem;">You</strong>
+                                </div>
+                                <div style="margin-left: 2.75rem; line-height: 1.6; font-size: 1rem;">
+                                    {content.replace('<', '&lt;').replace('>', '&gt;') if isinstance(content, str) else content}
+                                </div>
+                            </div>
+                            """
+    
+    def _assistant_message_html(self, content) -> str:
+        """HTML for an assistant chat bubble"""
+        return f"""
+                    <div class="chat-message assistant-message">
+                        <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                            <div style="width: 36px; height: 36px; border-radius: 50%; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; margin-right: 0.75rem; color: white;">
+                                <span style="font-size: 1rem;">🤖</span>
+                            </div>
+                            <strong style="font-weight: 600; color: #667eea; font-size: 0.9rem;">TalentScout Assistant</strong>
+                        </div>
+                        <div style="margin-left: 2.75rem; line-height: 1.6; font-size: 1rem;">
+                            {content.replace('<', '&lt;').replace('>', '&gt;') if isinstance(content, str) else content}
+                        </div>
+                    </div>
+                    """
+    
+    def _stream_enhanced_response(self, user_input: str, response: str) -> str:
+        """Render the LLM-enhanced reply as it streams and return the final text
+        
+        The user's message is drawn first so the conversation reads in order
+        while tokens arrive; the caller commits the returned text to history.
+        """
+        st.markdown(self._user_message_html(user_input), unsafe_allow_html=True)
+        
+        context = {
+            'state': st.session_state.conversation_state.value,
+            'candidate_name': st.session_state.candidate_data.get('full_name', 'candidate')
+        }
+        
+        placeholder = st.empty()
+        streamed_text = ""
+        for token in self.llm_integration.stream_enhanced_response(response, context):
+            streamed_text += token
+            placeholder.markdown(self._assistant_message_html(streamed_text), unsafe_allow_html=True)
+        
+        return streamed_text.strip() or response
+    
     def render_main_chat(self):
         """Render the main chat interface"""
         st.header("💬 Conversation")
@@ -709,19 +768,7 @@ class TalentScoutApp:
                     if is_last_user_message and len(st.session_state.messages) > 1:
                         col1, col2 = st.columns([0.9, 0.1])
                         with col1:
-                            st.markdown(f"""
-                            <div class="chat-message user-message">
-                                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
-                                    <div style="width: 36px; height: 36px; border-radius: 50%; background: rgba(255,255,255,0.2); display: flex; align-items: center; justify-content: center; margin-right: 0.75rem;">
-                                        <span style="font-size: 1rem;">👤</span>
-                                    </div>
-                                    <strong style="font-weight: 600; font-size: 0.9rem;">You</strong>
-                                </div>
-                                <div style="margin-left: 2.75rem; line-height: 1.6; font-size: 1rem;">
-                                    {message["content"].replace('<', '&lt;').replace('>', '&gt;') if isinstance(message["content"], str) else message["content"]}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            st.markdown(self._user_message_html(message["content"]), unsafe_allow_html=True)
                         
                         with col2:
                             if st.button("✏️", key=f"edit_btn_{i}", help="Edit this message", 
@@ -730,38 +777,14 @@ class TalentScoutApp:
                                 st.session_state.edit_message_index = i
                                 st.rerun()
                     else:
-                        st.markdown(f"""
-                        <div class="chat-message user-message">
-                            <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
-                                <div style="width: 36px; height: 36px; border-radius: 50%; background: rgba(255,255,255,0.2); display: flex; align-items: center; justify-content: center; margin-right: 0.75rem;">
-                                    <span style="font-size: 1rem;">👤</span>
-                                </div>
-                                <strong style="font-weight: 600; font-size: 0.9rem;">You</strong>
-                            </div>
-                            <div style="margin-left: 2.75rem; line-height: 1.6; font-size: 1rem;">
-                                {message["content"].replace('<', '&lt;').replace('>', '&gt;') if isinstance(message["content"], str) else message["content"]}
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+                        st.markdown(self._user_message_html(message["content"]), unsafe_allow_html=True)
                 else:
-                    st.markdown(f"""
-                    <div class="chat-message assistant-message">
-                        <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
-                            <div style="width: 36px; height: 36px; border-radius: 50%; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; margin-right: 0.75rem; color: white;">
-                                <span style="font-size: 1rem;">🤖</span>
-                            </div>
-                            <strong style="font-weight: 600; color: #667eea; font-size: 0.9rem;">TalentScout Assistant</strong>
-                        </div>
-                        <div style="margin-left: 2.75rem; line-height: 1.6; font-size: 1rem;">
-                            {message["content"].replace('<', '&lt;').replace('>', '&gt;') if isinstance(message["content"], str) else message["content"]}
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(self._assistant_message_html(message["content"]), unsafe_allow_html=True)
         
         # Initial greeting if no messages
         if not st.session_state.messages:
             greeting = self.conversation_manager.get_greeting_message()
-            st.session_state.messages.append({"role": "assistant", "content": greeting})
+            self._append_message("assistant", greeting)
             st.rerun()
         
         # Chat input
@@ -770,16 +793,17 @@ class TalentScoutApp:
             
             if user_input:
                 # Add user message
-                st.session_state.messages.append({"role": "user", "content": user_input})
+                self._append_message("user", user_input)
                 
                 # Process response - streamlined for speed
                 response = self.conversation_manager.process_user_input(user_input)
                 
-                # Skip LLM enhancement for faster responses
-                # The conversation manager already provides natural responses
+                # Optionally stream an LLM-enhanced version of the reply
+                if Config.ENABLE_LLM_ENHANCEMENT and self.llm_integration.client:
+                    response = self._stream_enhanced_response(user_input, response)
                 
                 # Add assistant response
-                st.session_state.messages.append({"role": "assistant", "content": response})
+                self._append_message("assistant", response)
                 
                 st.rerun()
         else:
@@ -908,6 +932,8 @@ class TalentScoutApp:
             
             # Remove all messages after the edited message
             st.session_state.messages = st.session_state.messages[:edit_index + 1]
+            self.conversation_manager.truncate_saved_transcript(edit_index)
+            st.session_state.communication_stats = CommunicationStats.from_messages(st.session_state.messages)
             
             # Reset conversation state to regenerate properly
             # We need to determine the appropriate state based on the conversation progress
@@ -917,7 +943,7 @@ class TalentScoutApp:
             response = self.conversation_manager.process_user_input(new_message)
             
             # Add the new assistant response
-            st.session_state.messages.append({"role": "assistant", "content": response})
+            self._append_message("assistant", response)
             
             # Exit edit mode
             st.session_state.edit_mode = False
@@ -975,7 +1001,8 @@ class TalentScoutApp:
         keys_to_reset = [
             'conversation_state', 'messages', 'candidate_data', 
             'field_index', 'generated_questions', 'edit_mode', 
-            'edit_message_index', 'questions_answered', 'technical_responses'
+            'edit_message_index', 'questions_answered', 'technical_responses',
+            'communication_stats', SAVED_MESSAGES_KEY
         ]
         
         reset_count = 0
@@ -984,7 +1011,9 @@ class TalentScoutApp:
                 del st.session_state[key]
                 reset_count += 1
         
-        # Reinitialize
+        # Start the next conversation with a fresh session-tier manager
+        reset_session_resources()
+        self.conversation_manager = get_conversation_manager()
         self.conversation_manager.initialize_session_state()
         st.success(f"✅ Session reset successfully! Cleared {reset_count} items.")
         st.balloons()  # Fun visual feedback
@@ -994,13 +1023,7 @@ class TalentScoutApp:
         """Export comprehensive candidate report"""
         if st.session_state.candidate_data:
             # Generate comprehensive scoring
-            from utils.candidate_scorer import CandidateScorer
-            scorer = CandidateScorer()
-            
-            score_data = scorer.generate_comprehensive_score(
-                st.session_state.candidate_data, 
-                st.session_state.messages
-            )
+            score_data = self._get_score_data()
             
             # Create comprehensive export
             export_data = {
@@ -1009,7 +1032,7 @@ class TalentScoutApp:
                     'scoring_analysis': score_data,
                     'conversation_metrics': {
                         'total_messages': len(st.session_state.messages),
-                        'user_messages': len([m for m in st.session_state.messages if m['role'] == 'user']),
+                        'user_messages': self._communication_stats().user_messages,
                         'completion_status': st.session_state.conversation_state.value,
                         'session_duration': 'N/A'  # Could be calculated with timestamps
                     }
@@ -1017,7 +1040,8 @@ class TalentScoutApp:
                 'technical_assessment': {
                     'generated_questions': st.session_state.generated_questions,
                     'tech_stack_analysis': score_data.get('analysis', {}).get('tech_stack', {}),
-                    'role_fit_analysis': score_data.get('analysis', {}).get('role_fit', {})
+                    'role_fit_analysis': score_data.get('analysis', {}).get('role_fit', {}),
+                    'answer_analysis': self._get_answer_analysis()
                 },
                 'conversation_transcript': st.session_state.messages,
                 'recruiter_notes': {
@@ -1060,6 +1084,60 @@ class TalentScoutApp:
         else:
             st.warning("⚠️ No candidate data to export yet.")
     
+    def _get_score_data(self) -> Dict:
+        """Score the candidate at most once per script run"""
+        scratch = request_scratch()
+        if 'score_data' not in scratch:
+            from utils.candidate_scorer import candidate_scorer as scorer
+            scratch['score_data'] = scorer.generate_comprehensive_score(
+                st.session_state.candidate_data, 
+                st.session_state.messages,
+                self._communication_stats()
+            )
+        return scratch['score_data']
+    
+    def _append_message(self, role: str, content: str):
+        """Append a chat message, fold it into the running communication stats and save the session"""
+        message = {"role": role, "content": content}
+        self._communication_stats().add(message)
+        st.session_state.messages.append(message)
+        self.conversation_manager.save_session_state()
+    
+    def _communication_stats(self) -> CommunicationStats:
+        """Running communication stats, rebuilt if the transcript changed behind our back"""
+        stats = st.session_state.get('communication_stats')
+        if stats is None or stats.message_count != len(st.session_state.messages):
+            stats = CommunicationStats.from_messages(st.session_state.messages)
+            st.session_state.communication_stats = stats
+        return stats
+    
+    def _get_answer_analysis(self) -> List[Dict]:
+        """LLM analysis of every technical answer, batched into few requests
+        
+        Kept in the session until the answers change so repeated exports
+        do not repeat the round trips.
+        """
+        responses = st.session_state.get('technical_responses', [])
+        if not responses or not self.llm_integration.client:
+            return []
+        
+        qa_pairs = [
+            {'question': response.get('question', ''), 'answer': response['response']}
+            for response in responses
+        ]
+        signature = tuple((pair['question'], pair['answer']) for pair in qa_pairs)
+        cached = st.session_state.get('_answer_analysis')
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        results = self.llm_integration.analyze_technical_responses(qa_pairs)
+        analysis = [
+            {'question_number': response['question_number'], **result}
+            for response, result in zip(responses, results)
+        ]
+        st.session_state['_answer_analysis'] = (signature, analysis)
+        return analysis
+    
     def _generate_next_steps(self, score_data: Dict) -> List[str]:
         """Generate recommended next steps based on scoring"""
         next_steps = []
@@ -1199,8 +1277,7 @@ System: TalentScout Hiring Assistant v2.0
             st.metric("Total Technologies", total_technologies)
             
             # Enhanced question bank info
-            from utils.question_generator import TechnicalQuestionGenerator
-            generator = TechnicalQuestionGenerator()
+            generator = get_question_generator()
             total_questions = sum(len(q) for q in generator.question_bank.values())
             st.metric("Total Questions", total_questions)
             
@@ -1472,13 +1549,7 @@ System: TalentScout Hiring Assistant v2.0
     def show_candidate_scoring(self):
         """Show advanced candidate scoring"""
         with st.expander("🎯 Candidate Scoring", expanded=True):
-            from utils.candidate_scorer import CandidateScorer
-            
-            scorer = CandidateScorer()
-            score_data = scorer.generate_comprehensive_score(
-                st.session_state.candidate_data, 
-                st.session_state.messages
-            )
+            score_data = self._get_score_data()
             
             if 'error' not in score_data:
                 # Overall Score
@@ -1512,18 +1583,17 @@ System: TalentScout Hiring Assistant v2.0
         with st.expander("📊 Analytics Dashboard", expanded=False):
             if st.session_state.messages:
                 # Conversation metrics
-                user_messages = [msg for msg in st.session_state.messages if msg['role'] == 'user']
-                assistant_messages = [msg for msg in st.session_state.messages if msg['role'] == 'assistant']
+                communication_stats = self._communication_stats()
+                user_messages = communication_stats.user_messages
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.metric("User Messages", len(user_messages))
-                    st.metric("Assistant Messages", len(assistant_messages))
+                    st.metric("User Messages", user_messages)
+                    st.metric("Assistant Messages", communication_stats.message_count - user_messages)
                 
                 with col2:
                     if user_messages:
-                        avg_length = sum(len(msg['content'].split()) for msg in user_messages) / len(user_messages)
-                        st.metric("Avg Response Length", f"{avg_length:.1f} words")
+                        st.metric("Avg Response Length", f"{communication_stats.average_words:.1f} words")
                     
                     completion = len(st.session_state.candidate_data) / 7 * 100 if st.session_state.candidate_data else 0
                     st.metric("Data Completion", f"{completion:.0f}%")
@@ -1577,6 +1647,7 @@ System: TalentScout Hiring Assistant v2.0
             st.write(f"- Streamlit Version: {st.__version__}")
             
             if st.button("Clear All Session Data", help="Reset all session state", type="secondary"):
+                reset_session_resources()
                 for key in list(st.session_state.keys()):
                     del st.session_state[key]
                 st.success("Session data cleared!")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: compiling the AIML sources vs. loading the brain snapshot
+"""
+import sys
+import os
+import io
+import tempfile
+import time
+from contextlib import redirect_stdout
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiml_patterns.brain_snapshot import PATTERN_FILES, load_or_compile
+from aiml_patterns.pattern_graph import compile_aiml_files
+
+RUNS = 5
+
+def time_cold_compile() -> float:
+    """Compile the .aiml sources from scratch"""
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        compile_aiml_files(PATTERN_FILES)
+    return time.perf_counter() - start
+
+def time_snapshot_load(brain_path: str) -> float:
+    """Load a current snapshot (includes the manifest/hash check)"""
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        _, used_snapshot = load_or_compile(PATTERN_FILES, brain_path)
+    elapsed = time.perf_counter() - start
+    assert used_snapshot, "snapshot was not used"
+    return elapsed
+
+def main():
+    """Run the startup benchmark"""
+    print("🧠 AIML Startup Benchmark")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        brain_path = os.path.join(temp_dir, "bench.brn")
+
+        # First call compiles and writes the snapshot
+        with redirect_stdout(io.StringIO()):
+            load_or_compile(PATTERN_FILES, brain_path)
+
+        cold = min(time_cold_compile() for _ in range(RUNS))
+        warm = min(time_snapshot_load(brain_path) for _ in range(RUNS))
+
+    print(f"Cold compile (best of {RUNS}):  {cold * 1000:8.2f} ms")
+    print(f"Snapshot load (best of {RUNS}): {warm * 1000:8.2f} ms")
+    print(f"Speedup: {cold / warm:.1f}x")
+
+if __name__ == "__main__":
+    main()
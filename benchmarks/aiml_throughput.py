@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: messages per second through normalization and matching
+
+Compares the compiled pattern graph with the python-aiml kernel it replaced
+(when python-aiml is installed).
+"""
+import sys
+import os
+import io
+import re
+import time
+from contextlib import redirect_stdout
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiml_patterns.brain_snapshot import PATTERN_FILES
+from aiml_patterns.pattern_graph import AIMLMatcher, compile_aiml_files
+
+MESSAGES = [
+    "Hello",
+    "My name is Priya Sharma",
+    "I have 5 years of experience",
+    "I work with Python, Django and PostgreSQL",
+    "I would design the ingestion service using Kafka and a few stateless workers",
+    "I'd use caching to solve the latency problem we had in checkout",
+    "What about salary?",
+    "I prefer Vue over React for small teams",
+    "I optimized our slowest queries by adding covering indexes and batching writes",
+    "Honestly I haven't thought about that much, but I'd probably start by profiling "
+    "the hot path, then look at the database, then at the network calls between services",
+    "Thanks!"
+]
+
+DURATION = 1.0
+
+def _legacy_normalize(user_input: str) -> str:
+    """The normalization the engine applied before python-aiml"""
+    normalized = user_input.upper()
+    contractions = {
+        "I'M": "I AM", "I'VE": "I HAVE", "I'D": "I WOULD", "I'LL": "I WILL",
+        "DON'T": "DO NOT", "CAN'T": "CAN NOT", "WON'T": "WILL NOT",
+        "SHOULDN'T": "SHOULD NOT", "WOULDN'T": "WOULD NOT", "COULDN'T": "COULD NOT"
+    }
+    for contraction, expansion in contractions.items():
+        normalized = normalized.replace(contraction, expansion)
+    normalized = re.sub(r'[^\w\s]', ' ', normalized)
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+def measure(respond) -> float:
+    """Messages per second for a respond(text, session_id) callable"""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < DURATION:
+        for message in MESSAGES:
+            respond(message, "bench")
+        count += len(MESSAGES)
+    return count / (time.perf_counter() - start)
+
+def main():
+    """Run the throughput benchmark"""
+    print("⚡ AIML Throughput Benchmark")
+    print("=" * 50)
+
+    with redirect_stdout(io.StringIO()):
+        matcher = AIMLMatcher(compile_aiml_files(PATTERN_FILES))
+    graph_rate = measure(matcher.respond)
+    print(f"Compiled graph:   {graph_rate:10,.0f} msg/s")
+
+    try:
+        import aiml
+    except ImportError:
+        print("python-aiml not installed, skipping kernel comparison")
+        return
+
+    kernel = aiml.Kernel()
+    kernel.verbose(False)
+    with redirect_stdout(io.StringIO()):
+        for pattern_file in PATTERN_FILES:
+            kernel.learn(pattern_file)
+    kernel_rate = measure(lambda text, session: kernel.respond(_legacy_normalize(text), session))
+    print(f"python-aiml:      {kernel_rate:10,.0f} msg/s")
+    print(f"Speedup: {graph_rate / kernel_rate:.1f}x")
+
+if __name__ == "__main__":
+    main()
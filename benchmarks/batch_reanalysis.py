@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Answer archive re-analysis benchmark: per-answer loop vs. batch analyzer (overhead of building the frame)
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.response_analysis import make_answers
+from utils.batch_analyzer import BatchResponseAnalyzer
+from utils.session_store import SQLiteSessionStore
+from utils.skill_level_adapter import SKILL_RESPONSES_NAMESPACE, response_analyzer
+
+ARCHIVE_SIZE = 50000
+ANSWERS_PER_SESSION = 8
+CHUNK_SIZE = 5000
+RUNS = 3
+
+def build_archive(path: str) -> SQLiteSessionStore:
+    """Session store holding ARCHIVE_SIZE stored answers"""
+    store = SQLiteSessionStore(path, ttl_seconds=24 * 60 * 60)
+    answers = make_answers(1000)
+    for number in range(ARCHIVE_SIZE):
+        store.append(f"session_{number // ANSWERS_PER_SESSION}", SKILL_RESPONSES_NAMESPACE,
+                     {'response': answers[number % len(answers)], 'technology': 'python'})
+    return store
+
+def time_loop(store: SQLiteSessionStore) -> float:
+    start = time.perf_counter()
+    for chunk in store.scan_log(SKILL_RESPONSES_NAMESPACE, CHUNK_SIZE):
+        for _, entry in chunk:
+            scan = response_analyzer.scan(entry['response'])
+            response_analyzer.analyze_response(entry['response'], scan=scan)
+            response_analyzer.answer_quality(entry['response'], scan=scan)
+    return time.perf_counter() - start
+
+def time_batch(batch_analyzer: BatchResponseAnalyzer, store: SQLiteSessionStore) -> float:
+    start = time.perf_counter()
+    for _ in batch_analyzer.analyze_store(store, chunk_size=CHUNK_SIZE):
+        pass
+    return time.perf_counter() - start
+
+def main():
+    """Run the archive re-analysis benchmark"""
+    print("🧠 Answer Archive Re-analysis Benchmark")
+    print("=" * 50)
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        store = build_archive(os.path.join(temp_dir, 'sessions.db'))
+        batch_analyzer = BatchResponseAnalyzer()
+
+        loop = min(time_loop(store) for _ in range(RUNS))
+        batch = min(time_batch(batch_analyzer, store) for _ in range(RUNS))
+        store.close()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    print(f"Stored answers:                {ARCHIVE_SIZE:8d}")
+    print(f"Per-answer loop (best of {RUNS}):    {loop:8.2f} s  ({ARCHIVE_SIZE / loop:8.0f} answers/s)")
+    print(f"Batch analyzer (best of {RUNS}):     {batch:8.2f} s  ({ARCHIVE_SIZE / batch:8.0f} answers/s)")
+    print(f"Batch / loop:                  {batch / loop:8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for the question corpus: import time and memory
+
+Each run happens in a fresh interpreter. It imports the question banks and
+their consumers, then runs one typical session touching three technologies.
+Timings and heap sizes come from separate runs, since tracemalloc slows
+imports down several times over.
+"""
+import sys
+import os
+import json
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUNS = 5
+
+CHILD = r'''
+import json, sys, time, tracemalloc
+
+def rss_kb():
+    with open("/proc/self/status") as handle:
+        for line in handle:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+sys.path.insert(0, ROOT)
+import typing, enum, dataclasses, random, functools  # stdlib baseline outside the measurement
+import config  # the app imports its configuration before any question bank
+
+rss_before = rss_kb()
+if TRACE:
+    tracemalloc.start()
+start = time.perf_counter()
+from utils.question_generator import TechnicalQuestionGenerator
+from utils.industry_question_sets import industry_questions, Industry
+from knowledge_base.enhanced_knowledge import enhanced_knowledge
+import_seconds = time.perf_counter() - start
+import_bytes = tracemalloc.get_traced_memory()[0] if TRACE else 0
+
+start = time.perf_counter()
+stack = {"languages": ["Python"], "frameworks": ["Django", "React"]}
+TechnicalQuestionGenerator().generate_questions(stack, 3)
+industry_questions.get_industry_specific_questions(Industry.FINTECH, stack, 2)
+for tech in ("python", "django", "react"):
+    enhanced_knowledge.get_technology_insight(tech)
+session_seconds = time.perf_counter() - start
+session_bytes = tracemalloc.get_traced_memory()[0] if TRACE else 0
+
+print(json.dumps({
+    "import_ms": import_seconds * 1000,
+    "session_ms": session_seconds * 1000,
+    "import_kib": import_bytes / 1024,
+    "session_kib": session_bytes / 1024,
+    "rss_delta_kib": rss_kb() - rss_before,
+}))
+'''
+
+def run_once(trace: bool) -> dict:
+    """Measure one cold start in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, "-c", f"ROOT = {ROOT!r}\nTRACE = {trace}\n" + CHILD],
+        check=True, capture_output=True, text=True, cwd=ROOT
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    """Run the cold start benchmark"""
+    print("📚 Question Corpus Cold Start Benchmark")
+    print("=" * 50)
+
+    timed = [run_once(trace=False) for _ in range(RUNS)]
+    traced = run_once(trace=True)
+    best = {key: min(run[key] for run in timed) for key in ('import_ms', 'session_ms', 'rss_delta_kib')}
+    best.update(import_kib=traced['import_kib'], session_kib=traced['session_kib'])
+
+    print(f"Import time (best of {RUNS}):          {best['import_ms']:8.2f} ms")
+    print(f"Three-technology session:            {best['session_ms']:8.2f} ms")
+    print(f"Python heap after import:            {best['import_kib']:8.1f} KiB")
+    print(f"Python heap after session:           {best['session_kib']:8.1f} KiB")
+    print(f"RSS growth (import + session):       {best['rss_delta_kib']:8.0f} KiB")
+
+if __name__ == "__main__":
+    main()
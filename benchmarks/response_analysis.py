@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Technical answer analysis benchmark: cost per answer of the compiled indicator scan
+"""
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.aiml_conversation_manager import AIMLConversationManager
+from utils.skill_level_adapter import response_analyzer
+
+ANSWERS = 200
+RUNS = 5
+
+SENTENCES = [
+    "In my last project we deployed a Django service to production and I led the team through the migration.",
+    "Because the database was the bottleneck, we added indexing and caching, which improved performance a lot.",
+    "I usually use Docker and Kubernetes for deployment, with monitoring and logging wired into every service.",
+    "The trade-off was memory versus CPU time, so we weighed the pros and cons carefully with the client.",
+    "Honestly I haven't worked much with the internals, but I am comfortable reading the implementation details.",
+    "We refactored the authentication flow and debugged some nasty concurrency issues in the async workers.",
+    "It was a good example of how architecture decisions shape scalability over the long run.",
+    "I would start with a simple design, measure it under realistic load, and only then optimize the hot paths.",
+    "Our CI/CD pipeline ran the integration testing suite on every merge, so regressions were caught early.",
+    "When I mentor juniors I ask them to explain the algorithm and its complexity before writing any code."
+]
+
+def make_answers(count: int) -> list:
+    """Synthetic long technical answers, 6-14 sentences each"""
+    rng = random.Random(0)
+    return [' '.join(rng.choice(SENTENCES) for _ in range(rng.randint(6, 14))) for _ in range(count)]
+
+def time_per_answer(analyze, answers: list) -> float:
+    start = time.perf_counter()
+    for answer in answers:
+        analyze(answer)
+    return (time.perf_counter() - start) / len(answers)
+
+def main():
+    """Run the answer analysis benchmark"""
+    print("🧠 Technical Answer Analysis Benchmark")
+    print("=" * 50)
+
+    answers = make_answers(ANSWERS)
+    words = sum(len(answer.split()) for answer in answers) / len(answers)
+
+    timings = {
+        'Indicator scan': response_analyzer.scan,
+        'Skill analysis (analyze_response)': response_analyzer.analyze_response,
+        'Answer quality (manager)': lambda answer: AIMLConversationManager.analyze_response_quality(
+            None, answer, {})
+    }
+
+    print(f"Answers: {ANSWERS}, average {words:.0f} words")
+    for label, analyze in timings.items():
+        best = min(time_per_answer(analyze, answers) for _ in range(RUNS))
+        print(f"{label + ' (best of ' + str(RUNS) + '):':42s} {best * 1e6:8.1f} µs/answer")
+
+if __name__ == "__main__":
+    main()
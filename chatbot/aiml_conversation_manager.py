@@ -5,14 +5,44 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import re
+import time
+import uuid
 from enum import Enum
 from typing import Dict, List, Optional, Any
 import streamlit as st
 from utils.data_handler import CandidateDataHandler
 from utils.question_generator import TechnicalQuestionGenerator
+from utils.question_deck import DECK_NAMESPACE, QuestionDeck
+from utils.question_plans import QuestionPlanCache
+from utils.industry_question_sets import industry_questions, Industry
+from knowledge_base.analytics import knowledge_analytics
+from knowledge_base.advanced_questions import FOLLOW_UP_TECH_CATEGORIES
+from utils.tech_stack_parser import tech_stack_parser
+from utils.skill_level_adapter import response_analyzer
 from config import Config
 from aiml_patterns.aiml_engine import AIMLEngine
 
+# Session store namespaces for the candidate state and chat transcript
+APP_STATE_NAMESPACE = 'app_state'
+TRANSCRIPT_NAMESPACE = 'transcript'
+
+# Page URL query parameter holding the session token. Anyone holding the URL
+# (a shared link, browser history) can resume the session and see the
+# candidate's details and transcript, so a token is only honoured for
+# Config.SESSION_LINK_TTL_SECONDS after it was issued.
+SESSION_QUERY_PARAM = 'sid'
+
+# When the current session token was issued (epoch seconds)
+SESSION_ISSUED_KEY = '_session_issued_at'
+
+# st.session_state fields saved with the conversation state
+PERSISTED_FIELDS = ('candidate_data', 'field_index', 'generated_questions', 'questions_answered',
+                    'technical_responses')
+
+# Number of st.session_state.messages already in the stored transcript
+SAVED_MESSAGES_KEY = '_saved_messages'
+
 class ConversationState(Enum):
     """Enumeration of conversation states"""
     GREETING = "greeting"
@@ -25,10 +55,15 @@ class ConversationState(Enum):
 class AIMLConversationManager:
     """AIML-Enhanced Conversation Manager with intelligent pattern matching"""
     
-    def __init__(self):
+    def __init__(self, aiml_engine: Optional[AIMLEngine] = None,
+                 question_generator: Optional[TechnicalQuestionGenerator] = None,
+                 plan_cache: Optional[QuestionPlanCache] = None):
         self.data_handler = CandidateDataHandler()
-        self.question_generator = TechnicalQuestionGenerator()
-        self.aiml_engine = AIMLEngine()
+        # Heavy, shareable components can be injected (see chatbot/resources.py)
+        self.question_generator = question_generator or TechnicalQuestionGenerator()
+        self.plan_cache = plan_cache or QuestionPlanCache(Config.QUESTION_PLAN_CACHE_SIZE,
+                                                          question_generator=self.question_generator)
+        self.aiml_engine = aiml_engine or AIMLEngine()
         self.current_state = ConversationState.GREETING
         self.session_id = "default"
         
@@ -61,7 +96,17 @@ class AIMLConversationManager:
         self.field_index = 0
     
     def initialize_session_state(self):
-        """Initialize Streamlit session state with AIML integration"""
+        """Initialize Streamlit session state with AIML integration
+
+        A new browser session first restores the conversation stored under
+        the session token in the page URL, if any; otherwise it is issued a
+        new token.
+        """
+        if 'aiml_session_id' not in st.session_state:
+            session_id = self._linked_session_id()
+            if session_id is None or not self.restore_session_state(session_id):
+                session_id = self._new_session_id()
+            st.session_state.aiml_session_id = session_id
         if 'conversation_state' not in st.session_state:
             st.session_state.conversation_state = ConversationState.GREETING
         if 'messages' not in st.session_state:
@@ -76,11 +121,60 @@ class AIMLConversationManager:
             st.session_state.questions_answered = 0
         if 'technical_responses' not in st.session_state:
             st.session_state.technical_responses = []
-        if 'aiml_session_id' not in st.session_state:
-            st.session_state.aiml_session_id = f"session_{len(st.session_state.messages)}"
         
         self.session_id = st.session_state.aiml_session_id
     
+    @staticmethod
+    def _linked_session_id() -> Optional[str]:
+        """Session id from the page URL, so a reload, a restart or another replica finds the stored session"""
+        token = st.query_params.get(SESSION_QUERY_PARAM) or ''
+        return f"session_{token}" if re.fullmatch(r'[0-9a-f]{32}', token) else None
+    
+    @staticmethod
+    def _new_session_id() -> str:
+        """Issue a fresh session token and put it in the page URL"""
+        token = uuid.uuid4().hex
+        st.query_params[SESSION_QUERY_PARAM] = token
+        st.session_state[SESSION_ISSUED_KEY] = time.time()
+        return f"session_{token}"
+    
+    def restore_session_state(self, session_id: str) -> bool:
+        """Load a stored conversation into st.session_state; False if there is none or its link expired"""
+        store = self.aiml_engine.store
+        record = store.get(session_id, APP_STATE_NAMESPACE)
+        if record is None:
+            return False
+        if record.get('issued_at', 0) + Config.SESSION_LINK_TTL_SECONDS <= time.time():
+            store.delete(session_id)
+            return False
+        
+        st.session_state[SESSION_ISSUED_KEY] = record['issued_at']
+        st.session_state.conversation_state = ConversationState(record['conversation_state'])
+        for field in PERSISTED_FIELDS:
+            if record.get(field) is not None:
+                st.session_state[field] = record[field]
+        st.session_state.messages = store.read_log(session_id, TRANSCRIPT_NAMESPACE)
+        st.session_state[SAVED_MESSAGES_KEY] = len(st.session_state.messages)
+        return True
+    
+    def save_session_state(self):
+        """Store the conversation state and append new chat messages to the stored transcript"""
+        store = self.aiml_engine.store
+        messages = st.session_state.get('messages', [])
+        for message in messages[st.session_state.get(SAVED_MESSAGES_KEY, 0):]:
+            store.append(self.session_id, TRANSCRIPT_NAMESPACE, message)
+        st.session_state[SAVED_MESSAGES_KEY] = len(messages)
+        
+        record = {field: st.session_state.get(field) for field in PERSISTED_FIELDS}
+        record['conversation_state'] = st.session_state.conversation_state.value
+        record['issued_at'] = st.session_state.setdefault(SESSION_ISSUED_KEY, time.time())
+        store.put(self.session_id, APP_STATE_NAMESPACE, record)
+    
+    def truncate_saved_transcript(self, length: int):
+        """Cut the stored transcript back to its first length messages, e.g. when a message is edited"""
+        self.aiml_engine.store.truncate_log(self.session_id, TRANSCRIPT_NAMESPACE, length)
+        st.session_state[SAVED_MESSAGES_KEY] = min(st.session_state.get(SAVED_MESSAGES_KEY, 0), length)
+    
     def process_user_input(self, user_input: str) -> str:
         """Process user input using hybrid AIML + rule-based approach"""
         current_state = st.session_state.conversation_state
@@ -117,8 +211,7 @@ class AIMLConversationManager:
         # Don't use AIML for tech stack collection - let rule-based handle it
         if st.session_state.conversation_state == ConversationState.TECH_STACK_COLLECTION:
             # Check if this looks like a tech stack list
-            tech_indicators = ['python', 'javascript', 'java', 'react', 'django', 'flask', 'sql', 'mysql', 'postgresql', 'mongodb', 'docker', 'kubernetes', 'aws', 'azure']
-            if any(tech in user_lower for tech in tech_indicators):
+            if tech_stack_parser.parse(user_input):
                 return False  # Use rule-based handling
         
         return any(trigger in user_lower for trigger in aiml_triggers)
@@ -196,7 +289,9 @@ class AIMLConversationManager:
             tech_stack = {k: v for k, v in context.items() if k in Config.COMMON_TECHNOLOGIES.keys()}
             
             # Generate technical questions
-            questions = self.question_generator.generate_questions(tech_stack, Config.MAX_QUESTIONS_PER_TECH)
+            deck = self.load_question_deck()
+            questions = self.question_generator.generate_questions(tech_stack, Config.MAX_QUESTIONS_PER_TECH, deck)
+            self.save_question_deck(deck)
             if questions:
                 st.session_state.generated_questions = questions
                 
@@ -266,59 +361,55 @@ class AIMLConversationManager:
     
     def handle_tech_stack_collection(self, user_input: str) -> str:
         """Handle tech stack collection with AIML enhancement"""
-        # Use AIML to extract tech stack
-        aiml_result = self.aiml_engine.process_input(user_input, self.session_id)
-        context = aiml_result['context']
-        
-        # Build tech stack from AIML context
-        from config import Config
-        tech_stack = {}
-        for category in Config.COMMON_TECHNOLOGIES.keys():
-            if context.get(category):
-                tech_stack[category] = context[category]
+        # Keep the AIML session context in sync with the conversation
+        self.aiml_engine.process_input(user_input, self.session_id)
         
-        # Fallback to rule-based parsing if AIML didn't extract enough
-        if not tech_stack:
-            tech_stack = self.data_handler.parse_tech_stack(user_input)
+        # The AIML context and the rule-based parser share one parse of the input
+        tech_stack = tech_stack_parser.parse(user_input).by_category()
         
         if tech_stack:
             st.session_state.candidate_data['tech_stack'] = tech_stack
             self.data_handler.store_candidate_info('tech_stack', user_input)
             
-            # Generate technical questions with industry awareness
-            questions = self.question_generator.generate_questions(tech_stack, Config.MAX_QUESTIONS_PER_TECH)
-            
-            # Add industry-specific questions if applicable
+            # Detect industry from candidate data and conversation
+            detected_industry = Industry.GENERAL
             try:
-                from utils.industry_question_sets import industry_questions, Industry
-                
-                # Detect industry from candidate data and conversation
                 conversation_context = [msg['content'] for msg in st.session_state.messages if msg['role'] == 'user']
                 detected_industry = industry_questions.detect_industry_from_context(
                     st.session_state.candidate_data, conversation_context
                 )
-                
-                if detected_industry != Industry.GENERAL:
-                    industry_questions_dict = industry_questions.get_industry_specific_questions(
-                        detected_industry, tech_stack, 2
-                    )
-                    
-                    # Merge industry questions with general questions
-                    questions.update(industry_questions_dict)
-                    
-                    # Store industry info for later use
-                    st.session_state.detected_industry = detected_industry.value
-                
             except Exception as e:
                 print(f"Industry detection error: {e}")
             
+            # Question pools and stack analysis are shared by every candidate with this stack shape
+            plan = self.plan_cache.get(tech_stack, st.session_state.candidate_data.get('experience_years', 0),
+                                       detected_industry.value)
+            
+            # Generate technical questions with industry awareness
+            deck = self.load_question_deck()
+            questions = self.question_generator.generate_questions(
+                tech_stack, Config.MAX_QUESTIONS_PER_TECH, deck, plan.technical_pools
+            )
+            
+            # Add industry-specific questions if applicable
+            if detected_industry != Industry.GENERAL:
+                industry_questions_dict = industry_questions.get_industry_specific_questions(
+                    detected_industry, tech_stack, 2, deck, plan.industry_pools
+                )
+                
+                # Merge industry questions with general questions
+                questions.update(industry_questions_dict)
+                
+                # Store industry info for later use
+                st.session_state.detected_industry = detected_industry.value
+            
+            self.save_question_deck(deck)
+            knowledge_analytics.track_session(st.session_state.candidate_data, questions, detected_industry.value)
             st.session_state.generated_questions = questions
             st.session_state.conversation_state = ConversationState.TECHNICAL_QUESTIONS
             
             # Create a natural response for tech stack
-            from utils.candidate_scorer import CandidateScorer
-            scorer = CandidateScorer()
-            _, depth_score, tech_analysis = scorer.calculate_tech_stack_score(tech_stack)
+            depth_score, tech_analysis = plan.depth_score, plan.tech_analysis
             
             # Smart response based on tech stack quality
             if tech_analysis['modern_stack']:
@@ -399,8 +490,13 @@ Or just throw them at me in a list - whatever's easier for you!"""
         if 'technical_responses' not in st.session_state:
             st.session_state.technical_responses = []
         
+        # The question being answered is the assistant's latest message
+        question = next((message['content'] for message in reversed(st.session_state.get('messages', []))
+                         if message['role'] == 'assistant'), '')
+        
         st.session_state.technical_responses.append({
             'question_number': st.session_state.questions_answered,
+            'question': question,
             'response': user_input,
             'aiml_analysis': aiml_result,
             'timestamp': str(st.session_state.get('current_time', 'unknown'))
@@ -441,43 +537,9 @@ I had a great time chatting with you today! Is there anything you'd like to know
     
     def analyze_response_quality(self, user_input: str, aiml_result: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze response quality to determine skill level and next question difficulty"""
-        response_length = len(user_input.split())
-        
-        # Technical depth indicators
-        technical_keywords = [
-            'architecture', 'performance', 'optimization', 'scalability', 'design pattern',
-            'algorithm', 'complexity', 'memory', 'concurrency', 'async', 'threading',
-            'microservices', 'monolith', 'database', 'indexing', 'caching', 'security',
-            'authentication', 'authorization', 'encryption', 'testing', 'deployment',
-            'ci/cd', 'docker', 'kubernetes', 'cloud', 'monitoring', 'logging'
-        ]
-        
-        technical_score = sum(1 for keyword in technical_keywords if keyword in user_input.lower())
-        
-        # Experience indicators
-        experience_keywords = [
-            'production', 'project', 'team', 'built', 'implemented', 'designed',
-            'optimized', 'scaled', 'deployed', 'maintained', 'refactored',
-            'migrated', 'integrated', 'collaborated', 'led', 'mentored'
-        ]
-        
-        experience_score = sum(1 for keyword in experience_keywords if keyword in user_input.lower())
-        
-        # Determine skill level
-        if response_length > 50 and (technical_score >= 3 or experience_score >= 2):
-            skill_level = 'advanced'
-        elif response_length > 25 and (technical_score >= 1 or experience_score >= 1):
-            skill_level = 'intermediate'
-        else:
-            skill_level = 'beginner'
-        
-        return {
-            'skill_level': skill_level,
-            'technical_score': technical_score,
-            'experience_score': experience_score,
-            'response_length': response_length,
-            'confidence': aiml_result.get('confidence', 0.5)
-        }
+        quality = response_analyzer.answer_quality(user_input)
+        quality['confidence'] = aiml_result.get('confidence', 0.5)
+        return quality
     
     def generate_advanced_follow_up_response(self, aiml_result: Dict[str, Any], response_analysis: Dict[str, Any]) -> str:
         """Generate advanced follow-up response based on skill level analysis"""
@@ -505,143 +567,50 @@ I'm particularly interested in your real-world experience and problem-solving ap
     def get_advanced_question(self, skill_level: str, tech_stack: Dict[str, List[str]], question_number: int) -> Optional[Dict[str, str]]:
         """Get advanced questions based on skill level and tech stack"""
         
-        # Advanced question bank organized by technology and difficulty
-        advanced_questions = {
-            'python': {
-                'intermediate': [
-                    "How do you handle exception handling in Python? Any best practices you follow?",
-                    "Explain Python's memory management and garbage collection. Any performance issues you've encountered?",
-                    "What's your experience with Python's asyncio? When would you choose it over threading?",
-                    "How do you structure large Python applications? What design patterns do you use?"
-                ],
-                'advanced': [
-                    "Explain Python's GIL and its implications for multi-threaded applications. How do you work around it?",
-                    "How do you implement custom metaclasses in Python? Can you give a real-world example?",
-                    "Describe your approach to Python performance profiling and optimization in production systems.",
-                    "How do you handle memory leaks in long-running Python applications? What tools do you use?"
-                ]
-            },
-            'javascript': {
-                'intermediate': [
-                    "How do you handle asynchronous operations in JavaScript? Promises vs async/await?",
-                    "Explain JavaScript's event loop and how it affects performance.",
-                    "What's your approach to error handling in JavaScript applications?",
-                    "How do you manage state in complex JavaScript applications?"
-                ],
-                'advanced': [
-                    "Explain JavaScript's prototype chain and how you'd implement inheritance without classes.",
-                    "How do you optimize JavaScript performance for large-scale applications?",
-                    "Describe your approach to memory management and preventing memory leaks in JavaScript.",
-                    "How do you implement custom iterators and generators in JavaScript?"
-                ]
-            },
-            'react': {
-                'intermediate': [
-                    "How do you optimize React component performance? What techniques do you use?",
-                    "Explain React's reconciliation algorithm and how it affects rendering.",
-                    "What's your approach to state management in large React applications?",
-                    "How do you handle side effects in React? useEffect best practices?"
-                ],
-                'advanced': [
-                    "How do you implement custom React hooks for complex business logic?",
-                    "Explain React's Fiber architecture and how it improves performance.",
-                    "How do you handle React application performance at scale? Code splitting, lazy loading?",
-                    "Describe your approach to React testing strategies for complex components."
-                ]
-            },
-            'system_design': {
-                'intermediate': [
-                    "How would you design a scalable REST API that handles 10,000 requests per minute?",
-                    "Explain your approach to database design for a social media application.",
-                    "How do you implement caching strategies in web applications?",
-                    "What's your approach to handling authentication and authorization in microservices?"
-                ],
-                'advanced': [
-                    "Design a distributed system that can handle millions of concurrent users.",
-                    "How would you implement a real-time messaging system like WhatsApp?",
-                    "Explain your approach to data consistency in distributed databases.",
-                    "How do you design fault-tolerant systems? Circuit breakers, retries, fallbacks?"
-                ]
-            },
-            'databases': {
-                'intermediate': [
-                    "How do you optimize slow database queries? What tools and techniques do you use?",
-                    "Explain ACID properties and how they affect database design decisions.",
-                    "What's your approach to database migrations in production systems?",
-                    "How do you handle database scaling? Vertical vs horizontal scaling?"
-                ],
-                'advanced': [
-                    "How do you implement database sharding strategies for high-traffic applications?",
-                    "Explain your approach to handling eventual consistency in distributed databases.",
-                    "How do you design database schemas for time-series data at scale?",
-                    "Describe your strategy for database disaster recovery and backup systems."
-                ]
-            },
-            'devops': {
-                'intermediate': [
-                    "How do you structure Docker containers for production applications?",
-                    "Explain your CI/CD pipeline design and deployment strategies.",
-                    "What's your approach to monitoring and logging in production systems?",
-                    "How do you handle secrets management in containerized applications?"
-                ],
-                'advanced': [
-                    "How do you implement blue-green deployments with zero downtime?",
-                    "Explain your approach to Kubernetes cluster management and scaling strategies.",
-                    "How do you design infrastructure as code for multi-environment deployments?",
-                    "Describe your strategy for handling security vulnerabilities in production systems."
-                ]
-            }
-        }
-        
-        # Determine which category to ask about based on tech stack
-        available_categories = []
-        
-        # Map tech stack to question categories
+        # Map tech stack to question categories (ordered, so rotation is stable)
+        available_categories = {}
         for category, technologies in tech_stack.items():
-            if not technologies:
-                continue
-                
-            for tech in technologies:
-                tech_lower = tech.lower()
-                if tech_lower in ['python', 'django', 'flask', 'fastapi']:
-                    available_categories.append('python')
-                elif tech_lower in ['javascript', 'typescript', 'node.js', 'nodejs']:
-                    available_categories.append('javascript')
-                elif tech_lower in ['react', 'vue', 'angular']:
-                    available_categories.append('react')
-                elif tech_lower in ['postgresql', 'mysql', 'mongodb', 'redis']:
-                    available_categories.append('databases')
-                elif tech_lower in ['docker', 'kubernetes', 'jenkins', 'aws', 'azure']:
-                    available_categories.append('devops')
+            for tech in technologies or []:
+                question_category = FOLLOW_UP_TECH_CATEGORIES.get(tech.lower())
+                if question_category:
+                    available_categories[question_category] = True
         
         # Always include system design for intermediate+ candidates
         if skill_level in ['intermediate', 'advanced']:
-            available_categories.append('system_design')
+            available_categories['system_design'] = True
         
-        # Remove duplicates and select category
-        available_categories = list(set(available_categories))
+        available_categories = list(available_categories)
         
         if not available_categories:
             return None
         
-        # Rotate through categories to ensure variety
-        category = available_categories[question_number % len(available_categories)]
-        
         # Select appropriate difficulty level
         difficulty = skill_level if skill_level in ['intermediate', 'advanced'] else 'intermediate'
         
-        if category in advanced_questions and difficulty in advanced_questions[category]:
-            questions = advanced_questions[category][difficulty]
-            question = questions[question_number % len(questions)]
-            
-            return {
-                'category': category.replace('_', ' ').title(),
-                'question': question,
-                'difficulty': difficulty
-            }
+        # Rotate through categories to ensure variety, skipping any already used up
+        deck = self.load_question_deck()
+        start = question_number % len(available_categories)
+        for category in available_categories[start:] + available_categories[:start]:
+            drawn = deck.draw_texts(1, bank='follow_up', technology=category, difficulty=difficulty)
+            if drawn:
+                self.save_question_deck(deck)
+                return {
+                    'category': category.replace('_', ' ').title(),
+                    'question': drawn[0],
+                    'difficulty': difficulty
+                }
         
         return None
     
+    def load_question_deck(self) -> QuestionDeck:
+        """This session's question deck, kept with the rest of its state in the session store"""
+        state = self.aiml_engine.store.get(self.session_id, DECK_NAMESPACE)
+        return QuestionDeck.from_state(state, self.question_generator.store)
+    
+    def save_question_deck(self, deck: QuestionDeck):
+        """Persist the deck so later turns never repeat a question"""
+        self.aiml_engine.store.put(self.session_id, DECK_NAMESPACE, deck.to_state())
+    
     def create_contextual_follow_up_aiml(self, feedback: str, aiml_result: Dict[str, Any]) -> str:
         """Create contextual follow-up using AIML analysis"""
         context = aiml_result.get('context', {})
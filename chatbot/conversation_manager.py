@@ -191,8 +191,7 @@ class ConversationManager:
             st.session_state.conversation_state = ConversationState.TECHNICAL_QUESTIONS
             
             # Smart response based on tech stack quality
-            from utils.candidate_scorer import CandidateScorer
-            scorer = CandidateScorer()
+            from utils.candidate_scorer import candidate_scorer as scorer
             _, depth_score, tech_analysis = scorer.calculate_tech_stack_score(tech_stack)
             
             if tech_analysis['modern_stack']:
@@ -0,0 +1,259 @@
+"""
+Asynchronous LLM gateway
+
+All chat completions go through one AsyncOpenAI client running on a
+dedicated event loop thread, so the HTTP connection pool is shared by every
+Streamlit session in the process. The Streamlit script thread only waits up
+to a per-call deadline; if the model has not answered by then the caller
+gets None and falls back to its rule-based response. Identical prompts that
+are already in flight share a single request, and late results still land
+in the response cache for the next caller.
+
+stream() yields tokens as they arrive so the chat view can render the
+reply incrementally; the deadline then applies to the first token and to
+each gap between tokens rather than to the whole completion.
+"""
+import asyncio
+import concurrent.futures
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from openai import AsyncOpenAI
+
+from chatbot.response_cache import ResponseCache, make_cache_key
+
+
+# Marks the end of a streamed completion
+_STREAM_END = object()
+
+
+class Completion(NamedTuple):
+    """Completion text with the usage and latency of the request that produced it"""
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_seconds: float = 0.0
+    cached: bool = False
+
+
+class LLMGateway:
+    """Coalescing, deadline-bounded access to the chat completions API"""
+
+    def __init__(self, api_key: str, model: str, base_url: Optional[str] = None,
+                 timeout: float = 4.0, cache: Optional[ResponseCache] = None):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cache = cache
+        self._client = None
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats = {'requests': 0, 'coalesced': 0, 'cache_hits': 0, 'timeouts': 0, 'errors': 0}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use"""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=loop.run_forever, name="llm-gateway", daemon=True)
+                self._thread.start()
+                self._loop = loop
+        return self._loop
+
+    def _get_client(self) -> AsyncOpenAI:
+        # Created on the loop thread so its connection pool belongs to that loop
+        if self._client is None:
+            self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url,
+                                       max_retries=0, timeout=self.timeout)
+        return self._client
+
+    async def _fetch(self, key: str, messages: List[Dict[str, str]], max_tokens: int,
+                     temperature: float, cache_result: bool) -> Completion:
+        try:
+            self._stats['requests'] += 1
+            start = time.perf_counter()
+            response = await self._get_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            content = (response.choices[0].message.content or "").strip()
+            if content and cache_result and self.cache is not None:
+                self.cache.set(key, content)
+            usage = response.usage
+            return Completion(
+                text=content,
+                prompt_tokens=usage.prompt_tokens if usage else 0,
+                completion_tokens=usage.completion_tokens if usage else 0,
+                latency_seconds=time.perf_counter() - start
+            )
+        finally:
+            self._inflight.pop(key, None)
+
+    async def acomplete(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+                        timeout: Optional[float] = None, use_cache: bool = True) -> Optional[str]:
+        """Return the completion text, or None if it failed or missed the deadline"""
+        completion = await self.acomplete_detailed(messages, max_tokens, temperature, timeout, use_cache)
+        return completion.text if completion is not None else None
+
+    async def acomplete_detailed(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+                                 timeout: Optional[float] = None, use_cache: bool = True) -> Optional[Completion]:
+        """Like acomplete, but also report token usage and latency"""
+        key = make_cache_key(self.model, messages, temperature, max_tokens)
+        if use_cache and self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._stats['cache_hits'] += 1
+                return Completion(text=cached, cached=True)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, messages, max_tokens, temperature, use_cache))
+            # Retrieve the outcome even if every waiter gave up, to avoid unhandled-exception noise
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._inflight[key] = task
+        else:
+            self._stats['coalesced'] += 1
+
+        try:
+            # Shield so one caller's deadline does not cancel the shared request
+            return await asyncio.wait_for(asyncio.shield(task), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self._stats['timeouts'] += 1
+            return None
+        except Exception as e:
+            self._stats['errors'] += 1
+            print(f"⚠️ LLM request failed: {e}")
+            return None
+
+    def complete(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+                 timeout: Optional[float] = None, use_cache: bool = True) -> Optional[str]:
+        """Blocking facade for the Streamlit script thread"""
+        timeout = timeout or self.timeout
+        future = asyncio.run_coroutine_threadsafe(
+            self.acomplete(messages, max_tokens, temperature, timeout, use_cache),
+            self._ensure_loop()
+        )
+        try:
+            # acomplete enforces the deadline itself; the margin only covers scheduling
+            return future.result(timeout + 1.0)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self._stats['timeouts'] += 1
+            return None
+
+    def complete_many(self, requests: List[Dict[str, Any]], max_concurrency: int = 4,
+                      timeout: Optional[float] = None) -> List[Optional[Completion]]:
+        """Run several completions concurrently, at most max_concurrency at a time
+
+        Each request is a dict of acomplete_detailed keyword arguments
+        (messages, max_tokens, temperature). Results come back in order, with
+        None for requests that failed or missed their deadline.
+        """
+        timeout = timeout or self.timeout
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run_one(request):
+                async with semaphore:
+                    return await self.acomplete_detailed(timeout=timeout, **request)
+
+            return await asyncio.gather(*(run_one(request) for request in requests))
+
+        future = asyncio.run_coroutine_threadsafe(run_all(), self._ensure_loop())
+        # Every request has its own deadline; waves of max_concurrency bound the total
+        waves = -(-len(requests) // max_concurrency) if requests else 0
+        try:
+            return future.result(timeout * waves + 1.0)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            self._stats['timeouts'] += 1
+            return [None] * len(requests)
+
+    async def _produce_stream(self, key: str, messages: List[Dict[str, str]], max_tokens: int,
+                              temperature: float, tokens: queue.Queue):
+        try:
+            self._stats['requests'] += 1
+            response = await self._get_client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+            parts = []
+            async for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    tokens.put(delta)
+
+            content = "".join(parts).strip()
+            if content and self.cache is not None:
+                self.cache.set(key, content)
+            tokens.put(_STREAM_END)
+        except Exception as e:
+            tokens.put(e)
+
+    def stream(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+               timeout: Optional[float] = None) -> Iterator[str]:
+        """Yield completion text incrementally (blocking generator)
+
+        Raises TimeoutError if no token arrives within the deadline, or the
+        underlying error if the request fails. A cached completion is
+        yielded in one piece.
+        """
+        timeout = timeout or self.timeout
+        key = make_cache_key(self.model, messages, temperature, max_tokens)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._stats['cache_hits'] += 1
+                yield cached
+                return
+
+        tokens: queue.Queue = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(
+            self._produce_stream(key, messages, max_tokens, temperature, tokens),
+            self._ensure_loop()
+        )
+        try:
+            while True:
+                try:
+                    item = tokens.get(timeout=timeout)
+                except queue.Empty:
+                    self._stats['timeouts'] += 1
+                    raise TimeoutError("LLM stream stalled")
+                if item is _STREAM_END:
+                    return
+                if isinstance(item, Exception):
+                    self._stats['errors'] += 1
+                    raise item
+                yield item
+        finally:
+            # Stop the request if the reader gave up early
+            future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, coalescing and timeout counters"""
+        stats = dict(self._stats)
+        stats['inflight'] = len(self._inflight)
+        return stats
+
+    def close(self):
+        """Stop the event loop thread"""
+        if self._loop is not None:
+            if self._client is not None:
+                asyncio.run_coroutine_threadsafe(self._client.close(), self._loop).result(5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+            self._loop.close()
+            self._loop = None
+            self._client = None
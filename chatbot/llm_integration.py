@@ -1,9 +1,14 @@
 """
 LLM integration for enhanced conversation handling
 """
-import openai
-from typing import Optional, Dict, Any
+import json
+import re
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Iterator, List
 from config import Config
+from chatbot.llm_gateway import LLMGateway
+from chatbot.response_cache import ResponseCache
 import streamlit as st
 
 class LLMIntegration:
@@ -11,14 +16,26 @@ class LLMIntegration:
     
     def __init__(self):
         self.client = None
+        self.response_cache = ResponseCache(
+            max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+            ttl_seconds=Config.LLM_CACHE_TTL_SECONDS,
+            db_path=Config.LLM_CACHE_DB
+        )
+        # Token and latency figures for recent batch analyses
+        self.batch_metrics = deque(maxlen=100)
         self.initialize_client()
     
     def initialize_client(self):
-        """Initialize OpenAI client"""
+        """Initialize the asynchronous LLM gateway"""
         try:
             if Config.OPENAI_API_KEY:
-                openai.api_key = Config.OPENAI_API_KEY
-                self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+                self.client = LLMGateway(
+                    api_key=Config.OPENAI_API_KEY,
+                    model=Config.OPENAI_MODEL,
+                    base_url=Config.OPENAI_BASE_URL,
+                    timeout=Config.LLM_TIMEOUT_SECONDS,
+                    cache=self.response_cache
+                )
             else:
                 st.warning("⚠️ OpenAI API key not found. Using fallback responses.")
         except Exception as e:
@@ -30,13 +47,6 @@ class LLMIntegration:
         if not self.client:
             return base_response
         
-        # Cache key for this response type
-        cache_key = f"{context.get('state', 'unknown')}_{len(base_response)}"
-        
-        # Use cached response if available
-        if hasattr(self, '_response_cache') and cache_key in self._response_cache:
-            return self._response_cache[cache_key]
-        
         try:
             # Only enhance important responses
             important_states = ['tech_stack_collection', 'technical_questions', 'completed']
@@ -45,8 +55,7 @@ class LLMIntegration:
             
             prompt = self._create_enhancement_prompt(base_response, context)
             
-            response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
+            enhanced_response = self.client.complete(
                 messages=[
                     {"role": "system", "content": self._get_system_prompt()},
                     {"role": "user", "content": prompt}
@@ -55,13 +64,6 @@ class LLMIntegration:
                 temperature=0.7
             )
             
-            enhanced_response = response.choices[0].message.content.strip()
-            
-            # Cache the response
-            if not hasattr(self, '_response_cache'):
-                self._response_cache = {}
-            self._response_cache[cache_key] = enhanced_response
-            
             return enhanced_response if enhanced_response else base_response
             
         except Exception as e:
@@ -94,6 +96,36 @@ class LLMIntegration:
             return base_response  # Fail silently for speed
         """
     
+    def stream_enhanced_response(self, base_response: str, context: Dict[str, Any]) -> Iterator[str]:
+        """Yield an enhanced response token by token
+        
+        Falls back to the base response if the model does not start answering
+        in time; if the stream stalls part way, the text so far is kept.
+        """
+        important_states = ['tech_stack_collection', 'technical_questions', 'completed']
+        if not self.client or context.get('state') not in important_states:
+            yield base_response
+            return
+        
+        prompt = self._create_enhancement_prompt(base_response, context)
+        streamed = False
+        try:
+            for token in self.client.stream(
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=250,
+                temperature=0.7
+            ):
+                streamed = True
+                yield token
+        except Exception as e:
+            print(f"⚠️ LLM streaming stopped: {e}")
+        
+        if not streamed:
+            yield base_response
+    
     def generate_follow_up_question(self, candidate_data: Dict[str, Any]) -> Optional[str]:
         """Generate intelligent follow-up questions"""
         if not self.client:
@@ -102,18 +134,17 @@ class LLMIntegration:
         try:
             prompt = self._create_follow_up_prompt(candidate_data)
             
-            response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
+            # Follow-ups are not cached so repeat candidates still get variety
+            return self.client.complete(
                 messages=[
                     {"role": "system", "content": self._get_system_prompt()},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=150,
-                temperature=0.8
+                temperature=0.8,
+                use_cache=False
             )
             
-            return response.choices[0].message.content.strip()
-            
         except Exception as e:
             st.error(f"Error generating follow-up: {str(e)}")
             return None
@@ -124,7 +155,93 @@ class LLMIntegration:
             return {"score": "N/A", "feedback": "LLM analysis not available"}
         
         try:
-            prompt = f"""
+            prompt = self._create_analysis_prompt(question, answer)
+            
+            analysis = self.client.complete(
+                messages=[
+                    {"role": "system", "content": "You are a technical interviewer analyzing candidate responses."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=200,
+                temperature=0.3
+            )
+            if analysis is None:
+                return {"score": "N/A", "feedback": "LLM analysis timed out"}
+            return {"analysis": analysis}
+            
+        except Exception as e:
+            return {"error": f"Analysis error: {str(e)}"}
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Expose response cache and gateway counters for monitoring"""
+        stats = {'cache': self.response_cache.stats()}
+        if self.client:
+            stats['gateway'] = self.client.stats()
+        return stats
+    
+    def analyze_technical_responses(self, qa_pairs: List[Dict[str, str]], batch_size: int = 8,
+                                    max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Analyze many question/answer pairs with as few round trips as possible
+        
+        Pairs are packed batch_size at a time into one structured (JSON) request.
+        If the model's reply for a batch cannot be parsed, that batch is
+        re-run as individual requests with bounded concurrency. Returns one
+        result per pair, in order, shaped like analyze_technical_response().
+        """
+        if not self.client:
+            return [{"score": "N/A", "feedback": "LLM analysis not available"} for _ in qa_pairs]
+        
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(qa_pairs), batch_size):
+            batch = qa_pairs[start:start + batch_size]
+            started = time.perf_counter()
+            completion = self.client.complete_many([{
+                'messages': [
+                    {"role": "system", "content": "You are a technical interviewer analyzing candidate responses."},
+                    {"role": "user", "content": self._create_batch_analysis_prompt(batch)}
+                ],
+                'max_tokens': min(200 * len(batch), 1600),
+                'temperature': 0.3
+            }], timeout=Config.LLM_TIMEOUT_SECONDS * 2)[0]
+            
+            analyses = self._parse_batch_analysis(completion.text, len(batch)) if completion else None
+            completions = [completion]
+            mode = 'structured'
+            if analyses is None:
+                # Fall back to one request per answer, run concurrently
+                mode = 'concurrent'
+                fallback = self.client.complete_many([{
+                    'messages': [
+                        {"role": "system", "content": "You are a technical interviewer analyzing candidate responses."},
+                        {"role": "user", "content": self._create_analysis_prompt(pair['question'], pair['answer'])}
+                    ],
+                    'max_tokens': 200,
+                    'temperature': 0.3
+                } for pair in batch], max_concurrency=max_concurrency)
+                analyses = [item.text if item else None for item in fallback]
+                completions += fallback
+            
+            for analysis in analyses:
+                if analysis:
+                    results.append({"analysis": analysis})
+                else:
+                    results.append({"score": "N/A", "feedback": "LLM analysis timed out"})
+            
+            answered = [item for item in completions if item is not None]
+            self.batch_metrics.append({
+                'mode': mode,
+                'pairs': len(batch),
+                'requests': len(completions),
+                'prompt_tokens': sum(item.prompt_tokens for item in answered),
+                'completion_tokens': sum(item.completion_tokens for item in answered),
+                'latency_seconds': round(time.perf_counter() - started, 3)
+            })
+        
+        return results
+    
+    def _create_analysis_prompt(self, question: str, answer: str) -> str:
+        """Create prompt for analyzing a single technical response"""
+        return f"""
             Analyze this technical interview response:
             
             Question: {question}
@@ -138,22 +255,40 @@ class LLMIntegration:
             
             Keep the response concise and professional.
             """
-            
-            response = self.client.chat.completions.create(
-                model=Config.OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a technical interviewer analyzing candidate responses."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.3
-            )
-            
-            analysis = response.choices[0].message.content.strip()
-            return {"analysis": analysis}
-            
-        except Exception as e:
-            return {"error": f"Analysis error: {str(e)}"}
+    
+    def _create_batch_analysis_prompt(self, qa_pairs: List[Dict[str, str]]) -> str:
+        """Create prompt for analyzing several technical responses in one request"""
+        numbered = "\n\n".join(
+            f"{index}. Question: {pair['question']}\n   Answer: {pair['answer']}"
+            for index, pair in enumerate(qa_pairs, 1)
+        )
+        return f"""
+        Analyze each of these technical interview responses:
+        
+        {numbered}
+        
+        For each response provide a brief analysis including technical accuracy (if determinable),
+        completeness, communication clarity and an overall assessment. Keep each analysis concise
+        and professional.
+        
+        Reply with JSON only, in the form {{"analyses": [{{"index": 1, "analysis": "..."}}]}},
+        with exactly one entry per response.
+        """
+    
+    def _parse_batch_analysis(self, text: str, expected: int) -> Optional[List[str]]:
+        """Pull per-answer analyses out of a batch reply, or None if it is unusable"""
+        if not text:
+            return None
+        # Models sometimes wrap JSON in a code fence
+        text = re.sub(r'^```(?:json)?\s*|\s*```$', '', text.strip())
+        try:
+            entries = json.loads(text).get('analyses', [])
+            by_index = {int(entry['index']): str(entry['analysis']).strip() for entry in entries}
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return None
+        
+        analyses = [by_index.get(index) for index in range(1, expected + 1)]
+        return analyses if all(analyses) else None
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for the LLM"""
@@ -0,0 +1,92 @@
+"""
+Resource lifetime management for the Streamlit application
+
+Streamlit re-executes the whole script on every interaction, so anything
+built in TalentScoutApp.__init__ is rebuilt on every keystroke. Objects are
+split into three tiers so each is built exactly as often as it needs to be:
+
+- Shared: immutable or session-keyed resources built once per process
+  (AIML brain, question banks, question plans, LLM client). The tech index and other
+  module-level global instances already live at this tier.
+- Session: per-candidate mutable state kept in st.session_state and saved
+  to the session store under the session token in the page URL, so a
+  conversation survives reloads, restarts and replicas (see
+  AIMLConversationManager.initialize_session_state).
+- Request: scratch values that only live for a single script run.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Any, Dict
+import streamlit as st
+
+SESSION_MANAGER_KEY = '_conversation_manager'
+REQUEST_SCRATCH_KEY = '_request_scratch'
+
+# Shared tier ---------------------------------------------------------------
+
+@st.cache_resource(show_spinner=False)
+def get_aiml_engine():
+    """Process-wide AIML engine; conversations are isolated by session id"""
+    from aiml_patterns.aiml_engine import AIMLEngine
+    return AIMLEngine()
+
+@st.cache_resource(show_spinner=False)
+def get_question_generator():
+    """Process-wide technical question bank"""
+    from utils.question_generator import TechnicalQuestionGenerator
+    return TechnicalQuestionGenerator()
+
+@st.cache_resource(show_spinner=False)
+def get_question_plan_cache():
+    """Process-wide question plans, warmed from an analytics export (QUESTION_PLAN_WARM_FILE) if set"""
+    from config import Config
+    from utils.question_plans import QuestionPlanCache
+    plan_cache = QuestionPlanCache(Config.QUESTION_PLAN_CACHE_SIZE, question_generator=get_question_generator())
+    if Config.QUESTION_PLAN_WARM_FILE:
+        plan_cache.warm_from_file(Config.QUESTION_PLAN_WARM_FILE)
+    return plan_cache
+
+@st.cache_resource(show_spinner=False)
+def get_llm_integration():
+    """Process-wide LLM client and its response cache"""
+    from chatbot.llm_integration import LLMIntegration
+    return LLMIntegration()
+
+# Session tier --------------------------------------------------------------
+
+def get_conversation_manager():
+    """Conversation manager for the current browser session
+
+    The manager owns per-candidate state (data handler, session id) and is
+    wired to the shared engine and question bank instead of building its own.
+    """
+    if SESSION_MANAGER_KEY not in st.session_state:
+        from chatbot.aiml_conversation_manager import AIMLConversationManager
+        st.session_state[SESSION_MANAGER_KEY] = AIMLConversationManager(
+            aiml_engine=get_aiml_engine(),
+            question_generator=get_question_generator(),
+            plan_cache=get_question_plan_cache()
+        )
+    return st.session_state[SESSION_MANAGER_KEY]
+
+def reset_session_resources():
+    """Drop session-tier objects so the next run starts from a clean slate"""
+    manager = st.session_state.get(SESSION_MANAGER_KEY)
+    if manager is not None:
+        manager.aiml_engine.reset_session(manager.session_id)
+        del st.session_state[SESSION_MANAGER_KEY]
+
+# Request tier --------------------------------------------------------------
+
+def begin_request() -> Dict[str, Any]:
+    """Start a fresh scratch space for the current script run"""
+    st.session_state[REQUEST_SCRATCH_KEY] = {}
+    return st.session_state[REQUEST_SCRATCH_KEY]
+
+def request_scratch() -> Dict[str, Any]:
+    """Scratch space for values computed at most once per script run"""
+    if REQUEST_SCRATCH_KEY not in st.session_state:
+        return begin_request()
+    return st.session_state[REQUEST_SCRATCH_KEY]
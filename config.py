@@ -13,7 +13,33 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL')  # Point at a local stub server for tests
+    LLM_TIMEOUT_SECONDS = float(os.getenv('LLM_TIMEOUT_SECONDS', '4.0'))  # Per-call deadline before falling back
     
+    # LLM Response Cache
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '512'))
+    LLM_CACHE_TTL_SECONDS = int(os.getenv('LLM_CACHE_TTL_SECONDS', str(24 * 60 * 60)))
+    LLM_CACHE_DB = os.getenv('LLM_CACHE_DB')  # Optional SQLite file so warm entries survive restarts
+    
+    # Session Store
+    SESSION_STORE_DB = os.getenv('SESSION_STORE_DB')  # SQLite file shared by replicas; in-memory LRU when unset
+    SESSION_TTL_SECONDS = int(os.getenv('SESSION_TTL_SECONDS', str(2 * 60 * 60)))  # Evict abandoned sessions
+    SESSION_MAX_ENTRIES = int(os.getenv('SESSION_MAX_ENTRIES', '1000'))
+    SESSION_LINK_TTL_SECONDS = int(os.getenv('SESSION_LINK_TTL_SECONDS', str(24 * 60 * 60)))  # Max age of a ?sid= session link
+    
+    # Market Data
+    MARKET_DATA_URL = os.getenv('MARKET_DATA_URL')  # Market data API; built-in reference figures when unset
+    MARKET_DATA_TIMEOUT_SECONDS = float(os.getenv('MARKET_DATA_TIMEOUT_SECONDS', '1.5'))  # Deadline for a whole stack
+    MARKET_DATA_MAX_WORKERS = int(os.getenv('MARKET_DATA_MAX_WORKERS', '16'))  # Concurrent requests (and pooled connections)
+    MARKET_SNAPSHOT_CHECK_SECONDS = float(os.getenv('MARKET_SNAPSHOT_CHECK_SECONDS', '300'))  # How often the API is asked for its snapshot
+    MARKET_ANALYSIS_MEMO_SIZE = int(os.getenv('MARKET_ANALYSIS_MEMO_SIZE', '256'))  # Comprehensive analyses kept per snapshot
+    MARKET_CACHE_MAX_ENTRIES = int(os.getenv('MARKET_CACHE_MAX_ENTRIES', '2048'))
+    MARKET_CACHE_FRESH_SECONDS = int(os.getenv('MARKET_CACHE_FRESH_SECONDS', str(6 * 60 * 60)))
+    MARKET_CACHE_STALE_SECONDS = int(os.getenv('MARKET_CACHE_STALE_SECONDS', str(7 * 24 * 60 * 60)))  # Served while refreshing
+    MARKET_CACHE_NEGATIVE_SECONDS = int(os.getenv('MARKET_CACHE_NEGATIVE_SECONDS', str(60 * 60)))  # Unknown technologies
+    MARKET_DATASET_DIR = os.getenv('MARKET_DATASET_DIR')  # Memory-mapped market dataset (defaults under knowledge_base/data/market/)
+    LOCATION_MEMO_SIZE = int(os.getenv('LOCATION_MEMO_SIZE', '4096'))  # Raw location inputs remembered once resolved
+
     # Application Settings
     APP_TITLE = "TalentScout Hiring Assistant"
     APP_DESCRIPTION = "AI-powered candidate screening chatbot"
@@ -27,6 +53,11 @@ class Config:
     ENABLE_LLM_ENHANCEMENT = False  # Disabled for faster responses
     MAX_TECH_STACK_ITEMS = 3  # Limit processing for speed
     CACHE_RESPONSES = True
+    AIML_BRAIN_FILE = os.getenv('AIML_BRAIN_FILE')  # Compiled AIML brain snapshot (defaults under aiml_patterns/brain/)
+    QUESTION_SHARD_CACHE_SIZE = int(os.getenv('QUESTION_SHARD_CACHE_SIZE', '8'))  # Technology shards kept loaded
+    QUESTION_PLAN_CACHE_SIZE = int(os.getenv('QUESTION_PLAN_CACHE_SIZE', '256'))  # Distinct tech-stack shapes kept
+    QUESTION_PLAN_WARM_FILE = os.getenv('QUESTION_PLAN_WARM_FILE')  # Analytics export used to pre-build plans
+    ANALYTICS_SESSION_LIMIT = int(os.getenv('ANALYTICS_SESSION_LIMIT', '1000'))  # Recent session records kept for analytics
     
     # Advanced Question Settings
     ENABLE_ADVANCED_QUESTIONS = True  # Enable advanced technical questions
@@ -65,7 +96,7 @@ class Config:
             # Backend Frameworks
             'django', 'flask', 'fastapi', 'tornado', 'pyramid', 'bottle',
             'spring', 'spring boot', 'quarkus', 'micronaut', 'play',
-            'express', 'nestjs', 'koa', 'hapi', 'meteor',
+            'nodejs', 'express', 'nestjs', 'koa', 'hapi', 'meteor',
             'laravel', 'symfony', 'codeigniter', 'cakephp', 'yii',
             'rails', 'sinatra', 'hanami',
             'asp.net', 'blazor', '.net core',
@@ -136,4 +167,21 @@ class Config:
             'rest', 'graphql', 'grpc', 'soap', 'websockets', 'sse',
             'openapi', 'swagger', 'postman', 'insomnia'
         ]
-    }
\ No newline at end of file
+    }
+    
+    # Alternative spellings that resolve to a canonical technology above
+    TECHNOLOGY_ALIASES = {
+        'node': 'nodejs', 'node.js': 'nodejs', 'node js': 'nodejs',
+        'js': 'javascript', 'ts': 'typescript', 'golang': 'go',
+        'cpp': 'c++', 'c sharp': 'c#', 'csharp': 'c#',
+        'reactjs': 'react', 'react.js': 'react', 'vuejs': 'vue', 'vue.js': 'vue',
+        'angularjs': 'angular', 'next.js': 'nextjs', 'nuxt.js': 'nuxtjs',
+        'nest.js': 'nestjs', 'express.js': 'express', 'expressjs': 'express',
+        'springboot': 'spring boot', 'ror': 'rails', 'ruby on rails': 'rails',
+        'dotnet': '.net core', '.net': '.net core',
+        'postgres': 'postgresql', 'psql': 'postgresql', 'mongo': 'mongodb',
+        'mssql': 'sql server', 'dynamodb': 'amazon dynamodb', 'elastic': 'elasticsearch',
+        'k8s': 'kubernetes', 'kafka': 'apache kafka', 'gh actions': 'github actions',
+        'amazon web services': 'aws', 'google cloud platform': 'gcp',
+        'microsoft azure': 'azure', 'vs code': 'vscode', 'visual studio code': 'vscode'
+    }
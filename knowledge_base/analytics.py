@@ -2,10 +2,12 @@
 Knowledge Base Analytics and Insights
 """
 from typing import Dict, List, Any, Tuple
-from collections import Counter
+from collections import Counter, deque
 import json
 from datetime import datetime
 
+from config import Config
+
 class KnowledgeBaseAnalytics:
     """Analytics for knowledge base usage and effectiveness"""
     
@@ -14,7 +16,8 @@ class KnowledgeBaseAnalytics:
         self.technology_frequency = Counter()
         self.industry_distribution = Counter()
         self.experience_level_distribution = Counter()
-        self.session_data = []
+        # Only the most recent sessions are kept, so memory stays flat however many candidates come through
+        self.session_data = deque(maxlen=Config.ANALYTICS_SESSION_LIMIT)
     
     def track_question_usage(self, question: str, technology: str, experience_level: str):
         """Track which questions are being used"""
@@ -22,12 +25,15 @@ class KnowledgeBaseAnalytics:
         self.technology_frequency[technology] += 1
         self.experience_level_distribution[experience_level] += 1
     
-    def track_session(self, candidate_data: Dict[str, Any], questions_generated: Dict[str, List[str]]):
+    def track_session(self, candidate_data: Dict[str, Any], questions_generated: Dict[str, List[str]],
+                      industry: str = 'general'):
         """Track complete session data"""
+        self.industry_distribution[industry] += 1
         session = {
             'timestamp': datetime.now().isoformat(),
             'experience_years': candidate_data.get('experience_years', 0),
             'tech_stack': candidate_data.get('tech_stack', {}),
+            'industry': industry,
             'desired_position': candidate_data.get('desired_position', ''),
             'questions_count': sum(len(q) for q in questions_generated.values()),
             'technologies_covered': len(questions_generated)
@@ -168,7 +174,7 @@ class KnowledgeBaseAnalytics:
             'technology_frequency': dict(self.technology_frequency),
             'industry_distribution': dict(self.industry_distribution),
             'experience_level_distribution': dict(self.experience_level_distribution),
-            'session_data': self.session_data,
+            'session_data': list(self.session_data),
             'insights_report': self.generate_insights_report()
         }
         
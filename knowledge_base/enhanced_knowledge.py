@@ -6,115 +6,12 @@ from typing import Dict, List, Any, Optional
 import json
 from datetime import datetime
 
+from utils.question_store import question_store
+
 class EnhancedKnowledgeBase:
     """Enhanced knowledge base with comprehensive technical information"""
     
     def __init__(self):
-        self.technology_insights = {
-            'python': {
-                'description': 'High-level, interpreted programming language known for readability and versatility',
-                'key_concepts': [
-                    'Object-oriented programming', 'Dynamic typing', 'Garbage collection',
-                    'List comprehensions', 'Decorators', 'Generators', 'Context managers'
-                ],
-                'common_use_cases': [
-                    'Web development', 'Data science', 'Machine learning', 'Automation',
-                    'Scientific computing', 'DevOps scripting'
-                ],
-                'frameworks': ['Django', 'Flask', 'FastAPI', 'Pyramid'],
-                'libraries': ['NumPy', 'Pandas', 'Requests', 'SQLAlchemy'],
-                'difficulty_level': 'Beginner to Advanced',
-                'market_demand': 'Very High',
-                'salary_range': '$70k - $150k+',
-                'learning_resources': [
-                    'Python.org official tutorial',
-                    'Automate the Boring Stuff with Python',
-                    'Real Python tutorials'
-                ]
-            },
-            'javascript': {
-                'description': 'Dynamic programming language essential for web development',
-                'key_concepts': [
-                    'Prototypal inheritance', 'Closures', 'Event loop', 'Promises',
-                    'Async/await', 'DOM manipulation', 'ES6+ features'
-                ],
-                'common_use_cases': [
-                    'Frontend development', 'Backend development (Node.js)',
-                    'Mobile apps', 'Desktop applications', 'Game development'
-                ],
-                'frameworks': ['React', 'Vue', 'Angular', 'Express', 'Next.js'],
-                'libraries': ['jQuery', 'Lodash', 'Axios', 'Moment.js'],
-                'difficulty_level': 'Beginner to Advanced',
-                'market_demand': 'Extremely High',
-                'salary_range': '$65k - $140k+',
-                'learning_resources': [
-                    'MDN Web Docs',
-                    'JavaScript.info',
-                    'You Don\'t Know JS book series'
-                ]
-            },
-            'react': {
-                'description': 'Popular JavaScript library for building user interfaces',
-                'key_concepts': [
-                    'Virtual DOM', 'Components', 'JSX', 'State management',
-                    'Hooks', 'Props', 'Context API', 'Lifecycle methods'
-                ],
-                'common_use_cases': [
-                    'Single-page applications', 'Progressive web apps',
-                    'Mobile apps (React Native)', 'Component libraries'
-                ],
-                'ecosystem': ['Redux', 'MobX', 'React Router', 'Material-UI', 'Styled Components'],
-                'difficulty_level': 'Intermediate',
-                'market_demand': 'Extremely High',
-                'salary_range': '$75k - $150k+',
-                'learning_resources': [
-                    'Official React documentation',
-                    'React Tutorial by Kent C. Dodds',
-                    'Scrimba React course'
-                ]
-            },
-            'django': {
-                'description': 'High-level Python web framework that encourages rapid development',
-                'key_concepts': [
-                    'MTV architecture', 'ORM', 'Admin interface', 'Middleware',
-                    'Templates', 'Forms', 'Authentication', 'Migrations'
-                ],
-                'common_use_cases': [
-                    'Web applications', 'REST APIs', 'Content management',
-                    'E-commerce platforms', 'Social networks'
-                ],
-                'ecosystem': ['Django REST Framework', 'Celery', 'Channels', 'Wagtail'],
-                'difficulty_level': 'Intermediate',
-                'market_demand': 'High',
-                'salary_range': '$80k - $140k+',
-                'learning_resources': [
-                    'Django official tutorial',
-                    'Django for Beginners book',
-                    'Two Scoops of Django'
-                ]
-            },
-            'mysql': {
-                'description': 'Popular open-source relational database management system',
-                'key_concepts': [
-                    'ACID properties', 'Indexing', 'Joins', 'Normalization',
-                    'Stored procedures', 'Triggers', 'Replication', 'Partitioning'
-                ],
-                'common_use_cases': [
-                    'Web applications', 'Data warehousing', 'E-commerce',
-                    'Content management', 'Analytics'
-                ],
-                'tools': ['MySQL Workbench', 'phpMyAdmin', 'Percona Toolkit'],
-                'difficulty_level': 'Beginner to Advanced',
-                'market_demand': 'High',
-                'salary_range': '$60k - $120k+',
-                'learning_resources': [
-                    'MySQL official documentation',
-                    'MySQL Crash Course book',
-                    'W3Schools SQL tutorial'
-                ]
-            }
-        }
-        
         self.interview_insights = {
             'question_categories': {
                 'technical_depth': 'Assess deep understanding of technologies',
@@ -157,8 +54,8 @@ class EnhancedKnowledgeBase:
     
     def get_technology_insight(self, technology: str) -> Optional[Dict[str, Any]]:
         """Get comprehensive insight about a specific technology"""
-        tech_lower = technology.lower()
-        return self.technology_insights.get(tech_lower)
+        # Insights are stored with each technology's question shard
+        return question_store.insight(technology.lower())
     
     def get_learning_path(self, tech_stack: List[str], experience_level: str) -> Dict[str, Any]:
         """Generate personalized learning path based on current tech stack"""
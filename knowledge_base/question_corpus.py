@@ -0,0 +1,162 @@
+"""
+On-disk question corpus with a byte-offset shard index
+
+The corpus is a JSON-lines file with one question (or technology insight)
+per line, grouped into contiguous shards, one per technology. A small JSON
+index next to it records each shard's byte range plus the tags of every
+question (everything except its text), encoded as small integers into
+per-tag value tables. The question store keeps the index in memory and reads
+a shard's lines only when one of its questions is needed.
+
+The index records the corpus size and modification time; only when those
+differ is the corpus checksummed, and the index rebuilt if the checksum
+changed too. Build it ahead of time (e.g. in a container build) with:
+
+    python -m knowledge_base.question_corpus
+"""
+import json
+import os
+import zlib
+from typing import Any, Dict, List
+
+# Bump whenever the index layout changes
+INDEX_FORMAT_VERSION = 1
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+CORPUS_FILE = os.path.join(DATA_DIR, "questions.jsonl")
+
+# Question tags kept in the index, in row order; the text stays on disk
+INDEX_TAGS = ('shard', 'bank', 'category', 'technology', 'difficulty', 'industry')
+
+
+def index_path(corpus_path: str) -> str:
+    return os.path.splitext(corpus_path)[0] + ".index.json"
+
+
+# CRC32 rather than hashlib: importing hashlib maps OpenSSL, several MB of RSS.
+# Keys only narrow a text lookup down, the text itself is always compared.
+def text_key(text: str) -> int:
+    """Short, stable key for finding a question by its exact text"""
+    return zlib.crc32(text.encode('utf-8'))
+
+
+def corpus_stat(corpus_path: str) -> List[int]:
+    """Size and modification time, checked before the corpus is read at all"""
+    stat = os.stat(corpus_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def corpus_hash(corpus_path: str) -> str:
+    with open(corpus_path, 'rb') as handle:
+        data = handle.read()
+    return f"{len(data)}:{zlib.crc32(data):08x}"
+
+
+def build_index(corpus_path: str) -> Dict[str, Any]:
+    """Scan the corpus once and describe its shards and question tags
+
+    Each question becomes one row: its ID, the position of each INDEX_TAGS
+    value in that tag's value table (-1 when unset), a bitmask over the
+    focus area table and its text key.
+    """
+    shards: Dict[str, List[int]] = {}
+    values: Dict[str, List[str]] = {tag: [] for tag in INDEX_TAGS + ('focus',)}
+    positions: Dict[str, Dict[str, int]] = {tag: {} for tag in values}
+    rows = []
+    checksum = 0
+    offset = 0
+    stat = corpus_stat(corpus_path)
+
+    def position(tag: str, value) -> int:
+        if value is None:
+            return -1
+        if value not in positions[tag]:
+            positions[tag][value] = len(values[tag])
+            values[tag].append(value)
+        return positions[tag][value]
+
+    with open(corpus_path, 'rb') as handle:
+        for raw_line in handle:
+            checksum = zlib.crc32(raw_line, checksum)
+            if raw_line.strip():
+                record = json.loads(raw_line)
+                shard = record['shard']
+                if shard in shards and shards[shard][0] + shards[shard][1] != offset:
+                    raise ValueError(f"Shard '{shard}' is not contiguous in {corpus_path}")
+                start, length = shards.get(shard, (offset, 0))
+                shards[shard] = [start, length + len(raw_line)]
+
+                if 'text' in record:
+                    focus_mask = 0
+                    for area in record.get('focus', []):
+                        focus_mask |= 1 << position('focus', area)
+                    rows.append([record['id']]
+                                + [position(tag, record.get(tag)) for tag in INDEX_TAGS]
+                                + [focus_mask, text_key(record['text'])])
+            offset += len(raw_line)
+
+    if [row[0] for row in sorted(rows)] != list(range(len(rows))):
+        raise ValueError(f"Question IDs in {corpus_path} must run from 0 without gaps")
+
+    return {
+        'format_version': INDEX_FORMAT_VERSION,
+        'corpus_hash': f"{offset}:{checksum:08x}",
+        'corpus_stat': stat,
+        'shards': shards,
+        'values': values,
+        'questions': sorted(rows)
+    }
+
+
+def write_index(index: Dict[str, Any], corpus_path: str):
+    """Write the index atomically next to the corpus"""
+    path = index_path(corpus_path)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(index, handle, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+def load_index(corpus_path: str = CORPUS_FILE) -> Dict[str, Any]:
+    """Load the shard index, rebuilding it if it is missing or stale"""
+    try:
+        with open(index_path(corpus_path), 'r', encoding='utf-8') as handle:
+            index = json.load(handle)
+        if index.get('format_version') == INDEX_FORMAT_VERSION:
+            stat = corpus_stat(corpus_path)
+            if index.get('corpus_stat') == stat:
+                return index
+            # Touched (e.g. by a checkout) but possibly unchanged: only now read the whole corpus
+            if index.get('corpus_hash') == corpus_hash(corpus_path):
+                index['corpus_stat'] = stat
+                try:
+                    write_index(index, corpus_path)
+                except OSError:
+                    pass
+                return index
+    except (OSError, ValueError):
+        pass
+
+    index = build_index(corpus_path)
+    try:
+        write_index(index, corpus_path)
+    except OSError as e:
+        # A read-only filesystem only costs a rescan on the next start
+        print(f"⚠️ Could not write question corpus index: {e}")
+    return index
+
+
+def read_shard(corpus_path: str, start: int, length: int) -> List[Dict[str, Any]]:
+    """Read and parse the records of one shard"""
+    with open(corpus_path, 'rb') as handle:
+        handle.seek(start)
+        data = handle.read(length)
+    return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+
+if __name__ == "__main__":
+    corpus_index = build_index(CORPUS_FILE)
+    write_index(corpus_index, CORPUS_FILE)
+    print(f"📚 Indexed {len(corpus_index['questions'])} questions in "
+          f"{len(corpus_index['shards'])} shards to {index_path(CORPUS_FILE)}")
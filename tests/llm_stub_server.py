@@ -0,0 +1,104 @@
+"""
+Local stand-in for the chat completions API used by the LLM tests
+
+Serves POST .../chat/completions with a canned completion that echoes the
+last user message (or whatever the optional reply callable returns), after
+an optional delay, and counts requests. Requests
+with "stream": true get the reply word by word as server-sent events.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class StubLLMServer:
+    """Threaded HTTP server imitating the chat completions endpoint"""
+
+    def __init__(self, delay: float = 0.0, token_delay: float = 0.0, reply=None):
+        self.delay = delay
+        self.token_delay = token_delay
+        self.reply = reply or (lambda body: f"stub reply to: {body['messages'][-1]['content']}")
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'StubLLMServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                with stub._lock:
+                    stub.request_count += 1
+                time.sleep(stub.delay)
+
+                content = stub.reply(body)
+                if body.get('stream'):
+                    self._stream(body, content)
+                    return
+
+                payload = json.dumps({
+                    'id': 'chatcmpl-stub',
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': body.get('model', 'stub'),
+                    'choices': [{
+                        'index': 0,
+                        'message': {'role': 'assistant', 'content': content},
+                        'finish_reason': 'stop'
+                    }],
+                    'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2}
+                }).encode('utf-8')
+
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up waiting (deadline tests)
+                    pass
+
+            def _stream(self, body, content):
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/event-stream')
+                    self.end_headers()
+                    words = content.split(' ')
+                    for index, word in enumerate(words):
+                        delta = word if index == 0 else ' ' + word
+                        chunk = {
+                            'id': 'chatcmpl-stub',
+                            'object': 'chat.completion.chunk',
+                            'created': int(time.time()),
+                            'model': body.get('model', 'stub'),
+                            'choices': [{'index': 0, 'delta': {'content': delta}, 'finish_reason': None}]
+                        }
+                        self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+                        self.wfile.flush()
+                        time.sleep(stub.token_delay)
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
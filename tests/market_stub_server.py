@@ -0,0 +1,82 @@
+"""
+Local stand-in for the market data API used by the market data tests
+
+Serves GET .../technologies/<name> with the built-in reference figures (404
+for unknown technologies) after an optional per-request delay, and
+GET .../snapshot with the snapshot version (set snapshot to publish a new
+one). Counts technology requests. Requests are handled on separate threads, so concurrent fetches
+overlap their delays.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from utils.market_data_integration import LocalMarketDataSource
+
+class StubMarketServer:
+    """Threaded HTTP server imitating the market data API"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.source = LocalMarketDataSource(variation=0.0)
+        self.snapshot = self.source.snapshot()
+        self.request_count = 0
+        self.snapshot_requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'StubMarketServer':
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if self.path == '/v1/snapshot':
+                    with stub._lock:
+                        stub.snapshot_requests += 1
+                    self._reply(200, {'version': stub.snapshot})
+                    return
+
+                with stub._lock:
+                    stub.request_count += 1
+                time.sleep(stub.delay)
+
+                figures = None
+                if self.path.startswith('/v1/technologies/'):
+                    figures = stub.source.fetch(unquote(self.path[len('/v1/technologies/'):]))
+                self._reply(200 if figures else 404, figures if figures else {'error': 'unknown technology'})
+
+            def _reply(self, status: int, body: dict):
+                payload = json.dumps(body).encode('utf-8')
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up waiting (deadline tests)
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
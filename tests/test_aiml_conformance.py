@@ -0,0 +1,140 @@
+"""
+Conformance tests for the compiled AIML pattern graph
+
+The expected outputs in fixtures/aiml_conformance.json were recorded from
+the python-aiml kernel that the graph replaced, fed through the engine's
+previous normalize_input(). Regenerate them (python-aiml required) with:
+
+    python tests/test_aiml_conformance.py --regenerate
+"""
+import unittest
+import sys
+import os
+import json
+import random
+import re
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiml_patterns.brain_snapshot import PATTERN_FILES
+from aiml_patterns.pattern_graph import AIMLMatcher, compile_aiml_files
+
+FIXTURE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "aiml_conformance.json")
+
+# Each conversation runs in its own session so predicates carry across turns
+CONVERSATIONS = {
+    'greetings_and_names': [
+        "Hello", "hi!", "Hey", "Hey there", "good morning", "Good afternoon!",
+        "My name is Priya Sharma", "I'm Alex", "call me Sam",
+        "jo", "ALEX", "sam", "max", "kim", "lee", "ray", "tom", "ann",
+        "bob", "sue", "dan", "liz", "ben", "amy", "bye"
+    ],
+    'experience_and_compensation': [
+        "What about salary?", "I have 1 years of experience", "I have 2 years of experience",
+        "3 years", "4 years experience", "I have 5 years of experience", "12 years",
+        "What about salary?", "how much do you pay", "What are the benefits",
+        "What is the salary range", "goodbye", "Thanks!", "thank you"
+    ],
+    'tech_and_projects': [
+        "I work with Python and Django", "I use React", "My tech stack is Go, Rust",
+        "I know Kubernetes", "I would refactor the module", "I'd use caching",
+        "I think we should shard", "I believe in testing", "I think so",
+        "I built a payment gateway", "I developed an API", "I created a CLI tool",
+        "I worked on search", "I don't know", "I am not sure"
+    ],
+    'company': [
+        "What is TalentScout?", "Tell me about the company", "What is the process",
+        "What happens next?", "What is the culture like?"
+    ],
+    'advanced': [
+        "I have experience with python", "I have experience with JavaScript",
+        "I have experience with react", "I have experience with Django",
+        "I have experience with AWS", "I have experience with Docker",
+        "I have experience with Elixir and Phoenix",
+        "I would use Redis", "I would cache results to solve latency",
+        "I would design the service using queues", "I learned Rust by building tools",
+        "I am currently learning Haskell", "I work with a team of five engineers",
+        "I prefer Vue over React", "The biggest challenge was scaling",
+        "I had to debug memory leaks", "I optimized queries by indexing",
+        "I write unit tests", "I deploy using Kubernetes", "I use Postgres database",
+        "I build REST APIs", "I handle security by using OAuth",
+        "We use agile methodology", "I work remotely",
+        "I want to become senior developer", "I want to become tech lead",
+        "I want to become full stack developer", "I want to become a CTO"
+    ],
+    'normalization': [
+        "", "   ", "?!", "asdf qwerty", "I wanna learn Go", "I'm gonna build it",
+        "I cannot say", "It's done... really?", "C++ and C# are great",
+        "I won't, can't, shouldn't!", "I'VE used it; I'D say it's fine",
+        "héllo wörld", "My   name\tis   Zoë", "I would  rather not TO SOLVE  anything"
+    ]
+}
+
+def _legacy_normalize(user_input: str) -> str:
+    """The normalization AIMLEngine applied before handing input to python-aiml"""
+    normalized = user_input.upper()
+    contractions = {
+        "I'M": "I AM", "I'VE": "I HAVE", "I'D": "I WOULD", "I'LL": "I WILL",
+        "DON'T": "DO NOT", "CAN'T": "CAN NOT", "WON'T": "WILL NOT",
+        "SHOULDN'T": "SHOULD NOT", "WOULDN'T": "WOULD NOT", "COULDN'T": "COULD NOT"
+    }
+    for contraction, expansion in contractions.items():
+        normalized = normalized.replace(contraction, expansion)
+    normalized = re.sub(r'[^\w\s]', ' ', normalized)
+    return re.sub(r'\s+', ' ', normalized).strip()
+
+def _run_conversations(respond) -> dict:
+    """Run every conversation, seeding <random> per turn"""
+    results = {}
+    for name, messages in CONVERSATIONS.items():
+        outputs = []
+        for turn, message in enumerate(messages):
+            random.seed(turn)
+            outputs.append(respond(message, name))
+        results[name] = outputs
+    return results
+
+def regenerate_fixture():
+    """Record the reference outputs from the python-aiml kernel"""
+    import aiml
+
+    kernel = aiml.Kernel()
+    kernel.verbose(False)
+    for pattern_file in PATTERN_FILES:
+        kernel.learn(pattern_file)
+
+    results = _run_conversations(lambda text, session: kernel.respond(_legacy_normalize(text), session))
+    with open(FIXTURE_FILE, 'w', encoding='utf-8') as handle:
+        json.dump({'categories': kernel.numCategories(), 'conversations': results},
+                  handle, indent=2, ensure_ascii=False)
+        handle.write("\n")
+
+class TestAIMLConformance(unittest.TestCase):
+    """Compare the compiled graph against the recorded kernel outputs"""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE_FILE, 'r', encoding='utf-8') as handle:
+            cls.expected = json.load(handle)
+        cls.graph = compile_aiml_files(PATTERN_FILES)
+
+    def test_category_count(self):
+        """Test that every category is compiled"""
+        self.assertEqual(self.graph.num_categories(), self.expected['categories'])
+
+    def test_conversations(self):
+        """Test that responses match the kernel turn by turn"""
+        matcher = AIMLMatcher(self.graph)
+        actual = _run_conversations(matcher.respond)
+
+        for name, expected_outputs in self.expected['conversations'].items():
+            for message, expected, got in zip(CONVERSATIONS[name], expected_outputs, actual[name]):
+                with self.subTest(conversation=name, message=message):
+                    self.assertEqual(got, expected)
+
+if __name__ == '__main__':
+    if '--regenerate' in sys.argv:
+        regenerate_fixture()
+    else:
+        unittest.main()
@@ -0,0 +1,83 @@
+"""
+Unit tests for bulk answer re-analysis
+"""
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.aiml_conversation_manager import AIMLConversationManager
+from utils.batch_analyzer import BatchResponseAnalyzer
+from utils.session_store import InMemorySessionStore
+from utils.skill_level_adapter import SkillLevelAdapter, response_analyzer
+
+VOCABULARY = ("i don't haven't never not familiar just started have use work in my projects usually performance "
+              "optimization design patterns pattern scalability under the hood low level contribute to mentor "
+              "basic simple learning new experience worked with used comfortable optimize architecture best "
+              "practices deep dive internals implementation details because due memory cpu algorithm complexity "
+              "trade-off pros and cons project production team client deployed scaled refactored example "
+              "caching docker ci/cd built implemented designed migrated led called the a we it, .").split()
+
+def random_answer(rng: random.Random) -> str:
+    words = [rng.choice(VOCABULARY) for _ in range(rng.randint(0, 140))]
+    return ''.join(word + rng.choice(' \n') for word in words)
+
+class TestBatchResponseAnalyzer(unittest.TestCase):
+    """Test that batch analysis matches the per-answer analyzers"""
+
+    def setUp(self):
+        self.batch_analyzer = BatchResponseAnalyzer()
+
+    def test_matches_per_answer_analysis(self):
+        """Test every field against analyze_response and analyze_response_quality"""
+        rng = random.Random(7)
+        answers = [random_answer(rng) for _ in range(300)]
+        frame = self.batch_analyzer.analyze(answers)
+
+        for position, answer in enumerate(answers):
+            expected = response_analyzer.analyze_response(answer)
+            quality = AIMLConversationManager.analyze_response_quality(None, answer, {})
+            row = frame.iloc[position]
+            with self.subTest(answer=answer):
+                self.assertEqual(row['estimated_skill_level'], expected['estimated_skill_level'].value)
+                self.assertEqual(row['confidence'], expected['confidence'])
+                self.assertEqual(row['technical_depth_score'], expected['technical_depth_score'])
+                self.assertEqual(row['experience_score'], expected['experience_score'])
+                self.assertEqual(row['response_quality'], expected['response_quality'])
+                self.assertEqual(row['key_insights'], expected['key_insights'])
+                self.assertEqual(row['suggested_follow_up_type'], expected['suggested_follow_up_type'])
+                self.assertEqual(row['answer_skill_level'], quality['skill_level'])
+                self.assertEqual(row['answer_technical_score'], quality['technical_score'])
+                self.assertEqual(row['answer_experience_score'], quality['experience_score'])
+
+    def test_empty_batch(self):
+        """Test that no answers give an empty frame"""
+        self.assertEqual(len(self.batch_analyzer.analyze([])), 0)
+
+    def test_analyze_store_in_chunks(self):
+        """Test streaming stored answers from the session store"""
+        store = InMemorySessionStore()
+        adapter = SkillLevelAdapter(store, archive_responses=True)
+        answers = ["I mentor the team and contribute to the interpreter internals",
+                   "basic stuff", "We deployed it to production because memory was tight"]
+        for number, answer in enumerate(answers):
+            adapter.process_response_and_adapt(answer, "Technical question", "python", f"s{number % 2}")
+
+        reads = store.stats()['reads']
+        frames = list(self.batch_analyzer.analyze_store(store, chunk_size=2))
+        self.assertEqual([len(frame) for frame in frames], [2, 1])
+
+        combined = sorted(
+            (row.session_id, row.estimated_skill_level, row.stored_skill_level)
+            for frame in frames for row in frame.itertuples()
+        )
+        self.assertEqual([session_id for session_id, _, _ in combined], ["s0", "s0", "s1"])
+        for _, level, stored_level in combined:
+            self.assertEqual(level, stored_level)
+        self.assertEqual(store.stats()['reads'], reads)
+
+if __name__ == '__main__':
+    unittest.main()
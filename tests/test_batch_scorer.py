@@ -0,0 +1,96 @@
+"""
+Unit tests for bulk candidate scoring
+"""
+import unittest
+import sys
+import os
+import json
+import random
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.batch_scorer import BatchCandidateScorer
+from utils.candidate_scorer import CandidateScorer
+
+POSITIONS = ['Senior Python Developer', 'Full Stack Engineer', 'Frontend Developer', 'Backend Engineer',
+             'DevOps Engineer', 'Lead Architect', 'Data Scientist', 'senior backend developer']
+TECHNOLOGIES = {
+    'languages': ['Python', 'JavaScript', 'TypeScript', 'Java', 'Go', 'PHP', 'C++', 'Kotlin', 'Elixir'],
+    'frameworks': ['React', 'Vue', 'Django', 'Flask', 'Spring', 'Angular', 'Rails', 'node'],
+    'databases': ['PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Oracle'],
+    'tools': ['Docker', 'Kubernetes', 'AWS', 'Git', 'Jenkins', 'Ansible'],
+    'devops_tools': ['docker', 'terraform']
+}
+
+def random_candidate(rng: random.Random) -> dict:
+    tech_stack = {}
+    for category in rng.sample(list(TECHNOLOGIES), rng.randint(0, len(TECHNOLOGIES))):
+        tech_stack[category] = rng.sample(TECHNOLOGIES[category], rng.randint(0, 2))
+    return {'experience_years': str(rng.randint(0, 15)), 'tech_stack': tech_stack,
+            'desired_position': rng.choice(POSITIONS)}
+
+class TestBatchCandidateScorer(unittest.TestCase):
+    """Test that batch scores match the per-candidate scorer"""
+
+    def setUp(self):
+        self.batch_scorer = BatchCandidateScorer()
+        self.scorer = CandidateScorer()
+
+    def test_matches_per_candidate_scores(self):
+        """Test component scores, totals and grades against generate_comprehensive_score"""
+        rng = random.Random(5)
+        candidates = [random_candidate(rng) for _ in range(300)]
+        scores = self.batch_scorer.score(pd.DataFrame(candidates))
+
+        for position, candidate in enumerate(candidates):
+            expected = self.scorer.generate_comprehensive_score(candidate, [])
+            row = scores.iloc[position]
+            with self.subTest(candidate=candidate):
+                for component, value in expected['scores'].items():
+                    self.assertAlmostEqual(row[component], value)
+                self.assertAlmostEqual(row['total_score'], expected['total_score'], places=9)
+                self.assertEqual(row['grade'], expected['grade'])
+                self.assertEqual(row['experience_level'], expected['experience_level'])
+                self.assertEqual(row['role_type'], expected['analysis']['role_fit']['role_type'])
+                self.assertEqual(row['full_stack'], expected['analysis']['tech_stack']['full_stack'])
+
+    def test_records_and_json_stacks(self):
+        """Test iterator input with tech stacks stored as JSON strings"""
+        records = [
+            {'experience_years': 6, 'desired_position': 'Backend Engineer',
+             'tech_stack': json.dumps({'languages': ['Python'], 'frameworks': ['Django'],
+                                       'databases': ['PostgreSQL']})},
+            {'experience_years': None, 'desired_position': None, 'tech_stack': None}
+        ]
+        scores = self.batch_scorer.score(iter(records))
+
+        self.assertEqual(list(scores['role_type']), ['backend', 'general'])
+        self.assertEqual(scores['experience'].iloc[1], 2)
+        self.assertEqual(scores['tech_depth'].iloc[1], 0)
+
+    def test_communication_column_and_rank(self):
+        """Test that a precomputed communication score is used and ranking sorts best first"""
+        frame = pd.DataFrame([
+            {'experience_years': 1, 'tech_stack': {}, 'desired_position': 'Developer', 'communication_score': 2},
+            {'experience_years': 9, 'tech_stack': {'languages': ['Go', 'Rust', 'Python']},
+             'desired_position': 'Developer', 'communication_score': 10}
+        ], index=['a', 'b'])
+        ranked = self.batch_scorer.rank(frame)
+
+        self.assertEqual(list(ranked.index), ['b', 'a'])
+        self.assertEqual(ranked.loc['a', 'communication'], 2)
+
+    def test_empty_pool(self):
+        """Test that an empty pool gives an empty frame with the output columns"""
+        scores = self.batch_scorer.score([])
+        nonempty = self.batch_scorer.score([{'experience_years': 3, 'tech_stack': {}}])
+
+        self.assertEqual(len(scores), 0)
+        self.assertEqual(list(scores.columns), list(nonempty.columns))
+        self.assertEqual(len(self.batch_scorer.rank(pd.DataFrame())), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for the compiled AIML brain snapshot
+"""
+import unittest
+import sys
+import os
+import io
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiml_patterns.brain_snapshot import (
+    PATTERN_FILES, is_snapshot_current, load_or_compile, read_manifest
+)
+from aiml_patterns.pattern_graph import AIMLMatcher
+
+class TestBrainSnapshot(unittest.TestCase):
+    """Test cases for brain snapshot loading and invalidation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.brain_path = os.path.join(self.temp_dir, "test.brn")
+        self.pattern_file = os.path.join(self.temp_dir, "patterns.aiml")
+        shutil.copy(PATTERN_FILES[0], self.pattern_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _load(self) -> tuple:
+        with redirect_stdout(io.StringIO()):
+            return load_or_compile([self.pattern_file], self.brain_path)
+
+    def test_cold_then_warm_start(self):
+        """Test that the first start compiles and the second loads the snapshot"""
+        cold_graph, cold_used = self._load()
+        warm_graph, warm_used = self._load()
+
+        self.assertFalse(cold_used)
+        self.assertTrue(warm_used)
+        self.assertEqual(warm_graph.num_categories(), cold_graph.num_categories())
+        self.assertEqual(read_manifest(self.brain_path)['categories'], cold_graph.num_categories())
+        self.assertEqual(AIMLMatcher(warm_graph).respond("my name is Ada"),
+                         AIMLMatcher(cold_graph).respond("my name is Ada"))
+
+    def test_source_change_invalidates_snapshot(self):
+        """Test that editing a pattern file forces a re-compile"""
+        self._load()
+        with open(self.pattern_file, 'a', encoding='utf-8') as handle:
+            handle.write("\n")
+
+        self.assertFalse(is_snapshot_current(self.brain_path, [self.pattern_file]))
+        _, used_snapshot = self._load()
+        self.assertFalse(used_snapshot)
+        self.assertTrue(is_snapshot_current(self.brain_path, [self.pattern_file]))
+
+    def test_corrupt_snapshot_falls_back_to_compile(self):
+        """Test that an unreadable snapshot is rebuilt from the sources"""
+        reference, _ = self._load()
+        with open(self.brain_path, 'wb') as handle:
+            handle.write(b"not a brain")
+
+        graph, used_snapshot = self._load()
+        self.assertFalse(used_snapshot)
+        self.assertEqual(graph.num_categories(), reference.num_categories())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Unit tests for the compiled candidate scoring rules
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candidate_scorer import CandidateScorer
+
+class TestCandidateScorerRules(unittest.TestCase):
+    """Test cases for CandidateScorer lookup tables"""
+
+    def setUp(self):
+        self.scorer = CandidateScorer()
+
+    def test_tier_index_is_read_only(self):
+        """Test that the compiled tier index maps technologies to tier and points"""
+        self.assertEqual(self.scorer.tier_index[('languages', 'python')], ('tier_1', 10))
+        self.assertEqual(self.scorer.tier_index[('tools', 'ansible')], ('tier_3', 5))
+        with self.assertRaises(TypeError):
+            self.scorer.tier_index[('languages', 'cobol')] = ('tier_3', 5)
+
+    def test_aliases_are_resolved(self):
+        """Test that aliases score like their canonical names"""
+        _, depth, analysis = self.scorer.calculate_tech_stack_score({'databases': ['Postgres']})
+        self.assertEqual((depth, analysis['tier_1_count']), (10, 1))
+
+        fit_score, fit = self.scorer.calculate_role_fit_score(
+            'Backend Engineer', {'frameworks': ['Node']}, 3
+        )
+        self.assertEqual(fit['tech_match_count'], 1)
+        self.assertEqual(fit_score, 8.5)
+
+    def test_recompiling_after_edits(self):
+        """Test that compile_rules picks up changed tables"""
+        self.scorer.tech_tiers['tier_3']['languages'].append('cobol')
+        self.scorer.compile_rules()
+
+        _, depth, analysis = self.scorer.calculate_tech_stack_score({'languages': ['COBOL']})
+        self.assertEqual((depth, analysis['tier_3_count']), (5, 1))
+
+if __name__ == '__main__':
+    unittest.main()
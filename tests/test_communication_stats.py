@@ -0,0 +1,70 @@
+"""
+Unit tests for running communication statistics
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candidate_scorer import CandidateScorer
+from utils.communication_stats import CommunicationStats, indicator_hits
+
+TRANSCRIPT = [
+    {'role': 'assistant', 'content': 'Hi! What should I call you?'},
+    {'role': 'user', 'content': 'Alex'},
+    {'role': 'assistant', 'content': 'Tell me about a recent project.'},
+    {'role': 'user', 'content': 'I developed a billing service in Django and tuned its database '
+                                'queries until the p99 latency dropped below fifty milliseconds'},
+    {'role': 'assistant', 'content': 'How did you approach the system design?'},
+    {'role': 'user', 'content': 'We split reads and writes, and the Architecture review signed it off quickly'}
+]
+
+class TestCommunicationStats(unittest.TestCase):
+    """Test cases for CommunicationStats"""
+
+    def test_incremental_matches_rescan(self):
+        """Test that adding messages one by one equals scoring the transcript"""
+        stats = CommunicationStats()
+        for position, message in enumerate(TRANSCRIPT, 1):
+            stats.add(message)
+            with self.subTest(messages=position):
+                self.assertEqual(stats.score(), CommunicationStats.from_messages(TRANSCRIPT[:position]).score())
+
+    def test_score_and_analysis(self):
+        """Test the score and analysis for a known transcript"""
+        score, analysis = CommunicationStats.from_messages(TRANSCRIPT).score()
+
+        self.assertEqual(analysis['detailed_responses'], 2)
+        self.assertEqual((analysis['professional_tone'], analysis['technical_depth']), (1, 1))
+        self.assertAlmostEqual(analysis['avg_response_length'], 34 / 3)
+        self.assertEqual(score, 10)
+
+    def test_insufficient_data(self):
+        """Test that short transcripts get the neutral score"""
+        stats = CommunicationStats.from_messages(TRANSCRIPT[:3])
+        self.assertEqual(stats.score(), (5, {'insufficient_data': True}))
+
+    def test_indicator_hits_are_substrings(self):
+        """Test that indicators match inside words and across overlaps"""
+        self.assertEqual(indicator_hits('Redesigned the pipeline'), (False, True))
+        self.assertEqual(indicator_hits('developedesign'), (True, True))
+        self.assertEqual(indicator_hits('nothing relevant'), (False, False))
+
+    def test_scorer_uses_running_stats(self):
+        """Test that passing running stats gives the same report as rescanning"""
+        scorer = CandidateScorer()
+        candidate = {'experience_years': '4', 'desired_position': 'Backend Engineer',
+                     'tech_stack': {'languages': ['Python'], 'frameworks': ['Django']}}
+
+        running = scorer.generate_comprehensive_score(candidate, TRANSCRIPT,
+                                                      CommunicationStats.from_messages(TRANSCRIPT))
+        rescanned = scorer.generate_comprehensive_score(candidate, TRANSCRIPT)
+
+        running.pop('timestamp')
+        rescanned.pop('timestamp')
+        self.assertEqual(running, rescanned)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -99,6 +99,16 @@ class TestCandidateDataHandler(unittest.TestCase):
         self.assertIn('Django', result['frameworks'])
         self.assertIn('React', result['frameworks'])
     
+    def test_parse_tech_stack_multi_word_and_aliases(self):
+        """Test tech stack parsing of multi-word terms and common aliases"""
+        tech_input = "Spring Boot, node.js, postgres, k8s and GitHub Actions"
+        result = self.handler.parse_tech_stack(tech_input)
+        
+        self.assertEqual(result['frameworks'], ['Spring Boot', 'Nodejs'])
+        self.assertEqual(result['databases'], ['Postgresql'])
+        self.assertIn('Kubernetes', result['devops_tools'])
+        self.assertIn('Github Actions', result['devops_tools'])
+    
     def test_store_candidate_info(self):
         """Test storing candidate information"""
         # Test valid data
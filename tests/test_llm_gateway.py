@@ -0,0 +1,142 @@
+"""
+Unit tests for the asynchronous LLM gateway against a local stub server
+"""
+import unittest
+import sys
+import os
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.llm_gateway import LLMGateway
+from chatbot.llm_integration import LLMIntegration
+from chatbot.response_cache import ResponseCache
+from tests.llm_stub_server import StubLLMServer
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+class TestLLMGateway(unittest.TestCase):
+    """Test cases for LLMGateway"""
+
+    def setUp(self):
+        self.server = StubLLMServer().start()
+        self.cache = ResponseCache()
+        self.gateway = LLMGateway(api_key="test", model="stub-model", base_url=self.server.base_url,
+                                  timeout=2.0, cache=self.cache)
+
+    def tearDown(self):
+        self.gateway.close()
+        self.server.stop()
+
+    def test_completion_is_cached(self):
+        """Test that a repeated prompt is served from the cache"""
+        first = self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0)
+        second = self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0)
+
+        self.assertEqual(first, "stub reply to: hello")
+        self.assertEqual(second, first)
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual(self.gateway.stats()['cache_hits'], 1)
+
+    def test_identical_inflight_prompts_are_coalesced(self):
+        """Test that concurrent identical prompts share one request"""
+        self.server.delay = 0.3
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(
+                lambda _: self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0, use_cache=False),
+                range(5)
+            ))
+
+        self.assertEqual(set(results), {"stub reply to: hello"})
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual(self.gateway.stats()['coalesced'], 4)
+
+    def test_deadline_falls_back_and_late_result_is_cached(self):
+        """Test that a slow model returns None by the deadline but still warms the cache"""
+        self.server.delay = 0.5
+        start = time.perf_counter()
+        result = self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0, timeout=0.1)
+
+        self.assertIsNone(result)
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(self.gateway.stats()['timeouts'], 1)
+
+        time.sleep(0.8)
+        self.assertEqual(self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0), "stub reply to: hello")
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_stream_yields_tokens_and_fills_cache(self):
+        """Test that streamed tokens add up to the full reply, which is then cached"""
+        tokens = list(self.gateway.stream(MESSAGES, max_tokens=10, temperature=0.0))
+
+        self.assertGreater(len(tokens), 1)
+        self.assertEqual("".join(tokens), "stub reply to: hello")
+        self.assertEqual(self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0), "stub reply to: hello")
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_stream_first_token_deadline(self):
+        """Test that a stream that never starts raises TimeoutError"""
+        self.server.delay = 0.5
+        with self.assertRaises(TimeoutError):
+            list(self.gateway.stream(MESSAGES, max_tokens=10, temperature=0.0, timeout=0.1))
+
+    def test_unreachable_server_returns_none(self):
+        """Test that connection errors fall back instead of raising"""
+        self.server.stop()
+        self.assertIsNone(self.gateway.complete(MESSAGES, max_tokens=10, temperature=0.0))
+        self.assertEqual(self.gateway.stats()['errors'], 1)
+        self.server = StubLLMServer().start()
+
+def batch_reply(body):
+    """Answer batch prompts with JSON and single prompts with plain text"""
+    prompt = body['messages'][-1]['content']
+    answers = re.findall(r'Answer: (.*)', prompt)
+    if 'Reply with JSON only' in prompt:
+        return json.dumps({'analyses': [
+            {'index': index, 'analysis': f"batch analysis of {answer}"}
+            for index, answer in enumerate(answers, 1)
+        ]})
+    return f"single analysis of {answers[0]}"
+
+class TestBatchAnalysis(unittest.TestCase):
+    """Test cases for LLMIntegration.analyze_technical_responses"""
+
+    def setUp(self):
+        self.server = StubLLMServer(reply=batch_reply).start()
+        self.llm = LLMIntegration()
+        self.llm.client = LLMGateway(api_key="test", model="stub-model", base_url=self.server.base_url,
+                                     timeout=2.0, cache=self.llm.response_cache)
+        self.pairs = [{'question': f"Q{index}", 'answer': f"A{index}"} for index in range(10)]
+
+    def tearDown(self):
+        self.llm.client.close()
+        self.server.stop()
+
+    def test_structured_batches(self):
+        """Test that pairs are packed into one request per batch"""
+        results = self.llm.analyze_technical_responses(self.pairs, batch_size=8)
+
+        self.assertEqual([result['analysis'] for result in results],
+                         [f"batch analysis of A{index}" for index in range(10)])
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual([metrics['pairs'] for metrics in self.llm.batch_metrics], [8, 2])
+        self.assertTrue(all(metrics['mode'] == 'structured' for metrics in self.llm.batch_metrics))
+        self.assertGreater(self.llm.batch_metrics[0]['prompt_tokens'], 0)
+
+    def test_unparseable_batch_falls_back_to_concurrent_requests(self):
+        """Test that a malformed batch reply is retried per answer"""
+        self.server.reply = lambda body: "not json" if 'Reply with JSON only' in body['messages'][-1]['content'] \
+            else batch_reply(body)
+        results = self.llm.analyze_technical_responses(self.pairs[:3])
+
+        self.assertEqual([result['analysis'] for result in results],
+                         ["single analysis of A0", "single analysis of A1", "single analysis of A2"])
+        self.assertEqual(self.llm.batch_metrics[-1]['mode'], 'concurrent')
+        self.assertEqual(self.llm.batch_metrics[-1]['requests'], 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the location index
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.location_index import LocationIndex, location_index, normalize_tokens
+from utils.market_data_integration import MarketDataProvider
+
+def resolved(text: str):
+    location_id = location_index.resolve(text)
+    if location_id is None:
+        return None
+    row = location_index.locations[location_id]
+    return row['city'], row['country']
+
+class TestLocationIndex(unittest.TestCase):
+    """Test cases for LocationIndex"""
+
+    def test_longest_name_wins(self):
+        """Test that 'New Delhi' is not read as Delhi"""
+        self.assertEqual(resolved("New Delhi"), ("New Delhi", "India"))
+        self.assertEqual(resolved("Delhi, India"), ("Delhi", "India"))
+        self.assertEqual(resolved("NYC"), ("New York", "USA"))
+
+    def test_qualifiers_pick_between_same_named_cities(self):
+        """Test region codes, region names and countries next to a city"""
+        self.assertEqual(resolved("London"), ("London", "UK"))
+        self.assertEqual(resolved("London, ON"), ("London", "Canada"))
+        self.assertEqual(location_index.locations[location_index.resolve("Portland, Maine")]['region'], "ME")
+        self.assertEqual(resolved("San Jose, Costa Rica"), ("San Jose", "Costa Rica"))
+        self.assertEqual(resolved("Seattle, Washington"), ("Seattle", "USA"))
+
+    def test_aliases_accents_and_typos(self):
+        """Test alias names, accent folding and the fuzzy fallback"""
+        self.assertEqual(resolved("Bengaluru"), ("Bangalore", "India"))
+        self.assertEqual(resolved("ZÜRICH"), ("Zurich", "Switzerland"))
+        self.assertEqual(resolved("San Fransisco"), ("San Francisco", "USA"))
+        self.assertEqual(resolved("Remote (US)"), ("Remote", "Global"))
+        self.assertIsNone(resolved("Mars"))
+        self.assertIsNone(resolved("in"))
+
+    def test_memo_is_bounded(self):
+        """Test that resolved inputs are remembered in a bounded LRU"""
+        index = LocationIndex([{'city': 'Lisbon', 'region': None, 'country': 'Portugal'}], memo_size=2)
+        for text in ("Lisbon", "Lisboa", "lisbon, portugal", "Lisbon"):
+            index.resolve(text)
+
+        stats = index.stats()
+        self.assertEqual((stats['misses'], stats['hits'], stats['memo_size']), (4, 0, 2))
+        self.assertEqual(index.resolve("Lisbon"), 0)
+        self.assertEqual(index.stats()['hits'], 1)
+
+    def test_salary_adjustment(self):
+        """Test that the provider adjusts salaries through the index"""
+        provider = MarketDataProvider()
+        self.assertEqual(provider.get_location_adjusted_salary(100000, "Bengaluru")['location'], "Bangalore")
+        unknown = provider.get_location_adjusted_salary(100000, "Atlantis")
+        self.assertEqual((unknown['country'], unknown['adjusted_salary']), ("Unknown", 100000))
+
+    def test_normalize_tokens(self):
+        """Test tokenization of punctuation and accents"""
+        self.assertEqual(normalize_tokens("St. Louis, MO"), ("st", "louis", "mo"))
+        self.assertEqual(normalize_tokens("São Paulo"), ("sao", "paulo"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Unit tests for the market data cache
+"""
+import unittest
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.market_cache import MarketDataCache
+
+class CountingLoader:
+    """Loader returning key.upper(), None for keys starting with 'x', after an optional delay"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+        self.version = 1
+
+    def __call__(self, keys):
+        self.calls.append(list(keys))
+        time.sleep(self.delay)
+        return {key: None if key.startswith('x') else f"{key.upper()}{self.version}" for key in keys}
+
+class TestMarketDataCache(unittest.TestCase):
+    """Test cases for MarketDataCache"""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.cache = MarketDataCache(max_entries=3, fresh_seconds=60, stale_seconds=600,
+                                     negative_seconds=10, clock=lambda: self.now)
+        self.loader = CountingLoader()
+
+    def test_misses_are_loaded_in_one_batch(self):
+        """Test that misses load together and later lookups are hits"""
+        self.assertEqual(self.cache.get_many(['a', 'b', 'a'], self.loader), {'a': 'A1', 'b': 'B1'})
+        self.assertEqual(self.cache.get_many(['b'], self.loader), {'b': 'B1'})
+        self.assertEqual(self.loader.calls, [['a', 'b']])
+        self.assertEqual((self.cache.stats()['misses'], self.cache.stats()['hits']), (2, 1))
+
+    def test_stale_entries_are_served_while_refreshing(self):
+        """Test stale-while-revalidate with one background refresh"""
+        self.cache.get_many(['a'], self.loader)
+        self.loader.version = 2
+        self.now += 120
+
+        self.assertEqual(self.cache.get_many(['a'], self.loader), {'a': 'A1'})
+        deadline = time.time() + 1.0
+        while self.cache.stats()['inflight'] and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.cache.get_many(['a'], self.loader), {'a': 'A2'})
+        self.assertEqual(self.cache.stats()['stale_hits'], 1)
+        self.assertEqual(self.cache.stats()['refreshes'], 1)
+
+        self.now += 1000
+        self.loader.version = 3
+        self.assertEqual(self.cache.get_many(['a'], self.loader), {'a': 'A3'})
+
+    def test_entries_of_another_version_are_refreshed(self):
+        """Test that a new data version serves old entries while reloading them under the new one"""
+        self.cache.get_many(['a', 'b'], self.loader, version='v1')
+        self.loader.version = 2
+
+        self.assertEqual(self.cache.get_many(['a', 'b'], self.loader, version='v2'), {'a': 'A1', 'b': 'B1'})
+        self.assertFalse(self.cache.holds(['a', 'b'], version='v2'))
+        deadline = time.time() + 1.0
+        while self.cache.stats()['inflight'] and time.time() < deadline:
+            time.sleep(0.01)
+
+        self.assertTrue(self.cache.holds(['a', 'b'], version='v2'))
+        self.assertEqual(self.cache.get_many(['a', 'b'], self.loader, version='v2'), {'a': 'A2', 'b': 'B2'})
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    def test_concurrent_misses_share_one_load(self):
+        """Test single-flight loading of the same key"""
+        self.loader.delay = 0.2
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: self.cache.get_many(['a'], self.loader), range(4)))
+
+        self.assertEqual(results, [{'a': 'A1'}] * 4)
+        self.assertEqual(len(self.loader.calls), 1)
+        self.assertEqual(self.cache.stats()['coalesced'], 3)
+
+    def test_negative_entries_expire_sooner(self):
+        """Test that unknown keys are cached as None for the negative period"""
+        self.assertEqual(self.cache.get_many(['x'], self.loader), {'x': None})
+        self.assertEqual(self.cache.get_many(['x'], self.loader), {'x': None})
+        self.assertEqual(self.cache.stats()['negative_hits'], 1)
+
+        self.now += 30
+        self.cache.get_many(['x'], self.loader)
+        self.assertEqual(self.cache.stats()['stale_hits'], 1)
+
+    def test_unloaded_keys_are_not_cached(self):
+        """Test that keys a loader leaves out are retried"""
+        self.assertEqual(self.cache.get_many(['a'], lambda keys: {}), {})
+        self.assertEqual(self.cache.get_many(['a'], self.loader), {'a': 'A1'})
+
+    def test_lru_bound(self):
+        """Test that the least recently used entry is evicted"""
+        self.cache.get_many(['a', 'b', 'c'], self.loader)
+        self.cache.get_many(['a'], self.loader)
+        self.cache.get_many(['d'], self.loader)
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+        self.cache.get_many(['b'], self.loader)
+        self.assertEqual(self.loader.calls[-1], ['b'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+Unit tests for market data fetching against a local stub server
+"""
+import unittest
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.market_cache import MarketDataCache
+from utils.market_data_integration import (
+    HTTPMarketDataSource, LocalMarketDataSource, MarketDataProvider, RealTimeMarketIntegration
+)
+from utils.market_dataset import BASE_SALARY_DATA
+from tests.market_stub_server import StubMarketServer
+
+STACK = ['Python', 'Django', 'React', 'PostgreSQL', 'Docker', 'AWS']
+
+CANDIDATE = {'tech_stack': {'languages': ['Python', 'JavaScript'], 'frameworks': ['Django', 'React'],
+                            'databases': ['PostgreSQL']},
+             'experience_years': 3, 'location': 'Berlin'}
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or timeout passes"""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def integration_for(provider: MarketDataProvider) -> RealTimeMarketIntegration:
+    integration = RealTimeMarketIntegration()
+    integration.market_provider = provider
+    return integration
+
+class TestHTTPMarketData(unittest.TestCase):
+    """Test cases for the HTTP market data source"""
+
+    def setUp(self):
+        self.server = StubMarketServer(delay=0.2).start()
+        self.source = HTTPMarketDataSource(self.server.base_url, timeout=2.0)
+        self.provider = MarketDataProvider(self.source, MarketDataCache())
+        # The first snapshot check runs in the background
+        self.assertTrue(wait_until(lambda: self.source.snapshot() == self.server.snapshot))
+
+    def tearDown(self):
+        self.source.close()
+        self.server.stop()
+
+    def test_stack_is_fetched_concurrently(self):
+        """Test that a stack costs about one round trip"""
+        start = time.perf_counter()
+        trends = self.provider.get_technologies_market_data(STACK)
+
+        self.assertLess(time.perf_counter() - start, 3 * self.server.delay)
+        self.assertEqual(list(trends), STACK)
+        self.assertEqual(trends['Python'].salary_range, BASE_SALARY_DATA['python'])
+        self.assertEqual(self.server.request_count, len(STACK))
+
+    def test_unknown_technologies_are_cached(self):
+        """Test that unknown technologies are not requested again"""
+        self.assertIsNone(self.provider.get_technology_market_data('Cobol'))
+        self.assertIsNone(self.provider.get_technology_market_data('cobol'))
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_deadline_skips_slow_technologies(self):
+        """Test that a slow API is cut off at the deadline and retried later"""
+        self.server.delay = 0.6
+        self.provider.fetch_deadline = 0.1
+        start = time.perf_counter()
+
+        self.assertEqual(self.provider.get_technologies_market_data(STACK[:2]), {})
+        self.assertLess(time.perf_counter() - start, 0.4)
+
+        self.server.delay = 0.0
+        self.provider.fetch_deadline = 2.0
+        self.assertEqual(len(self.provider.get_technologies_market_data(STACK[:2])), 2)
+
+    def test_comprehensive_analysis_in_one_round_trip(self):
+        """Test that the stack and career recommendations are fetched together"""
+        integration = integration_for(self.provider)
+
+        start = time.perf_counter()
+        analysis = integration.get_comprehensive_market_analysis(CANDIDATE)
+
+        # 9 technologies one after another would take 9 delays
+        self.assertLess(time.perf_counter() - start, 3 * self.server.delay)
+        self.assertEqual(analysis['career_progression']['career_path'], 'Full Stack Web')
+        self.assertEqual(len(analysis['market_analysis']['technology_breakdown']), 5)
+        self.assertEqual(self.server.request_count, 9)
+
+    def test_new_snapshot_is_picked_up_in_the_background(self):
+        """Test that a published snapshot replaces memoized analyses without blocking on the API"""
+        source = HTTPMarketDataSource(self.server.base_url, timeout=2.0, snapshot_check_seconds=0)
+        self.addCleanup(source.close)
+        provider = MarketDataProvider(source, MarketDataCache())
+        integration = integration_for(provider)
+        self.assertTrue(wait_until(lambda: source.snapshot() == self.server.snapshot))
+        first = integration.get_comprehensive_market_analysis(CANDIDATE)
+        self.assertIs(integration.get_comprehensive_market_analysis(CANDIDATE), first)
+        self.assertEqual(self.server.request_count, 9)
+
+        self.server.snapshot = 'v2-test'
+        self.assertTrue(wait_until(lambda: source.snapshot() == 'v2-test'))
+
+        # Figures of the old snapshot are served at once and refreshed in the background
+        start = time.perf_counter()
+        second = integration.get_comprehensive_market_analysis(CANDIDATE)
+        self.assertLess(time.perf_counter() - start, self.server.delay)
+        self.assertIsNot(second, first)
+        self.assertEqual(second['market_analysis']['estimated_salary_range'],
+                         first['market_analysis']['estimated_salary_range'])
+
+        self.assertTrue(wait_until(lambda: provider.is_settled(STACK, 'v2-test')))
+        self.assertEqual(self.server.request_count, 18)
+        third = integration.get_comprehensive_market_analysis(CANDIDATE)
+        self.assertIsNot(third, second)
+        self.assertIs(integration.get_comprehensive_market_analysis(CANDIDATE), third)
+
+    def test_timed_out_analyses_are_not_memoized(self):
+        """Test that an analysis missing slow technologies is recomputed"""
+        self.server.delay = 0.6
+        self.provider.fetch_deadline = 0.1
+        integration = integration_for(self.provider)
+        self.assertEqual(integration.get_comprehensive_market_analysis(CANDIDATE), {})
+
+        self.server.delay = 0.0
+        self.provider.fetch_deadline = 2.0
+        self.assertEqual(len(integration.get_comprehensive_market_analysis(CANDIDATE)['market_analysis']
+                             ['technology_breakdown']), 5)
+
+    def test_stack_aggregates_match_the_dataset(self):
+        """Test that aggregates over fetched trends equal the ones read from dataset rows by tech ID"""
+        tech_stack = CANDIDATE['tech_stack']
+        remote = self.provider.get_tech_stack_market_analysis(tech_stack)
+        local_source = LocalMarketDataSource(variation=self.server.source.variation)
+        local = MarketDataProvider(local_source, MarketDataCache()).get_tech_stack_market_analysis(tech_stack)
+
+        for key in ('market_strength', 'average_demand_score', 'estimated_salary_range',
+                    'average_growth_rate', 'total_job_opportunities', 'market_insights'):
+            self.assertEqual(remote[key], local[key], key)
+        self.assertEqual(remote['snapshot'], self.server.snapshot)
+
+        trends = remote['technology_breakdown'].values()
+        self.assertEqual(remote['total_job_opportunities'], sum(trend.job_count for trend in trends))
+        self.assertEqual(remote['estimated_salary_range']['median'],
+                         int(sum(trend.salary_range['median'] for trend in trends) / len(trends)))
+
+class TestLocalMarketData(unittest.TestCase):
+    """Test cases for the built-in market data source"""
+
+    def test_figures_are_fixed_per_snapshot(self):
+        """Test that simulated figures stay within the variation band and never change within a snapshot"""
+        provider = MarketDataProvider(LocalMarketDataSource(), MarketDataCache())
+        trend = provider.get_technology_market_data('Kubernetes')
+
+        self.assertLessEqual(abs(trend.salary_range['median'] / 125000 - 1), 0.05)
+        self.assertEqual(LocalMarketDataSource().fetch('kubernetes')['salary'], trend.salary_range)
+        self.assertIsNotNone(provider.get_technology_market_data('Rust'))
+        self.assertIsNone(provider.get_technology_market_data('cobol'))
+
+    def test_analyses_are_memoized(self):
+        """Test that equivalent candidates share one analysis"""
+        integration = integration_for(MarketDataProvider(LocalMarketDataSource(), MarketDataCache()))
+        analysis = integration.get_comprehensive_market_analysis(CANDIDATE)
+
+        for changes in ({'experience_years': 4}, {'location': 'berlin, germany'}):
+            self.assertIs(integration.get_comprehensive_market_analysis(dict(CANDIDATE, **changes)), analysis)
+        for changes in ({'experience_years': 1}, {'location': 'Munich'}, {'location': 'Atlantis'}):
+            self.assertIsNot(integration.get_comprehensive_market_analysis(dict(CANDIDATE, **changes)), analysis)
+
+        self.assertEqual(integration.get_comprehensive_market_analysis(dict(CANDIDATE, location='Atlantis'))
+                         ['location_data']['location'], 'Atlantis')
+        self.assertEqual(len(integration._memo), 4)
+
+    def test_stack_permutations_share_a_memo_entry(self):
+        """Test that the memo is keyed by the set of technologies, not their order, case or categories"""
+        integration = integration_for(MarketDataProvider(LocalMarketDataSource(), MarketDataCache()))
+        analysis = integration.get_comprehensive_market_analysis(CANDIDATE)
+
+        shuffled = dict(CANDIDATE, tech_stack={'databases': ['postgresql'], 'frameworks': ['React', 'Django'],
+                                               'languages': ['JavaScript', 'python']})
+        regrouped = dict(CANDIDATE, tech_stack={'skills': ['Django', 'PostgreSQL', 'Python', 'React', 'JavaScript']})
+        self.assertIs(integration.get_comprehensive_market_analysis(shuffled), analysis)
+        self.assertIs(integration.get_comprehensive_market_analysis(regrouped), analysis)
+        self.assertEqual(len(integration._memo), 1)
+
+if __name__ == '__main__':
+    unittest.main()
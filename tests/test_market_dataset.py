@@ -0,0 +1,84 @@
+"""
+Unit tests for the memory-mapped market dataset
+"""
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from utils.market_data_integration import MarketDataProvider
+from utils.market_dataset import (
+    BASE_SALARY_DATA, CURRENT_FILE, MarketDataset, build_dataset, load_or_build, location_rows, market_dataset
+)
+
+TECHNOLOGIES = {
+    'python': {'salary': {'min': 70000, 'max': 150000, 'median': 95000}, 'demand': 95, 'growth': 15.2, 'jobs': 45000},
+    'rust': {'salary': {'min': 80000, 'max': 170000, 'median': 120000}, 'demand': 70.5, 'growth': 30.1, 'jobs': 4000}
+}
+LOCATIONS = [{'city': 'Lisbon', 'region': None, 'country': 'Portugal', 'cost_of_living_index': 0.6,
+              'tech_hub_score': 0.7, 'average_salary_multiplier': 0.45}]
+
+class TestMarketDataset(unittest.TestCase):
+    """Test cases for building and mapping the market dataset"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_build_and_map(self):
+        """Test that a build maps its columns read-only and indexes technologies"""
+        manifest = build_dataset(self.temp_dir, TECHNOLOGIES, LOCATIONS)
+        dataset = MarketDataset(os.path.join(self.temp_dir, manifest['version']))
+
+        self.assertIsInstance(dataset.tech['salary_median'], np.memmap)
+        self.assertFalse(dataset.tech['demand'].flags.writeable)
+        self.assertEqual(dataset.figures(dataset.tech_id('Rust')), TECHNOLOGIES['rust'])
+        self.assertIsNone(dataset.tech_id('cobol'))
+        self.assertEqual(dataset.location_row(0), LOCATIONS[0])
+
+    def test_new_build_keeps_old_version(self):
+        """Test that publishing a new build switches CURRENT_FILE and leaves the old build in place"""
+        first = build_dataset(self.temp_dir, TECHNOLOGIES, LOCATIONS)
+        old = MarketDataset(os.path.join(self.temp_dir, first['version']))
+        second = build_dataset(self.temp_dir, dict(TECHNOLOGIES, go=TECHNOLOGIES['rust']), LOCATIONS)
+
+        self.assertNotEqual(first['version'], second['version'])
+        with open(os.path.join(self.temp_dir, CURRENT_FILE)) as handle:
+            self.assertEqual(json.load(handle)['version'], second['version'])
+        self.assertEqual(len(old), 2)
+        self.assertEqual(int(old.tech['jobs'][1]), 4000)
+
+    def test_load_or_build_covers_the_catalog(self):
+        """Test the default build: every catalog technology and the seed locations"""
+        dataset = load_or_build(self.temp_dir)
+        catalog = {tech for techs in Config.COMMON_TECHNOLOGIES.values() for tech in techs}
+
+        self.assertEqual(set(dataset.technologies), catalog | set(BASE_SALARY_DATA))
+        self.assertGreater(len(dataset.locations), 300)
+        self.assertEqual(dataset.figures(dataset.tech_id('python'))['salary'], BASE_SALARY_DATA['python'])
+        self.assertEqual(load_or_build(self.temp_dir).version, dataset.version)
+
+    def test_seed_locations_keep_reference_figures(self):
+        """Test that the original reference cities come first with their figures"""
+        rows = location_rows()
+        self.assertEqual([row['city'] for row in rows[:8]],
+                         ['San Francisco', 'New York', 'Seattle', 'Toronto', 'London', 'Berlin', 'Bangalore', 'Remote'])
+        self.assertEqual(rows[4]['average_salary_multiplier'], 1.15)
+
+        provider = MarketDataProvider()
+        self.assertEqual(provider.dataset.version, market_dataset.version)
+        adjusted = provider.get_location_adjusted_salary(100000, 'Berlin, Germany')
+        self.assertEqual((adjusted['location'], adjusted['adjusted_salary']), ('Berlin', 95000))
+
+if __name__ == '__main__':
+    unittest.main()
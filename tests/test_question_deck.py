@@ -0,0 +1,81 @@
+"""
+Unit tests for the per-session question deck
+"""
+import unittest
+import sys
+import os
+import json
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.question_deck import QuestionDeck, bucket_key
+from utils.question_generator import TechnicalQuestionGenerator
+from utils.question_store import QuestionStore
+from utils.session_store import InMemorySessionStore
+
+class TestQuestionDeck(unittest.TestCase):
+    """Test cases for QuestionDeck"""
+
+    def setUp(self):
+        self.store = QuestionStore()
+        for number in range(10):
+            self.store.add(f"Python question {number}", bank='generator', category='technical',
+                           technology='python')
+        for number in range(3):
+            self.store.add(f"React question {number}", bank='generator', category='technical',
+                           technology='react')
+
+    def test_draws_never_repeat(self):
+        """Test that a bucket hands out each ID once and then runs dry"""
+        deck = QuestionDeck(7, store=self.store)
+        drawn = deck.draw(4, technology='python') + deck.draw(4, technology='python') + deck.draw(4, technology='python')
+
+        self.assertEqual(sorted(drawn), self.store.ids(technology='python'))
+        self.assertEqual(deck.draw(1, technology='python'), [])
+        self.assertEqual(deck.remaining(technology='react'), 3)
+
+    def test_same_seed_same_sequence(self):
+        """Test that a deck reproduces exactly from its seed"""
+        first = QuestionDeck(42, store=self.store).draw(10, technology='python')
+        second = QuestionDeck(42, store=self.store).draw(10, technology='python')
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, sorted(first))
+
+    def test_restored_deck_continues(self):
+        """Test that a saved deck picks up where it left off"""
+        deck = QuestionDeck(3, store=self.store)
+        deck.draw(2, technology='python')
+        deck.draw(1, technology='react')
+        state = json.loads(json.dumps(deck.to_state()))
+
+        restored = QuestionDeck.from_state(state, store=self.store)
+        self.assertEqual(restored.draw(8, technology='python'), deck.draw(8, technology='python'))
+        self.assertEqual(restored.remaining(technology='react'), 2)
+
+    def test_bucket_key_ignores_unset_tags(self):
+        """Test that bucket names are stable and skip None tags"""
+        self.assertEqual(bucket_key(technology='python', bank='generator', difficulty=None),
+                         "bank=generator&technology=python")
+
+class TestDeckInSession(unittest.TestCase):
+    """Test that generated questions do not repeat across turns"""
+
+    def test_generator_turns_do_not_repeat(self):
+        """Test that a deck kept in the session store spans several generations"""
+        generator = TechnicalQuestionGenerator()
+        sessions = InMemorySessionStore()
+        asked = []
+
+        for _ in range(5):
+            deck = QuestionDeck.from_state(sessions.get('s1', 'question_deck'))
+            questions = generator.generate_questions({'languages': ['Python']}, 3, deck)
+            asked.extend(questions.get('Python', []))
+            sessions.put('s1', 'question_deck', deck.to_state())
+
+        self.assertEqual(len(asked), 15)
+        self.assertEqual(len(set(asked)), 15)
+
+if __name__ == '__main__':
+    unittest.main()
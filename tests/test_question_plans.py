@@ -0,0 +1,119 @@
+"""
+Unit tests for question plans memoized by tech-stack signature
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from knowledge_base.analytics import KnowledgeBaseAnalytics
+from utils.question_deck import QuestionDeck
+from utils.question_generator import TechnicalQuestionGenerator
+from utils.question_plans import QuestionPlanCache, experience_bucket, plan_signature
+
+class TestPlanSignature(unittest.TestCase):
+    """Test cases for plan signatures"""
+
+    def test_order_and_case_do_not_matter(self):
+        """Test that equivalent stacks share a signature"""
+        first = plan_signature({'languages': ['Python'], 'frameworks': ['Django', 'React']}, '4', 'fintech')
+        second = plan_signature({'frameworks': ['react', 'django'], 'languages': ['python']}, 3, 'fintech')
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, plan_signature({'languages': ['Python']}, 4, 'fintech'))
+        self.assertNotEqual(first, plan_signature({'languages': ['Python'], 'frameworks': ['Django', 'React']},
+                                                  9, 'fintech'))
+
+    def test_experience_buckets(self):
+        """Test that experience values land in the scorer's levels"""
+        self.assertEqual(experience_bucket(0), 'entry')
+        self.assertEqual(experience_bucket('2'), 'junior')
+        self.assertEqual(experience_bucket(12), 'senior+')
+        self.assertEqual(experience_bucket('unknown'), 'entry')
+
+class TestQuestionPlanCache(unittest.TestCase):
+    """Test cases for QuestionPlanCache"""
+
+    def setUp(self):
+        self.cache = QuestionPlanCache(max_entries=2)
+        self.stack = {'languages': ['Python'], 'frameworks': ['Django'], 'databases': ['PostgreSQL']}
+
+    def test_hits_and_misses(self):
+        """Test that a repeated stack shape is served from the cache"""
+        plan = self.cache.get(self.stack, 5, 'fintech')
+        again = self.cache.get({'databases': ['postgresql'], 'languages': ['python'], 'frameworks': ['django']},
+                               6, 'fintech')
+
+        self.assertIs(plan, again)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertIn('python', plan.technical_pools)
+
+    def test_shared_plan_is_read_only(self):
+        """Test that one session cannot alter the plan another session is served"""
+        plan = self.cache.get(self.stack, 5, 'fintech')
+
+        with self.assertRaises(TypeError):
+            plan.technical_pools['python'] = ()
+        with self.assertRaises(TypeError):
+            del plan.industry_pools['python']
+        with self.assertRaises(TypeError):
+            plan.tech_analysis['modern_stack'] = True
+
+    def test_lru_bound(self):
+        """Test that the least recently used plan is evicted"""
+        self.cache.get({'languages': ['Python']}, 1, 'general')
+        self.cache.get({'languages': ['Java']}, 1, 'general')
+        self.cache.get({'languages': ['Python']}, 1, 'general')
+        self.cache.get({'languages': ['Go']}, 1, 'general')
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 1)
+        self.cache.get({'languages': ['Python']}, 1, 'general')
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    def test_plan_pools_match_direct_generation(self):
+        """Test that sampling from a cached plan equals generating from scratch"""
+        generator = TechnicalQuestionGenerator()
+        plan = self.cache.get(self.stack, 5, 'general')
+
+        cached = generator.generate_questions(self.stack, 3, QuestionDeck(11), plan.technical_pools)
+        direct = generator.generate_questions(self.stack, 3, QuestionDeck(11))
+        self.assertEqual(cached, direct)
+
+    def test_warm_from_analytics_export(self):
+        """Test that the most common past stack shapes are pre-built"""
+        sessions = [{'tech_stack': self.stack, 'experience_years': '5', 'industry': 'fintech'}] * 3
+        sessions += [{'tech_stack': {'languages': ['Go']}, 'experience_years': '1'},
+                     {'tech_stack': {'languages': ['Rust']}, 'experience_years': '1'}]
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as handle:
+            json.dump({'session_data': sessions}, handle)
+
+        try:
+            self.assertEqual(self.cache.warm_from_file(handle.name), 2)
+        finally:
+            os.unlink(handle.name)
+
+        self.cache.get(self.stack, 7, 'fintech')
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['warmed'], stats['entries']), (1, 2, 2))
+
+    def test_analytics_keeps_recent_sessions_only(self):
+        """Test that tracked sessions are capped and the export still warms plans"""
+        analytics = KnowledgeBaseAnalytics()
+        for _ in range(Config.ANALYTICS_SESSION_LIMIT + 5):
+            analytics.track_session({'tech_stack': self.stack, 'experience_years': '5'}, {'python': ['q']})
+        self.assertEqual(len(analytics.session_data), Config.ANALYTICS_SESSION_LIMIT)
+
+        sessions = json.loads(analytics.export_analytics_data())['session_data']
+        self.assertEqual(len(sessions), Config.ANALYTICS_SESSION_LIMIT)
+        self.assertEqual(self.cache.warm(sessions), 1)
+
+if __name__ == '__main__':
+    unittest.main()
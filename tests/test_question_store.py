@@ -0,0 +1,190 @@
+"""
+Unit tests for the metadata-indexed question store
+"""
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge_base.question_corpus import CORPUS_FILE, index_path, load_index
+from utils.question_store import QuestionStore, classify_focus_areas, question_store
+
+class TestQuestionStore(unittest.TestCase):
+    """Test cases for QuestionStore"""
+
+    def setUp(self):
+        self.store = QuestionStore()
+        self.store.add("Explain the GIL and how you profile CPU-bound code", bank='b', category='technical',
+                       technology='python', difficulty='senior')
+        self.store.add("How do you structure a Python project?", bank='b', category='technical',
+                       technology='python', difficulty='mid')
+        self.store.add("How do you tune slow queries for performance?", bank='b', category='technical',
+                       technology='mysql', difficulty='senior')
+
+    def test_ids_are_insertion_ordered(self):
+        """Test that IDs are assigned in order and lookups return them sorted"""
+        self.assertEqual(self.store.ids(bank='b'), [0, 1, 2])
+        self.assertEqual(self.store.ids(technology='python'), [0, 1])
+
+    def test_tag_intersection(self):
+        """Test that several tags intersect"""
+        self.assertEqual(self.store.ids(technology='python', difficulty='senior'), [0])
+        self.assertEqual(self.store.ids(difficulty='senior', focus='performance'), [0, 2])
+        self.assertEqual(self.store.ids(technology='python', difficulty='junior'), [])
+        self.assertEqual(self.store.ids(technology='rust'), [])
+
+    def test_none_tags_are_ignored(self):
+        """Test that a None tag value does not restrict the lookup"""
+        self.assertEqual(self.store.ids(technology='python', industry=None), [0, 1])
+
+    def test_unknown_tag_rejected(self):
+        """Test that a misspelled tag raises instead of matching nothing"""
+        with self.assertRaises(ValueError):
+            self.store.ids(tech='python')
+
+    def test_find_and_tag_values(self):
+        """Test exact text lookup and distinct tag values"""
+        question_id = self.store.find("How do you structure a Python project?")
+        self.assertEqual(self.store.get(question_id).difficulty, 'mid')
+        self.assertIsNone(self.store.find("Unknown question"))
+        self.assertEqual(self.store.tag_values('technology', difficulty='senior'), ['python', 'mysql'])
+
+    def test_classify_focus_areas(self):
+        """Test that focus areas are derived from question wording"""
+        focus = classify_focus_areas("How do you debug performance issues in your projects?")
+        self.assertIn('performance', focus)
+        self.assertIn('problem_solving', focus)
+        self.assertIn('real_world', focus)
+
+class TestGlobalQuestionStore(unittest.TestCase):
+    """Test that every question bank is indexed"""
+
+    def test_banks_indexed(self):
+        """Test that every bank in the corpus is addressable"""
+        self.assertEqual(question_store.count(bank='generator', technology='python'), 20)
+        self.assertEqual(question_store.count(bank='advanced', technology='python', difficulty='senior'), 5)
+        self.assertEqual(question_store.count(bank='follow_up', technology='react', difficulty='advanced'), 4)
+        self.assertGreater(question_store.count(bank='industry', industry='fintech', category='scenario'), 0)
+        with open(CORPUS_FILE, encoding='utf-8') as handle:
+            self.assertEqual(len(question_store), sum(1 for line in handle if '"text"' in line))
+
+    def test_insight(self):
+        """Test that technology insights are served from their shard"""
+        self.assertIn('key_concepts', question_store.insight('python'))
+        self.assertIsNone(question_store.insight('cobol'))
+
+    def test_behavioral_topics(self):
+        """Test that behavioral topics are addressable as focus areas"""
+        questions = question_store.questions(bank='advanced', category='behavioral', focus='leadership')
+        self.assertGreater(len(questions), 0)
+
+    def test_preference_filter_puts_focus_matches_first(self):
+        """Test that the interactive selector ranks by stored metadata"""
+        from utils.interactive_question_selector import InteractiveQuestionSelector
+
+        selector = InteractiveQuestionSelector()
+        questions = question_store.questions(bank='generator', technology='python')
+        ordered = selector._filter_questions_by_preferences(questions, 'mid', ['performance'], {})
+
+        self.assertEqual(sorted(ordered), sorted(questions))
+        matches = question_store.count(bank='generator', technology='python', focus='performance')
+        self.assertTrue(all('performance' in question_store.get(question_store.find(text)).focus_areas
+                            for text in ordered[:matches]))
+
+class TestQuestionCorpus(unittest.TestCase):
+    """Test lazy shard loading from a small corpus"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.corpus_path = os.path.join(self.temp_dir, "questions.jsonl")
+        records = [
+            {'shard': 'go', 'insight': {'description': 'Go'}},
+            {'id': 0, 'shard': 'go', 'bank': 'generator', 'category': 'technical', 'technology': 'go',
+             'focus': ['performance'], 'text': 'How do goroutines scale?'},
+            {'id': 2, 'shard': 'go', 'bank': 'generator', 'category': 'technical', 'technology': 'go',
+             'focus': [], 'text': 'What is a Go interface?'},
+            {'id': 1, 'shard': 'rust', 'bank': 'generator', 'category': 'technical', 'technology': 'rust',
+             'focus': [], 'text': 'What is ownership in Rust?'},
+            {'id': 3, 'shard': 'zig', 'bank': 'generator', 'category': 'technical', 'technology': 'zig',
+             'focus': [], 'text': 'What is comptime in Zig?'}
+        ]
+        with open(self.corpus_path, 'w', encoding='utf-8') as handle:
+            for record in records:
+                handle.write(json.dumps(record) + "\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_lookups_do_not_load_texts(self):
+        """Test that tag lookups are answered from the index alone"""
+        store = QuestionStore(self.corpus_path, max_shards=2)
+
+        self.assertEqual(store.ids(technology='go'), [0, 2])
+        self.assertEqual(store.ids(focus='performance'), [0])
+        self.assertEqual(store.stats()['shard_loads'], 0)
+        self.assertTrue(os.path.exists(index_path(self.corpus_path)))
+
+    def test_shard_lru(self):
+        """Test that shards load on first use and the least recently used is evicted"""
+        store = QuestionStore(self.corpus_path, max_shards=2)
+
+        self.assertEqual(store.text(1), 'What is ownership in Rust?')
+        self.assertEqual(store.questions(technology='go'), ['How do goroutines scale?', 'What is a Go interface?'])
+        self.assertEqual(store.insight('go'), {'description': 'Go'})
+        store.text(3)
+
+        stats = store.stats()
+        self.assertEqual(stats['shard_loads'], 3)
+        self.assertEqual(stats['shard_evictions'], 1)
+        self.assertEqual(stats['loaded_shards'], 2)
+        self.assertEqual(store.find('What is ownership in Rust?'), 1)
+
+    def test_stale_index_rebuilt(self):
+        """Test that editing the corpus invalidates the index"""
+        QuestionStore(self.corpus_path)
+        with open(self.corpus_path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps({'id': 4, 'shard': 'zig', 'bank': 'generator', 'category': 'technical',
+                                     'technology': 'zig', 'text': 'How does Zig handle errors?'}) + "\n")
+
+        store = QuestionStore(self.corpus_path)
+        self.assertEqual(store.ids(technology='zig'), [3, 4])
+        self.assertEqual(len(load_index(self.corpus_path)['questions']), 5)
+
+    def test_unchanged_corpus_is_not_read(self):
+        """Test that size and mtime decide staleness, with the checksum only as a fallback"""
+        load_index(self.corpus_path)
+        with open(index_path(self.corpus_path), 'r', encoding='utf-8') as handle:
+            index = json.load(handle)
+        # A wrong checksum goes unnoticed while size and mtime match
+        index['corpus_hash'] = 'bogus'
+        index['marker'] = True
+        with open(index_path(self.corpus_path), 'w', encoding='utf-8') as handle:
+            json.dump(index, handle)
+        self.assertTrue(load_index(self.corpus_path).get('marker'))
+
+        # Once the corpus is touched, the checksum is compared and the index rebuilt
+        stat = os.stat(self.corpus_path)
+        os.utime(self.corpus_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertNotIn('marker', load_index(self.corpus_path))
+
+        # Touched again but unchanged: kept, with the new mtime recorded
+        os.utime(self.corpus_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        index = load_index(self.corpus_path)
+        self.assertEqual(index['corpus_stat'], [stat.st_size, stat.st_mtime_ns + 2 * 10 ** 9])
+
+    def test_split_shard_rejected(self):
+        """Test that a shard must be contiguous so it can be read in one seek"""
+        with open(self.corpus_path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps({'id': 5, 'shard': 'go', 'bank': 'generator', 'category': 'technical',
+                                     'text': 'Late Go question'}) + "\n")
+
+        with self.assertRaises(ValueError):
+            QuestionStore(self.corpus_path)
+
+if __name__ == '__main__':
+    unittest.main()
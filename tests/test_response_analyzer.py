@@ -0,0 +1,74 @@
+"""
+Unit tests for the compiled response analyzer
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.skill_level_adapter import IndicatorMatcher, ResponseAnalyzer, SkillLevel
+
+class TestIndicatorMatcher(unittest.TestCase):
+    """Test cases for IndicatorMatcher"""
+
+    def setUp(self):
+        self.matcher = IndicatorMatcher({
+            'technical': ['design', 'design pattern', 'performance'],
+            'experience': ['led', ('i have', 'i use'), 'design'],
+        })
+
+    def count(self, text: str) -> dict:
+        return self.matcher.count(text.lower().split())
+
+    def test_substring_semantics(self):
+        """Test that indicators match inside longer words"""
+        self.assertEqual(self.count('We redesigned it and I was called in'), {'technical': 1, 'experience': 2})
+
+    def test_shared_prefixes_all_count(self):
+        """Test that every phrase starting at the same position is found"""
+        self.assertEqual(self.count('A DESIGN\n  PATTERN for Performance'), {'technical': 3, 'experience': 1})
+
+    def test_alternatives_count_once(self):
+        """Test that a tuple of alternatives is a single indicator"""
+        self.assertEqual(self.count('i have done it and i use it daily'), {'technical': 0, 'experience': 1})
+        self.assertEqual(self.count(''), {'technical': 0, 'experience': 0})
+
+class TestResponseAnalyzer(unittest.TestCase):
+    """Test cases for ResponseAnalyzer"""
+
+    def setUp(self):
+        self.analyzer = ResponseAnalyzer()
+
+    def test_scan_counts(self):
+        """Test that one scan covers the skill, depth and answer-quality tables"""
+        scan = self.analyzer.scan("I have deployed it to production because memory was tight; "
+                                  "it was a trade-off between CPU and caching")
+        counts = scan['counts']
+
+        self.assertEqual(scan['word_count'], 18)
+        self.assertEqual(counts['technical_depth'], 4)
+        self.assertEqual(counts['experience'], 2)
+        self.assertEqual(counts['intermediate_patterns'], 1)
+        self.assertEqual((counts['answer_technical'], counts['answer_experience']), (2, 2))
+
+    def test_analyze_response(self):
+        """Test the skill assessment for an expert-sounding answer"""
+        answer = ("I mentor the team on CPython internals and contribute to the interpreter, "
+                  "so I often deep dive into what happens under the hood")
+        analysis = self.analyzer.analyze_response(answer)
+
+        self.assertEqual(analysis['estimated_skill_level'], SkillLevel.EXPERT)
+        self.assertEqual(analysis['confidence'], 1.0)
+        self.assertEqual(analysis['suggested_follow_up_type'], 'clarification')
+        self.assertEqual(analysis, self.analyzer.analyze_response(answer, scan=self.analyzer.scan(answer)))
+
+    def test_recompiling_after_edits(self):
+        """Test that compile_indicators picks up changed tables"""
+        self.analyzer.technical_depth_indicators.append('latency')
+        self.analyzer.compile_indicators()
+        self.assertEqual(self.analyzer.scan('Latency budgets')['counts']['technical_depth'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Unit tests for the LLM response cache
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatbot.response_cache import ResponseCache, make_cache_key
+
+class FakeClock:
+    """Manually advanced clock for TTL tests"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_key_covers_content(self):
+        """Test that equal-length prompts and different settings get different keys"""
+        messages_a = [{"role": "user", "content": "abc"}]
+        messages_b = [{"role": "user", "content": "xyz"}]
+
+        self.assertNotEqual(make_cache_key("m", messages_a, 0.7), make_cache_key("m", messages_b, 0.7))
+        self.assertNotEqual(make_cache_key("m", messages_a, 0.7), make_cache_key("m", messages_a, 0.3))
+        self.assertNotEqual(make_cache_key("m", messages_a, 0.7), make_cache_key("n", messages_a, 0.7))
+        self.assertEqual(make_cache_key("m", messages_a, 0.7), make_cache_key("m", list(messages_a), 0.7))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        cache = ResponseCache(max_entries=2, clock=self.clock)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL"""
+        cache = ResponseCache(ttl_seconds=60, clock=self.clock)
+        cache.set("a", "1")
+        self.clock.now += 59
+        self.assertEqual(cache.get("a"), "1")
+        self.clock.now += 2
+        self.assertIsNone(cache.get("a"))
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expirations']), (1, 1, 1))
+
+    def test_sqlite_tier_survives_restart(self):
+        """Test that entries written to disk are served by a new cache"""
+        db_path = os.path.join(self.temp_dir, "llm_cache.db")
+        ResponseCache(db_path=db_path, clock=self.clock).set("a", "1")
+
+        restarted = ResponseCache(db_path=db_path, clock=self.clock)
+        self.assertEqual(restarted.get("a"), "1")
+        self.assertEqual(restarted.stats()['disk_hits'], 1)
+        self.assertEqual(restarted.get("a"), "1")
+        self.assertEqual(restarted.stats()['hits'], 1)
+
+    def test_sqlite_tier_is_bounded(self):
+        """Test that the disk tier keeps only the newest entries"""
+        db_path = os.path.join(self.temp_dir, "llm_cache.db")
+        cache = ResponseCache(max_entries=1, max_disk_entries=2, db_path=db_path, clock=self.clock)
+        for key in "abc":
+            cache.set(key, key)
+            self.clock.now += 1
+
+        restarted = ResponseCache(db_path=db_path, clock=self.clock)
+        self.assertIsNone(restarted.get("a"))
+        self.assertEqual(restarted.get("c"), "c")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+"""
+Unit tests for the session store backends
+"""
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.session_store import InMemorySessionStore, SQLiteSessionStore
+
+class FakeClock:
+    """Manually advanced clock for TTL tests"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class SessionStoreContract:
+    """Behaviour shared by every backend"""
+
+    def make_store(self, ttl_seconds=100):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = self.make_store()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_state_round_trip(self):
+        """Test that state records are stored per session and namespace"""
+        self.assertIsNone(self.store.get("s1", "ctx"))
+
+        self.store.put("s1", "ctx", {"name": "Ada", "stack": ["python"]})
+        self.store.put("s1", "other", {"value": 1})
+        self.store.put("s2", "ctx", {"name": "Grace"})
+
+        self.assertEqual(self.store.get("s1", "ctx"), {"name": "Ada", "stack": ["python"]})
+        self.assertEqual(self.store.get("s1", "other"), {"value": 1})
+        self.assertEqual(self.store.get("s2", "ctx"), {"name": "Grace"})
+
+    def test_append_and_read_log(self):
+        """Test that appends keep order and last= returns the tail"""
+        for index in range(5):
+            self.store.append("s1", "messages", {"index": index})
+
+        self.assertEqual([item["index"] for item in self.store.read_log("s1", "messages")], [0, 1, 2, 3, 4])
+        self.assertEqual([item["index"] for item in self.store.read_log("s1", "messages", last=2)], [3, 4])
+        self.assertEqual(self.store.log_length("s1", "messages"), 5)
+        self.assertEqual(self.store.read_log("s1", "missing"), [])
+        self.assertEqual(self.store.read_log("unknown", "messages"), [])
+
+    def test_values_are_copied(self):
+        """Test that mutating a stored or loaded value never changes the store"""
+        state = {"name": "Ada", "stack": ["python"]}
+        item = {"role": "user", "content": "hi"}
+        self.store.put("s1", "ctx", state)
+        self.store.append("s1", "messages", item)
+        state["stack"].append("go")
+        item["content"] = "changed"
+
+        loaded = self.store.get("s1", "ctx")
+        loaded["stack"].append("rust")
+        self.store.read_log("s1", "messages")[0]["content"] = "changed"
+
+        self.assertEqual(self.store.get("s1", "ctx"), {"name": "Ada", "stack": ["python"]})
+        self.assertEqual(self.store.read_log("s1", "messages"), [{"role": "user", "content": "hi"}])
+        for chunk in self.store.scan_log("messages"):
+            chunk[0][1]["content"] = "changed"
+        self.assertEqual(self.store.read_log("s1", "messages")[0]["content"], "hi")
+
+    def test_truncate_log(self):
+        """Test that a log can be cut back to a prefix and appended to again"""
+        for index in range(5):
+            self.store.append("s1", "messages", {"index": index})
+            self.store.append("s2", "messages", {"index": index})
+
+        self.store.truncate_log("s1", "messages", 2)
+        self.store.append("s1", "messages", {"index": 9})
+        self.store.truncate_log("unknown", "messages", 0)
+
+        self.assertEqual([item["index"] for item in self.store.read_log("s1", "messages")], [0, 1, 9])
+        self.assertEqual(self.store.log_length("s2", "messages"), 5)
+
+    def test_delete(self):
+        """Test that delete drops state and logs of one session only"""
+        self.store.put("s1", "ctx", {"a": 1})
+        self.store.append("s1", "messages", {"a": 1})
+        self.store.put("s2", "ctx", {"b": 2})
+
+        self.store.delete("s1")
+
+        self.assertIsNone(self.store.get("s1", "ctx"))
+        self.assertEqual(self.store.log_length("s1", "messages"), 0)
+        self.assertEqual(self.store.get("s2", "ctx"), {"b": 2})
+
+    def test_scan_log_in_chunks(self):
+        """Test that a log namespace is streamed across sessions without touching them"""
+        for number in range(5):
+            self.store.append("s1" if number < 3 else "s2", "answers", {'n': number})
+        self.store.append("s2", "other", {'n': 99})
+        self.clock.now += 60
+
+        chunks = list(self.store.scan_log("answers", chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        pairs = sorted((session_id, entry['n']) for chunk in chunks for session_id, entry in chunk)
+        self.assertEqual(pairs, [("s1", 0), ("s1", 1), ("s1", 2), ("s2", 3), ("s2", 4)])
+
+        self.clock.now += 60
+        self.assertEqual(list(self.store.scan_log("answers")), [])
+
+    def test_ttl_eviction(self):
+        """Test that idle sessions expire while active ones are kept"""
+        self.store.put("idle", "ctx", {"a": 1})
+        self.store.put("active", "ctx", {"b": 2})
+
+        self.clock.now += 60
+        self.store.get("active", "ctx")
+        self.clock.now += 60
+
+        self.assertEqual(self.store.evict_expired(), 1)
+        self.assertIsNone(self.store.get("idle", "ctx"))
+        self.assertEqual(self.store.session_ids(), ["active"])
+        self.assertEqual(self.store.get("active", "ctx"), {"b": 2})
+
+    def test_write_to_expired_session_starts_over(self):
+        """Test that a late write does not revive stale entries"""
+        self.store.append("s1", "messages", {"old": True})
+        self.clock.now += 200
+
+        self.store.append("s1", "messages", {"old": False})
+
+        self.assertEqual(self.store.read_log("s1", "messages"), [{"old": False}])
+
+class TestInMemorySessionStore(SessionStoreContract, unittest.TestCase):
+    """Test cases for InMemorySessionStore"""
+
+    def make_store(self, ttl_seconds=100):
+        return InMemorySessionStore(max_sessions=3, ttl_seconds=ttl_seconds, clock=self.clock)
+
+    def test_lru_bound(self):
+        """Test that the least recently used session is evicted at capacity"""
+        for session_id in ("a", "b", "c"):
+            self.store.put(session_id, "ctx", {"id": session_id})
+        self.store.get("a", "ctx")
+        self.store.put("d", "ctx", {"id": "d"})
+
+        self.assertIsNone(self.store.get("b", "ctx"))
+        self.assertEqual(sorted(self.store.session_ids()), ["a", "c", "d"])
+        self.assertEqual(self.store.stats()['evictions'], 1)
+
+class TestSQLiteSessionStore(SessionStoreContract, unittest.TestCase):
+    """Test cases for SQLiteSessionStore"""
+
+    def make_store(self, ttl_seconds=100):
+        return SQLiteSessionStore(os.path.join(self.temp_dir, "sessions.db"),
+                                  ttl_seconds=ttl_seconds, clock=self.clock)
+
+    def tearDown(self):
+        self.store.close()
+        super().tearDown()
+
+    def test_survives_restart(self):
+        """Test that a new store on the same file sees earlier sessions"""
+        self.store.put("s1", "ctx", {"name": "Ada"})
+        self.store.append("s1", "messages", {"text": "hello"})
+        self.store.close()
+
+        self.store = self.make_store()
+
+        self.assertEqual(self.store.get("s1", "ctx"), {"name": "Ada"})
+        self.assertEqual(self.store.read_log("s1", "messages"), [{"text": "hello"}])
+
+    def test_expired_sessions_purged_on_open(self):
+        """Test that sessions abandoned before a restart are removed on open"""
+        self.store.put("s1", "ctx", {"name": "Ada"})
+        self.store.close()
+        self.clock.now += 200
+
+        self.store = self.make_store()
+
+        self.assertEqual(self.store.session_ids(), [])
+        self.assertEqual(self.store.stats()['expirations'], 1)
+
+class TestEngineSessionState(unittest.TestCase):
+    """Test that the AIML engine and skill adapter keep their state in the store"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "sessions.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_engine_context_survives_restart(self):
+        """Test that context, transcript and predicates are restored from SQLite"""
+        from aiml_patterns.aiml_engine import AIMLEngine
+
+        store = SQLiteSessionStore(self.db_path)
+        engine = AIMLEngine(store=store)
+        engine.process_input("my name is Ada", "s1")
+        engine.process_input("I have 5 years of experience with python", "s1")
+        store.close()
+
+        store = SQLiteSessionStore(self.db_path)
+        engine = AIMLEngine(store=store)
+        context = engine.get_session_context("s1")
+        summary = engine.get_conversation_summary("s1")
+        store.close()
+
+        self.assertEqual(context['extracted_data']['name'], "Ada")
+        self.assertEqual(context['extracted_data']['experience_years'], 5)
+        self.assertEqual(len(context['messages']), 2)
+        self.assertEqual(summary['message_count'], 2)
+
+    def test_app_conversation_survives_restart(self):
+        """Test that candidate state and transcript are restored under an unexpired session token in the URL"""
+        import streamlit as st
+        from aiml_patterns.aiml_engine import AIMLEngine
+        from chatbot.aiml_conversation_manager import (
+            APP_STATE_NAMESPACE, SESSION_QUERY_PARAM, AIMLConversationManager, ConversationState
+        )
+        from config import Config
+
+        def start_replica(store):
+            st.session_state.clear()
+            manager = AIMLConversationManager(aiml_engine=AIMLEngine(store=store))
+            manager.initialize_session_state()
+            return manager
+
+        st.query_params.clear()
+        store = SQLiteSessionStore(self.db_path)
+        manager = start_replica(store)
+        token = st.query_params[SESSION_QUERY_PARAM]
+        for role, content in (("assistant", "Hi! What should I call you?"), ("user", "Ada"),
+                              ("assistant", "Great!"), ("user", "ada@example.com")):
+            st.session_state.messages.append({"role": role, "content": content})
+            st.session_state.candidate_data['full_name'] = "Ada"
+            st.session_state.conversation_state = ConversationState.COLLECTING_INFO
+            manager.save_session_state()
+
+        # Editing the first answer drops everything after it
+        st.session_state.messages = st.session_state.messages[:2]
+        st.session_state.messages[1] = {"role": "user", "content": "Ada Lovelace"}
+        manager.truncate_saved_transcript(1)
+        manager.save_session_state()
+        store.close()
+
+        store = SQLiteSessionStore(self.db_path)
+        self.assertEqual(st.query_params[SESSION_QUERY_PARAM], token)
+        manager = start_replica(store)
+        self.assertEqual(manager.session_id, f"session_{token}")
+        self.assertEqual(st.session_state.conversation_state, ConversationState.COLLECTING_INFO)
+        self.assertEqual(st.session_state.candidate_data, {'full_name': "Ada"})
+        self.assertEqual([message['content'] for message in st.session_state.messages],
+                         ["Hi! What should I call you?", "Ada Lovelace"])
+
+        # A missing or malformed token starts a new session
+        st.query_params[SESSION_QUERY_PARAM] = "../other"
+        start_replica(store)
+        self.assertNotEqual(st.query_params[SESSION_QUERY_PARAM], token)
+        self.assertEqual(st.session_state.messages, [])
+
+        # A link older than its TTL is not honoured, and the stored session is dropped
+        record = store.get(f"session_{token}", APP_STATE_NAMESPACE)
+        record['issued_at'] -= Config.SESSION_LINK_TTL_SECONDS
+        store.put(f"session_{token}", APP_STATE_NAMESPACE, record)
+        st.query_params[SESSION_QUERY_PARAM] = token
+        manager = start_replica(store)
+        self.assertNotEqual(manager.session_id, f"session_{token}")
+        self.assertEqual(st.session_state.messages, [])
+        self.assertIsNone(store.get(f"session_{token}", APP_STATE_NAMESPACE))
+        store.close()
+        st.query_params.clear()
+        st.session_state.clear()
+
+    def test_skill_adapter_summary(self):
+        """Test that the skill adapter summary is built from stored responses"""
+        from utils.skill_level_adapter import SkillLevelAdapter
+
+        adapter = SkillLevelAdapter(store=InMemorySessionStore())
+        for answer in ("I have used Python in my projects", "I architected and scaled a distributed system"):
+            result = adapter.process_response_and_adapt(answer, "Technical question", "python", "s1")
+
+        summary = adapter.get_session_summary("s1")
+        self.assertEqual(summary['total_responses'], 2)
+        self.assertEqual(len(summary['skill_progression']), 2)
+        self.assertEqual(summary['overall_skill_level'], result['overall_skill_level'])
+        self.assertEqual(adapter.get_session_summary("unknown"), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for the online skill estimator
+"""
+import unittest
+import sys
+import os
+import json
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.session_store import InMemorySessionStore
+from utils.skill_estimator import PROGRESSION_LIMIT, SkillEstimator
+from utils.skill_level_adapter import SKILL_RESPONSES_NAMESPACE, SkillLevelAdapter
+
+def analysis(level: str, confidence: float = 1.0, quality: str = 'medium',
+             depth: float = 0.5, experience: float = 0.5) -> dict:
+    return {'estimated_skill_level': level, 'confidence': confidence, 'response_quality': quality,
+            'technical_depth_score': depth, 'experience_score': experience}
+
+class TestSkillEstimator(unittest.TestCase):
+    """Test cases for SkillEstimator"""
+
+    def test_needs_two_answers(self):
+        """Test that one answer keeps the default level"""
+        estimator = SkillEstimator()
+        estimator.add(analysis('expert'))
+        self.assertEqual(estimator.overall_level, 'intermediate')
+        estimator.add(analysis('expert'))
+        self.assertEqual(estimator.overall_level, 'expert')
+
+    def test_recent_answers_dominate(self):
+        """Test that the level follows recent answers and weighs by confidence"""
+        estimator = SkillEstimator()
+        for _ in range(10):
+            estimator.add(analysis('beginner'))
+        for _ in range(6):
+            estimator.add(analysis('expert'))
+        self.assertEqual(estimator.overall_level, 'expert')
+
+        estimator.add(analysis('beginner', confidence=0.05))
+        self.assertEqual(estimator.overall_level, 'expert')
+
+    def test_insights_and_quality(self):
+        """Test the running insights and overall quality share"""
+        estimator = SkillEstimator()
+        for quality in ('low', 'high', 'high', 'high'):
+            estimator.add(analysis('advanced', quality=quality, depth=0.9, experience=0.1))
+
+        self.assertEqual(estimator.average_quality, 0.75)
+        self.assertEqual(estimator.insights(), [
+            "Consistently provides detailed, high-quality responses",
+            "Demonstrates strong technical understanding",
+            "Would benefit from sharing more practical examples"
+        ])
+        self.assertEqual(SkillEstimator().insights(), [])
+
+    def test_state_is_bounded_and_round_trips(self):
+        """Test that the saved state stays small and restores the estimate"""
+        estimator = SkillEstimator()
+        for number in range(PROGRESSION_LIMIT * 3):
+            estimator.add(analysis(('beginner', 'advanced')[number % 2], confidence=0.5))
+
+        state = json.loads(json.dumps(estimator.to_state()))
+        restored = SkillEstimator.from_state(state)
+        self.assertEqual(len(state['progression']), PROGRESSION_LIMIT)
+        self.assertEqual(restored.to_state(), estimator.to_state())
+        self.assertEqual(state['overall_skill_level'], estimator.overall_level)
+
+    def test_adapter_does_not_read_the_log(self):
+        """Test that adapting and summarizing never read the stored answers"""
+        store = InMemorySessionStore()
+        adapter = SkillLevelAdapter(store, archive_responses=True)
+        for _ in range(5):
+            result = adapter.process_response_and_adapt("I mentor the team and contribute to the internals",
+                                                        "Technical question", "python", "s1")
+
+        self.assertEqual(store.log_length("s1", SKILL_RESPONSES_NAMESPACE), 5)
+        self.assertEqual(store.read_log("s1", SKILL_RESPONSES_NAMESPACE, last=1)[0],
+                         {'response': "I mentor the team and contribute to the internals", 'technology': "python",
+                          'estimated_skill_level': result['analysis']['estimated_skill_level'].value})
+        reads = store.stats()['reads']
+        summary = adapter.get_session_summary("s1")
+        self.assertEqual(store.stats()['reads'], reads + 1)
+        self.assertEqual(summary['total_responses'], 5)
+        self.assertEqual(summary['overall_skill_level'], result['overall_skill_level'])
+        self.assertEqual(summary['session_insights'], result['session_insights'])
+
+    def test_in_memory_sessions_stay_flat(self):
+        """Test that answers are not archived in a process-local store unless asked"""
+        store = InMemorySessionStore()
+        adapter = SkillLevelAdapter(store)
+        for _ in range(20):
+            adapter.process_response_and_adapt("We used Redis for caching", "Technical question", "python", "s1")
+
+        self.assertFalse(adapter.archive_responses)
+        self.assertEqual(store.log_length("s1", SKILL_RESPONSES_NAMESPACE), 0)
+        self.assertEqual(adapter.get_session_summary("s1")['total_responses'], 20)
+
+if __name__ == '__main__':
+    unittest.main()
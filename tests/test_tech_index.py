@@ -0,0 +1,114 @@
+"""
+Unit tests for the shared technology term index
+"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.tech_index import TechTermIndex, tech_index
+from utils.tech_stack_parser import tech_stack_parser
+
+class TestTechTermIndex(unittest.TestCase):
+    """Test cases for TechTermIndex"""
+
+    def test_single_word_terms(self):
+        """Test that plain technology names are found with their category"""
+        result = tech_index.extract("I use Python, Django and PostgreSQL daily")
+
+        self.assertIn('python', result['languages'])
+        self.assertIn('django', result['frameworks'])
+        self.assertIn('postgresql', result['databases'])
+
+    def test_multi_word_terms(self):
+        """Test that multi-word terms match as a single mention"""
+        result = tech_index.extract("We ship with Spring Boot and GitHub  Actions")
+
+        self.assertIn('spring boot', result['frameworks'])
+        self.assertNotIn('spring', result['frameworks'])
+        self.assertIn('github actions', result['devops_tools'])
+        self.assertNotIn('development_tools', result)
+
+    def test_word_boundaries(self):
+        """Test that terms are not matched inside longer words"""
+        result = tech_index.extract("django gopher rustic cargo")
+
+        self.assertEqual(result, {'frameworks': ['django']})
+
+    def test_symbol_terms(self):
+        """Test terms that contain punctuation"""
+        result = tech_index.extract("C++, C# and ASP.NET")
+
+        self.assertIn('c++', result['languages'])
+        self.assertIn('c#', result['languages'])
+        self.assertNotIn('c', result['languages'])
+        self.assertIn('asp.net', result['frameworks'])
+
+    def test_spans(self):
+        """Test that match spans point back into the original text"""
+        text = "Mostly React Native these days"
+        matches = tech_index.find_all(text)
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].canonical, 'react native')
+        self.assertEqual(text[matches[0].start:matches[0].end], 'React Native')
+
+    def test_term_in_several_categories(self):
+        """Test that a term listed under two categories is reported for both"""
+        result = tech_index.extract("prometheus")
+
+        self.assertIn('prometheus', result['databases'])
+        self.assertIn('prometheus', result['devops_tools'])
+
+    def test_custom_catalog(self):
+        """Test building an index from an arbitrary catalog"""
+        index = TechTermIndex({'languages': ['go'], 'frameworks': ['go kit']})
+
+        self.assertEqual(index.term_count, 2)
+        self.assertEqual(index.extract("go kit"), {'frameworks': ['go kit']})
+        self.assertEqual(index.extract("go, kit"), {'languages': ['go']})
+
+    def test_aliases_resolve_to_canonical(self):
+        """Test that aliases report the canonical technology"""
+        result = tech_index.extract("node, Node.js, postgres and k8s")
+
+        self.assertEqual(result['frameworks'], ['nodejs'])
+        self.assertEqual(result['databases'], ['postgresql'])
+        self.assertEqual(result['devops_tools'], ['kubernetes'])
+
+class TestTechStackParser(unittest.TestCase):
+    """Test cases for TechStackParser"""
+
+    def test_parse_result(self):
+        """Test the normalized parse result"""
+        parsed = tech_stack_parser.parse("Python with Django, postgres")
+
+        self.assertTrue(parsed)
+        self.assertEqual(parsed.technologies, frozenset({'python', 'django', 'postgresql'}))
+        self.assertEqual(parsed.categories, ('languages', 'frameworks', 'databases'))
+        self.assertEqual(parsed.by_category()['databases'], ['Postgresql'])
+
+    def test_parse_is_memoized(self):
+        """Test that the same text is only matched once"""
+        text = "memoized parse of rust and go"
+        first = tech_stack_parser.parse(text)
+        second = tech_stack_parser.parse(text)
+
+        self.assertIs(first, second)
+
+    def test_by_category_returns_fresh_dict(self):
+        """Test that callers can mutate the result without affecting the cache"""
+        text = "python"
+        tech_stack_parser.parse(text).by_category()['languages'].append('Ruby')
+
+        self.assertEqual(tech_stack_parser.parse(text).by_category(), {'languages': ['Python']})
+
+    def test_empty_text(self):
+        """Test parsing text without technologies"""
+        self.assertFalse(tech_stack_parser.parse("I like long walks"))
+        self.assertFalse(tech_stack_parser.parse(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Bulk re-analysis of technical answers
+
+Re-runs ResponseAnalyzer.analyze_response (and the answer-quality label of
+AIMLConversationManager.analyze_response_quality) over many answers at once,
+e.g. the whole skill-response archive after an indicator list or threshold
+was tuned. Each answer is scanned once and both analyses are computed from
+that scan by the analyzer itself, so the batch results cannot drift from the
+live ones. Answers are streamed from the session store chunk by chunk to
+bound memory.
+"""
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+
+from utils.session_store import SessionStore, session_store
+from utils.skill_level_adapter import (
+    SKILL_RESPONSES_NAMESPACE, ResponseAnalyzer, response_analyzer
+)
+
+# Answers per chunk when streaming from the session store
+DEFAULT_CHUNK_SIZE = 5000
+
+COLUMNS = ('estimated_skill_level', 'confidence', 'technical_depth_score', 'experience_score',
+           'response_quality', 'key_insights', 'suggested_follow_up_type', 'word_count',
+           'answer_skill_level', 'answer_technical_score', 'answer_experience_score')
+
+
+class BatchResponseAnalyzer:
+    """Runs ResponseAnalyzer.analyze_response over many answers"""
+
+    def __init__(self, analyzer: Optional[ResponseAnalyzer] = None):
+        self.analyzer = analyzer or response_analyzer
+
+    def analyze(self, responses: Iterable[str]) -> pd.DataFrame:
+        """Analyze a batch of answers
+
+        Returns one row per answer with the fields of analyze_response (skill
+        levels by value), its word count, and the answer-quality label and
+        scores of ResponseAnalyzer.answer_quality.
+        """
+        analyzer = self.analyzer
+        rows = []
+        for response in responses:
+            response = str(response or '')
+            scan = analyzer.scan(response)
+            analysis = analyzer.analyze_response(response, scan=scan)
+            quality = analyzer.answer_quality(response, scan=scan)
+            rows.append((
+                analysis['estimated_skill_level'].value, analysis['confidence'],
+                analysis['technical_depth_score'], analysis['experience_score'],
+                analysis['response_quality'], analysis['key_insights'],
+                analysis['suggested_follow_up_type'], scan['word_count'],
+                quality['skill_level'], quality['technical_score'], quality['experience_score']
+            ))
+        return pd.DataFrame(rows, columns=list(COLUMNS))
+
+    def analyze_store(self, store: Optional[SessionStore] = None,
+                      namespace: str = SKILL_RESPONSES_NAMESPACE,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Re-analyze every stored answer, one DataFrame per chunk
+
+        Each frame also carries session_id, technology and the skill level
+        stored when the answer was first analyzed, for comparison.
+        """
+        for chunk in (store or session_store).scan_log(namespace, chunk_size):
+            entries = [entry for _, entry in chunk]
+            frame = self.analyze(entry.get('response', '') for entry in entries)
+            frame.insert(0, 'session_id', [session_id for session_id, _ in chunk])
+            frame.insert(1, 'technology', [entry.get('technology') for entry in entries])
+            # Older entries kept the whole analysis dict
+            frame['stored_skill_level'] = [entry.get('estimated_skill_level',
+                                                     (entry.get('analysis') or {}).get('estimated_skill_level'))
+                                           for entry in entries]
+            yield frame
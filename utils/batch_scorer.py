@@ -0,0 +1,215 @@
+"""
+Bulk candidate scoring over DataFrames
+
+Scores thousands of candidates at once with the same rules as
+CandidateScorer.generate_comprehensive_score. Every candidate's tech stack
+is turned into a row of a sparse (coordinate-format) incidence matrix over
+the technology IDs seen in the batch. Tier points, tier counts, full-stack
+flags and role-fit matches then become matrix-vector products, and the
+remaining rules become NumPy comparisons over whole columns.
+"""
+import json
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.candidate_scorer import CandidateScorer
+
+# Neutral communication score, as the per-candidate scorer gives without enough messages
+DEFAULT_COMMUNICATION_SCORE = 5
+
+TIER_NAMES = ('tier_1', 'tier_2', 'tier_3')
+
+
+def _as_tech_stack(value: Any) -> Dict[str, List[str]]:
+    """Tech stack from a dict, a JSON string (e.g. read from CSV) or a missing value"""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value.strip():
+        return json.loads(value)
+    return {}
+
+
+def _round_like_python(values: np.ndarray, digits: int) -> np.ndarray:
+    """np.round, except near-ties (e.g. 4.65) are rounded by round() as the per-candidate scorer does"""
+    rounded = np.round(values, digits)
+    scaled = values * 10 ** digits
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-9)
+    rounded[ties] = [round(value, digits) for value in values[ties].tolist()]
+    return rounded
+
+
+class _Incidence:
+    """Sparse candidate x technology incidence matrix in coordinate form
+
+    One entry per listed technology: its candidate row, its (category,
+    technology) pair ID and its technology ID. Products with a weight vector
+    are bincounts over the rows, so memory grows with the entries rather
+    than candidates x distinct technologies.
+    """
+
+    def __init__(self, size: int, rows: np.ndarray, pair_codes: np.ndarray, pairs: List[Tuple[str, str]],
+                 tech_codes: np.ndarray, techs: List[str]):
+        self.size = size
+        self.rows = rows
+        self.pair_codes = pair_codes
+        self.pairs = pairs
+        self.techs = techs
+        # Role and full-stack rules count a technology once per candidate, whatever its category
+        unique_keys = pd.unique(rows * max(len(techs), 1) + tech_codes)
+        self.unique_rows = unique_keys // max(len(techs), 1)
+        self.unique_techs = unique_keys % max(len(techs), 1)
+
+    def count_pairs(self, weights: np.ndarray) -> np.ndarray:
+        """Per candidate: sum of weights over every (category, technology) entry"""
+        return np.bincount(self.rows, weights=weights[self.pair_codes],
+                           minlength=self.size).astype(weights.dtype)
+
+    def count_techs(self, weights: np.ndarray) -> np.ndarray:
+        """Per candidate: sum of weights over its distinct technologies"""
+        return np.bincount(self.unique_rows, weights=weights[self.unique_techs],
+                           minlength=self.size).astype(weights.dtype)
+
+
+class BatchCandidateScorer:
+    """Vectorized counterpart of CandidateScorer for candidate pools"""
+
+    def __init__(self, scorer: Optional[CandidateScorer] = None):
+        self.scorer = scorer or CandidateScorer()
+        self.weights = self.scorer.scoring_weights
+
+    def _incidence(self, tech_stacks: List[Dict[str, List[str]]]) -> '_Incidence':
+        """Build the candidate x technology incidence matrix of a batch"""
+        lists = [technologies for tech_stack in tech_stacks for technologies in tech_stack.values()]
+        list_lengths = np.fromiter(map(len, lists), dtype=np.intp, count=len(lists))
+        list_rows = np.repeat(np.arange(len(tech_stacks)), [len(tech_stack) for tech_stack in tech_stacks])
+        category_codes, categories = pd.factorize(
+            np.array([category for tech_stack in tech_stacks for category in tech_stack], dtype=object)
+        )
+
+        # Factorize the raw names, then canonicalize only the distinct ones
+        raw_codes, raw_techs = pd.factorize(np.fromiter(chain.from_iterable(lists), dtype=object))
+        lower_codes, techs = pd.factorize(np.array([self.scorer.canonical_tech(str(tech)) for tech in raw_techs],
+                                                   dtype=object))
+        tech_codes = lower_codes[raw_codes] if len(raw_codes) else raw_codes
+
+        rows = np.repeat(list_rows, list_lengths)
+        pair_keys = np.repeat(category_codes, list_lengths) * len(techs) + tech_codes
+        pair_codes, pair_values = pd.factorize(pair_keys)
+        pairs = [(categories[key // len(techs)], techs[key % len(techs)]) for key in pair_values.tolist()]
+        return _Incidence(len(tech_stacks), rows, pair_codes, pairs, tech_codes, list(techs))
+
+    def _tech_weights(self, incidence: '_Incidence', technologies: frozenset) -> np.ndarray:
+        return np.array([tech in technologies for tech in incidence.techs], dtype=np.int32)
+
+    def score(self, candidates: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> pd.DataFrame:
+        """Score a pool of candidates
+
+        candidates has the candidate_data fields experience_years, tech_stack
+        and desired_position. An optional communication_score column is used
+        as is; otherwise an optional messages column is scored per candidate.
+        Returns one row per candidate (same index) with component scores,
+        total_score and grade.
+        """
+        frame = candidates if isinstance(candidates, pd.DataFrame) else pd.DataFrame.from_records(list(candidates))
+        count = len(frame)
+
+        def column(name: str, default: Any) -> pd.Series:
+            return frame[name] if name in frame else pd.Series([default] * count, index=frame.index)
+
+        tech_stacks = [_as_tech_stack(value) for value in column('tech_stack', None)]
+        experience = pd.to_numeric(column('experience_years', 0), errors='coerce').fillna(0).astype(int).to_numpy()
+        positions = column('desired_position', 'Developer').fillna('Developer').astype(str).str.lower()
+
+        # Experience
+        exp_conditions = [experience >= min_years for min_years, _, _ in self.scorer.experience_levels]
+        exp_score = np.select(exp_conditions, [score for _, score, _ in self.scorer.experience_levels],
+                              default=self.scorer.entry_level[0])
+        exp_level = np.select(exp_conditions, [level for _, _, level in self.scorer.experience_levels],
+                              default=self.scorer.entry_level[1])
+
+        # Tech stack breadth and depth
+        incidence = self._incidence(tech_stacks)
+        pair_tiers = [self.scorer.tier_index.get(pair, (None, 0)) for pair in incidence.pairs]
+        pair_points = np.array([points for _, points in pair_tiers], dtype=np.int32)
+        tier_counts = [incidence.count_pairs(np.array([tier == tier_name for tier, _ in pair_tiers], dtype=np.int32))
+                       for tier_name in TIER_NAMES]
+
+        modern_stack = tier_counts[0] >= 3
+        depth_score = np.minimum(incidence.count_pairs(pair_points) + 5 * modern_stack, 10)
+
+        categories_covered = np.array([len(tech_stack) for tech_stack in tech_stacks], dtype=np.int32)
+        has_database = np.array([bool(tech_stack.get('databases')) for tech_stack in tech_stacks], dtype=bool)
+        has_frontend = incidence.count_techs(self._tech_weights(incidence, self.scorer.frontend_markers)) > 0
+        has_backend = incidence.count_techs(self._tech_weights(incidence, self.scorer.backend_markers)) > 0
+        full_stack = has_frontend & has_backend & has_database
+        breadth_score = np.minimum(np.minimum(categories_covered * 2, 10) + 3 * full_stack, 10)
+
+        # Role fit: the first role type named in the position decides the rules
+        fit_score = np.full(count, 5.0)
+        role_type = np.full(count, 'general', dtype=object)
+        unmatched = np.ones(count, dtype=bool)
+        for role, min_experience, required_techs, bonus_techs, leadership_keywords in self.scorer.role_rules:
+            matched = unmatched & positions.str.contains(role, regex=False).to_numpy()
+            unmatched &= ~matched
+            if not matched.any():
+                continue
+            role_type[matched] = role
+
+            role_score = 5.0 + 2 * (experience >= min_experience)
+            if required_techs is not None:
+                matches = incidence.count_techs(self._tech_weights(incidence, required_techs))
+                role_score = role_score + np.minimum(matches * 1.5, 4)
+            if bonus_techs is not None:
+                bonus = incidence.count_techs(self._tech_weights(incidence, bonus_techs))
+                role_score = role_score + np.minimum(bonus, 2)
+            if leadership_keywords:
+                leads = np.zeros(count, dtype=bool)
+                for keyword in leadership_keywords:
+                    leads |= positions.str.contains(keyword, regex=False).to_numpy()
+                role_score = role_score + 2 * (leads & (experience >= 5))
+            fit_score = np.where(matched, role_score, fit_score)
+        fit_score = np.minimum(fit_score, 10)
+
+        # Communication
+        if 'communication_score' in frame:
+            comm_score = frame['communication_score'].fillna(DEFAULT_COMMUNICATION_SCORE).to_numpy(dtype=float)
+        elif 'messages' in frame:
+            comm_score = np.array([self.scorer.calculate_communication_score(messages or [])[0]
+                                   for messages in frame['messages']], dtype=float)
+        else:
+            comm_score = np.full(count, float(DEFAULT_COMMUNICATION_SCORE))
+
+        total_score = (
+            exp_score * self.weights['experience'] +
+            breadth_score * self.weights['tech_stack_breadth'] +
+            depth_score * self.weights['tech_stack_depth'] +
+            comm_score * self.weights['communication'] +
+            fit_score * self.weights['role_fit']
+        )
+        grade = np.select([total_score >= min_score for min_score, _ in self.scorer.grade_thresholds],
+                          [grade for _, grade in self.scorer.grade_thresholds],
+                          default=self.scorer.lowest_grade)
+
+        return pd.DataFrame({
+            'total_score': _round_like_python(total_score, 1),
+            'grade': grade,
+            'experience_level': exp_level,
+            'experience': exp_score,
+            'tech_breadth': breadth_score,
+            'tech_depth': depth_score,
+            'communication': comm_score,
+            'role_fit': fit_score,
+            'role_type': role_type,
+            'tier_1_count': tier_counts[0],
+            'tier_2_count': tier_counts[1],
+            'tier_3_count': tier_counts[2],
+            'modern_stack': modern_stack,
+            'full_stack': full_stack
+        }, index=frame.index)
+
+    def rank(self, candidates: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> pd.DataFrame:
+        """Scores sorted best first"""
+        return self.score(candidates).sort_values('total_score', ascending=False, kind='stable')
@@ -1,9 +1,13 @@
 """
 Advanced candidate scoring and analysis system
 """
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 import re
 from datetime import datetime
+from types import MappingProxyType
+
+from config import Config
+from utils.communication_stats import CommunicationStats
 
 class CandidateScorer:
     """Advanced scoring system for candidate evaluation"""
@@ -41,19 +45,101 @@ class CandidateScorer:
                 'score': 5
             }
         }
+        
+        # Role types are matched against the desired position in this order
+        self.role_requirements = {
+            'senior': {
+                'min_experience': 5,
+                'required_techs': ['python', 'java', 'javascript', 'react', 'django'],
+                'leadership_keywords': ['lead', 'senior', 'architect', 'principal']
+            },
+            'full stack': {
+                'min_experience': 2,
+                'required_categories': ['languages', 'frameworks', 'databases'],
+                'full_stack_techs': ['react', 'vue', 'angular', 'django', 'spring', 'nodejs']
+            },
+            'frontend': {
+                'min_experience': 1,
+                'required_techs': ['javascript', 'react', 'vue', 'angular', 'typescript'],
+                'bonus_techs': ['css', 'html', 'webpack', 'sass']
+            },
+            'backend': {
+                'min_experience': 1,
+                'required_techs': ['python', 'java', 'django', 'spring', 'fastapi', 'nodejs'],
+                'bonus_techs': ['postgresql', 'mongodb', 'redis', 'docker']
+            },
+            'devops': {
+                'min_experience': 2,
+                'required_techs': ['docker', 'kubernetes', 'aws', 'azure', 'terraform'],
+                'bonus_techs': ['jenkins', 'ansible', 'nginx']
+            }
+        }
+        
+        # Technologies that mark the frontend/backend halves of a full stack
+        self.frontend_techs = ['react', 'vue', 'angular', 'javascript', 'typescript']
+        self.backend_techs = ['python', 'java', 'django', 'spring', 'fastapi']
+        
+        # (minimum years, score, level), highest first
+        self.experience_levels = [
+            (8, 10, "Senior+"),
+            (5, 8, "Senior"),
+            (3, 6, "Mid-level"),
+            (1, 4, "Junior+")
+        ]
+        self.entry_level = (2, "Entry-level")
+        
+        # (minimum total score, grade), highest first
+        self.grade_thresholds = [
+            (9.0, 'A+'), (8.5, 'A'), (8.0, 'A-'), (7.5, 'B+'), (7.0, 'B'),
+            (6.5, 'B-'), (6.0, 'C+'), (5.5, 'C')
+        ]
+        self.lowest_grade = 'C-'
+        
+        self.compile_rules()
+    
+    def compile_rules(self):
+        """Compile the tables above into read-only lookups used while scoring
+        
+        Call again after changing tech_tiers, role_requirements or the
+        frontend/backend lists.
+        """
+        # (category, technology) -> (tier, points); the first tier listing a technology wins
+        tier_index = {}
+        for tier_name, tier_data in self.tech_tiers.items():
+            for category, technologies in tier_data.items():
+                if category != 'score':
+                    for tech in technologies:
+                        tier_index.setdefault((category, tech), (tier_name, tier_data['score']))
+        self.tier_index = MappingProxyType(tier_index)
+        self.tier_count_keys = MappingProxyType({tier_name: f"{tier_name}_count" for tier_name in self.tech_tiers})
+        
+        self.role_rules = tuple(
+            (role_type, requirements.get('min_experience', 0),
+             frozenset(requirements['required_techs']) if 'required_techs' in requirements else None,
+             frozenset(requirements['bonus_techs']) if 'bonus_techs' in requirements else None,
+             tuple(requirements.get('leadership_keywords', ())))
+            for role_type, requirements in self.role_requirements.items()
+        )
+        self.frontend_markers = frozenset(self.frontend_techs)
+        self.backend_markers = frozenset(self.backend_techs)
+        self.aliases = MappingProxyType(dict(Config.TECHNOLOGY_ALIASES))
+    
+    def canonical_tech(self, tech: str) -> str:
+        """Lowercased technology name with aliases (node, postgres, k8s...) resolved"""
+        tech_lower = tech.lower()
+        return self.aliases.get(tech_lower, tech_lower)
+    
+    def _tech_set(self, tech_stack: Dict[str, List[str]]) -> set:
+        aliases = self.aliases
+        return {aliases.get(tech_lower, tech_lower)
+                for techs in tech_stack.values() for tech_lower in map(str.lower, techs)}
     
     def calculate_experience_score(self, years: int) -> Tuple[int, str]:
         """Calculate experience score and level"""
-        if years >= 8:
-            return 10, "Senior+"
-        elif years >= 5:
-            return 8, "Senior"
-        elif years >= 3:
-            return 6, "Mid-level"
-        elif years >= 1:
-            return 4, "Junior+"
-        else:
-            return 2, "Entry-level"
+        for min_years, score, level in self.experience_levels:
+            if years >= min_years:
+                return score, level
+        return self.entry_level
     
     def calculate_tech_stack_score(self, tech_stack: Dict[str, List[str]]) -> Tuple[int, int, Dict]:
         """Calculate tech stack breadth and depth scores"""
@@ -70,24 +156,20 @@ class CandidateScorer:
         }
         
         # Count technologies by tier
+        aliases = self.aliases
+        tier_index = self.tier_index
+        count_keys = self.tier_count_keys
+        all_techs = set()
         for category, technologies in tech_stack.items():
+            tech_analysis['total_technologies'] += len(technologies)
             for tech in technologies:
                 tech_lower = tech.lower()
-                tech_analysis['total_technologies'] += 1
-                
-                # Check which tier this technology belongs to
-                for tier_name, tier_data in self.tech_tiers.items():
-                    if tech_lower in tier_data.get(category, []):
-                        if tier_name == 'tier_1':
-                            tech_analysis['tier_1_count'] += 1
-                            depth_score += 10
-                        elif tier_name == 'tier_2':
-                            tech_analysis['tier_2_count'] += 1
-                            depth_score += 7
-                        elif tier_name == 'tier_3':
-                            tech_analysis['tier_3_count'] += 1
-                            depth_score += 5
-                        break
+                tech_name = aliases.get(tech_lower, tech_lower)
+                all_techs.add(tech_name)
+                tier = tier_index.get((category, tech_name))
+                if tier:
+                    tech_analysis[count_keys[tier[0]]] += 1
+                    depth_score += tier[1]
         
         # Calculate breadth score (diversity of technologies)
         breadth_score = min(tech_analysis['categories_covered'] * 2, 10)
@@ -98,10 +180,8 @@ class CandidateScorer:
             depth_score += 5
         
         # Bonus for full-stack capabilities
-        has_frontend = any(tech.lower() in ['react', 'vue', 'angular', 'javascript', 'typescript'] 
-                          for techs in tech_stack.values() for tech in techs)
-        has_backend = any(tech.lower() in ['python', 'java', 'django', 'spring', 'fastapi'] 
-                         for techs in tech_stack.values() for tech in techs)
+        has_frontend = not self.frontend_markers.isdisjoint(all_techs)
+        has_backend = not self.backend_markers.isdisjoint(all_techs)
         has_database = 'databases' in tech_stack and len(tech_stack['databases']) > 0
         
         if has_frontend and has_backend and has_database:
@@ -112,90 +192,12 @@ class CandidateScorer:
     
     def calculate_communication_score(self, messages: List[Dict]) -> Tuple[int, Dict]:
         """Analyze communication quality from conversation"""
-        if len(messages) < 4:  # Not enough data
-            return 5, {'insufficient_data': True}
-        
-        user_messages = [msg['content'] for msg in messages if msg['role'] == 'user']
-        
-        analysis = {
-            'avg_response_length': 0,
-            'detailed_responses': 0,
-            'professional_tone': 0,
-            'technical_depth': 0
-        }
-        
-        total_length = 0
-        for message in user_messages:
-            length = len(message.split())
-            total_length += length
-            
-            # Detailed responses (more than 10 words)
-            if length > 10:
-                analysis['detailed_responses'] += 1
-            
-            # Professional indicators
-            professional_indicators = ['experience', 'project', 'worked', 'developed', 'implemented']
-            if any(indicator in message.lower() for indicator in professional_indicators):
-                analysis['professional_tone'] += 1
-            
-            # Technical depth indicators
-            technical_indicators = ['algorithm', 'architecture', 'performance', 'optimization', 'design']
-            if any(indicator in message.lower() for indicator in technical_indicators):
-                analysis['technical_depth'] += 1
-        
-        analysis['avg_response_length'] = total_length / len(user_messages) if user_messages else 0
-        
-        # Calculate score
-        score = 5  # Base score
-        
-        if analysis['avg_response_length'] > 15:
-            score += 2
-        elif analysis['avg_response_length'] > 8:
-            score += 1
-        
-        if analysis['detailed_responses'] > len(user_messages) * 0.6:
-            score += 2
-        
-        if analysis['professional_tone'] > 0:
-            score += 1
-        
-        if analysis['technical_depth'] > 0:
-            score += 2
-        
-        return min(score, 10), analysis
+        return CommunicationStats.from_messages(messages).score()
     
     def calculate_role_fit_score(self, desired_position: str, tech_stack: Dict, experience: int) -> Tuple[int, Dict]:
         """Calculate how well candidate fits desired role"""
         position_lower = desired_position.lower()
         
-        role_requirements = {
-            'senior': {
-                'min_experience': 5,
-                'required_techs': ['python', 'java', 'javascript', 'react', 'django'],
-                'leadership_keywords': ['lead', 'senior', 'architect', 'principal']
-            },
-            'full stack': {
-                'min_experience': 2,
-                'required_categories': ['languages', 'frameworks', 'databases'],
-                'full_stack_techs': ['react', 'vue', 'angular', 'django', 'spring', 'node']
-            },
-            'frontend': {
-                'min_experience': 1,
-                'required_techs': ['javascript', 'react', 'vue', 'angular', 'typescript'],
-                'bonus_techs': ['css', 'html', 'webpack', 'sass']
-            },
-            'backend': {
-                'min_experience': 1,
-                'required_techs': ['python', 'java', 'django', 'spring', 'fastapi', 'node'],
-                'bonus_techs': ['postgresql', 'mongodb', 'redis', 'docker']
-            },
-            'devops': {
-                'min_experience': 2,
-                'required_techs': ['docker', 'kubernetes', 'aws', 'azure', 'terraform'],
-                'bonus_techs': ['jenkins', 'ansible', 'nginx']
-            }
-        }
-        
         fit_analysis = {
             'role_type': 'general',
             'experience_match': False,
@@ -207,32 +209,31 @@ class CandidateScorer:
         score = 5  # Base score
         
         # Determine role type
-        for role_type in role_requirements:
+        for role_type, min_experience, required_techs, bonus_techs, leadership_keywords in self.role_rules:
             if role_type in position_lower:
                 fit_analysis['role_type'] = role_type
-                requirements = role_requirements[role_type]
                 
                 # Check experience requirement
-                if experience >= requirements.get('min_experience', 0):
+                if experience >= min_experience:
                     fit_analysis['experience_match'] = True
                     score += 2
                 
                 # Check required technologies
-                all_techs = [tech.lower() for techs in tech_stack.values() for tech in techs]
+                all_techs = self._tech_set(tech_stack)
                 
-                if 'required_techs' in requirements:
-                    matches = sum(1 for tech in requirements['required_techs'] if tech in all_techs)
+                if required_techs is not None:
+                    matches = len(required_techs & all_techs)
                     fit_analysis['tech_match_count'] = matches
                     score += min(matches * 1.5, 4)
                 
-                if 'bonus_techs' in requirements:
-                    bonus_matches = sum(1 for tech in requirements['bonus_techs'] if tech in all_techs)
+                if bonus_techs is not None:
+                    bonus_matches = len(bonus_techs & all_techs)
                     fit_analysis['bonus_tech_count'] = bonus_matches
                     score += min(bonus_matches, 2)
                 
                 # Check seniority keywords
-                if 'leadership_keywords' in requirements:
-                    if any(keyword in position_lower for keyword in requirements['leadership_keywords']):
+                if leadership_keywords:
+                    if any(keyword in position_lower for keyword in leadership_keywords):
                         fit_analysis['seniority_match'] = experience >= 5
                         if fit_analysis['seniority_match']:
                             score += 2
@@ -241,8 +242,12 @@ class CandidateScorer:
         
         return min(score, 10), fit_analysis
     
-    def generate_comprehensive_score(self, candidate_data: Dict, messages: List[Dict]) -> Dict:
-        """Generate comprehensive candidate score and analysis"""
+    def generate_comprehensive_score(self, candidate_data: Dict, messages: List[Dict],
+                                     communication_stats: Optional[CommunicationStats] = None) -> Dict:
+        """Generate comprehensive candidate score and analysis
+        
+        Pass the conversation's running communication_stats to skip rescanning messages.
+        """
         if not candidate_data:
             return {'error': 'No candidate data available'}
         
@@ -254,7 +259,10 @@ class CandidateScorer:
         # Calculate individual scores
         exp_score, exp_level = self.calculate_experience_score(experience)
         breadth_score, depth_score, tech_analysis = self.calculate_tech_stack_score(tech_stack)
-        comm_score, comm_analysis = self.calculate_communication_score(messages)
+        if communication_stats is not None:
+            comm_score, comm_analysis = communication_stats.score()
+        else:
+            comm_score, comm_analysis = self.calculate_communication_score(messages)
         fit_score, fit_analysis = self.calculate_role_fit_score(desired_position, tech_stack, experience)
         
         # Calculate weighted total score
@@ -294,24 +302,10 @@ class CandidateScorer:
     
     def _score_to_grade(self, score: float) -> str:
         """Convert numerical score to letter grade"""
-        if score >= 9.0:
-            return 'A+'
-        elif score >= 8.5:
-            return 'A'
-        elif score >= 8.0:
-            return 'A-'
-        elif score >= 7.5:
-            return 'B+'
-        elif score >= 7.0:
-            return 'B'
-        elif score >= 6.5:
-            return 'B-'
-        elif score >= 6.0:
-            return 'C+'
-        elif score >= 5.5:
-            return 'C'
-        else:
-            return 'C-'
+        for min_score, grade in self.grade_thresholds:
+            if score >= min_score:
+                return grade
+        return self.lowest_grade
     
     def _generate_recommendations(self, exp_score, breadth_score, depth_score, 
                                 comm_score, fit_score, tech_analysis, 
@@ -340,4 +334,7 @@ class CandidateScorer:
         elif fit_score < 6:
             recommendations.append("💡 May need additional skills for desired role")
         
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+# Global instance
+candidate_scorer = CandidateScorer()
@@ -0,0 +1,109 @@
+"""
+Running communication statistics for a conversation
+
+CandidateScorer.calculate_communication_score used to re-split and re-scan
+the whole transcript on every render. CommunicationStats is updated once as
+each message is appended, so scoring is O(1) however long the interview.
+"""
+import re
+from typing import Dict, Iterable, Tuple
+
+# Substrings that mark a professional or a technically deep answer
+PROFESSIONAL_INDICATORS = ('experience', 'project', 'worked', 'developed', 'implemented')
+TECHNICAL_INDICATORS = ('algorithm', 'architecture', 'performance', 'optimization', 'design')
+
+# Answers longer than this many words count as detailed
+DETAILED_RESPONSE_WORDS = 10
+
+# Fewer messages (of any role) than this are not enough to judge
+MIN_MESSAGES = 4
+
+_INDICATOR_KINDS = dict.fromkeys(PROFESSIONAL_INDICATORS, 'professional_tone')
+_INDICATOR_KINDS.update(dict.fromkeys(TECHNICAL_INDICATORS, 'technical_depth'))
+
+# A lookahead alternation finds every indicator, overlapping ones included, in one pass
+_INDICATOR_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(indicator) for indicator in _INDICATOR_KINDS) + '))'
+)
+
+
+def indicator_hits(text: str) -> Tuple[bool, bool]:
+    """Whether text contains a professional and a technical indicator"""
+    found = set()
+    for match in _INDICATOR_PATTERN.finditer(text.lower()):
+        found.add(_INDICATOR_KINDS[match.group(1)])
+        if len(found) == 2:
+            break
+    return 'professional_tone' in found, 'technical_depth' in found
+
+
+class CommunicationStats:
+    """Accumulates per-message counts for the communication score"""
+
+    def __init__(self):
+        self.message_count = 0
+        self.user_messages = 0
+        self.total_words = 0
+        self.detailed_responses = 0
+        self.professional_tone = 0
+        self.technical_depth = 0
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[Dict]) -> 'CommunicationStats':
+        """Stats for an existing transcript"""
+        stats = cls()
+        for message in messages:
+            stats.add(message)
+        return stats
+
+    def add(self, message: Dict):
+        """Account for one appended chat message"""
+        self.message_count += 1
+        if message['role'] != 'user':
+            return
+
+        content = message['content']
+        words = len(content.split())
+        self.user_messages += 1
+        self.total_words += words
+        if words > DETAILED_RESPONSE_WORDS:
+            self.detailed_responses += 1
+
+        professional, technical = indicator_hits(content)
+        self.professional_tone += professional
+        self.technical_depth += technical
+
+    @property
+    def average_words(self) -> float:
+        """Mean words per user message"""
+        return self.total_words / self.user_messages if self.user_messages else 0
+
+    def score(self) -> Tuple[int, Dict]:
+        """Communication score and analysis, as CandidateScorer reports them"""
+        if self.message_count < MIN_MESSAGES:
+            return 5, {'insufficient_data': True}
+
+        analysis = {
+            'avg_response_length': self.average_words,
+            'detailed_responses': self.detailed_responses,
+            'professional_tone': self.professional_tone,
+            'technical_depth': self.technical_depth
+        }
+
+        score = 5  # Base score
+
+        if analysis['avg_response_length'] > 15:
+            score += 2
+        elif analysis['avg_response_length'] > 8:
+            score += 1
+
+        if analysis['detailed_responses'] > self.user_messages * 0.6:
+            score += 2
+
+        if analysis['professional_tone'] > 0:
+            score += 1
+
+        if analysis['technical_depth'] > 0:
+            score += 2
+
+        return min(score, 10), analysis
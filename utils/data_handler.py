@@ -33,34 +33,10 @@ class CandidateDataHandler:
             return None
     
     def parse_tech_stack(self, tech_stack_text: str) -> Dict[str, List[str]]:
-        """Parse and categorize tech stack from text - optimized for speed"""
-        from config import Config
-        
-        tech_stack_text = tech_stack_text.lower()
-        # Initialize all categories from config
-        categorized = {}
-        for category in Config.COMMON_TECHNOLOGIES.keys():
-            categorized[category] = []
-        
-        # Faster lookup using sets
-        tech_lookup = {}
-        for category, technologies in Config.COMMON_TECHNOLOGIES.items():
-            for tech in technologies:
-                tech_lookup[tech] = category
-        
-        # Split input and check each word
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#.]*\b', tech_stack_text)
-        found_techs = set()
-        
-        for word in words:
-            word_lower = word.lower()
-            if word_lower in tech_lookup and word_lower not in found_techs:
-                category = tech_lookup[word_lower]
-                categorized[category].append(word_lower.title())
-                found_techs.add(word_lower)
+        """Parse and categorize tech stack from text using the shared parser"""
+        from utils.tech_stack_parser import tech_stack_parser
         
-        # Return only non-empty categories
-        return {k: v for k, v in categorized.items() if v}
+        return tech_stack_parser.parse(tech_stack_text).by_category()
     
     def store_candidate_info(self, field: str, value: Any) -> bool:
         """Store candidate information with validation"""
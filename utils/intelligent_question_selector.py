@@ -3,22 +3,15 @@ Intelligent Question Selection System
 Selects optimal questions based on candidate profile, experience, and industry
 """
 import random
-from typing import Dict, List, Tuple, Any
-from knowledge_base.advanced_questions import (
-    ADVANCED_QUESTION_BANK, 
-    INDUSTRY_QUESTIONS, 
-    BEHAVIORAL_QUESTIONS,
-    get_questions_by_experience_and_tech,
-    get_system_design_questions,
-    get_industry_questions,
-    get_behavioral_questions
-)
+from typing import Dict, List, Optional, Tuple, Any
 from knowledge_base.industry_profiles import get_industry_profile, get_role_requirements
+from utils.question_store import QuestionStore, question_store
 
 class IntelligentQuestionSelector:
     """Advanced question selection based on candidate profile"""
     
-    def __init__(self):
+    def __init__(self, store: Optional[QuestionStore] = None):
+        self.store = store or question_store
         self.experience_levels = {
             (0, 1): 'junior',
             (1, 3): 'mid',
@@ -69,19 +62,22 @@ class IntelligentQuestionSelector:
         # 1. Technical Questions (Primary Technologies)
         primary_techs = self._get_primary_technologies(tech_stack)
         for tech in primary_techs[:3]:  # Focus on top 3 technologies
-            tech_questions = get_questions_by_experience_and_tech(tech, experience_level, 2)
+            tech_questions = self.store.questions(bank='advanced', category='technical',
+                                                  technology=tech.lower(), difficulty=experience_level)[:2]
             if tech_questions:
                 selected_questions[f"{tech}_technical"] = tech_questions
         
         # 2. System Design Questions (Mid+ level)
         if experience_level in ['mid', 'senior', 'architect']:
-            system_questions = get_system_design_questions(experience_level, 2)
+            system_questions = self.store.questions(bank='advanced', category='system_design',
+                                                    difficulty=experience_level)[:2]
             if system_questions:
                 selected_questions['system_design'] = system_questions
         
         # 3. Industry-Specific Questions
         if industry != 'general':
-            industry_questions = get_industry_questions(industry, 2)
+            industry_questions = self.store.questions(bank='advanced', category='industry',
+                                                      industry=industry)[:2]
             if industry_questions:
                 selected_questions['industry_specific'] = industry_questions
         
@@ -128,16 +124,15 @@ class IntelligentQuestionSelector:
         # Determine behavioral focus based on position
         if any(keyword in position_lower for keyword in ['senior', 'lead', 'principal', 'architect']):
             # Leadership and problem-solving focus
-            questions = []
-            questions.extend(get_behavioral_questions('leadership', 1))
-            questions.extend(get_behavioral_questions('problem_solving', 1))
-            return questions[:count]
+            topics = ['leadership', 'problem_solving']
         else:
             # Communication and adaptability focus
-            questions = []
-            questions.extend(get_behavioral_questions('communication', 1))
-            questions.extend(get_behavioral_questions('adaptability', 1))
-            return questions[:count]
+            topics = ['communication', 'adaptability']
+        
+        questions = []
+        for topic in topics:
+            questions.extend(self.store.questions(bank='advanced', category='behavioral', focus=topic)[:1])
+        return questions[:count]
     
     def _get_role_specific_questions(self, position: str, tech_stack: Dict, experience_level: str) -> List[str]:
         """Generate role-specific questions"""
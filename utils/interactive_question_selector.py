@@ -6,10 +6,21 @@ import streamlit as st
 from typing import Dict, List, Any, Optional
 import random
 
+from utils.question_store import QuestionStore, question_store
+
+# Question difficulty tags accepted for each preferred difficulty level
+DIFFICULTY_TAGS = {
+    'junior': {'junior'},
+    'mid': {'mid', 'intermediate'},
+    'senior': {'senior', 'advanced'},
+    'expert': {'architect', 'advanced'}
+}
+
 class InteractiveQuestionSelector:
     """Manages interactive question selection and user preferences"""
     
-    def __init__(self):
+    def __init__(self, store: Optional[QuestionStore] = None):
+        self.store = store or question_store
         self.question_categories = {
             'technical_depth': 'Deep Technical Knowledge',
             'problem_solving': 'Problem Solving & Debugging',
@@ -161,8 +172,8 @@ class InteractiveQuestionSelector:
             )
             
             if num_questions > 0:
-                selected_questions = random.sample(filtered_questions, num_questions)
-                personalized_questions[tech] = selected_questions
+                # Filtered questions come best match first, shuffled within each tier
+                personalized_questions[tech] = filtered_questions[:num_questions]
                 questions_allocated += num_questions
         
         return personalized_questions
@@ -172,42 +183,32 @@ class InteractiveQuestionSelector:
                                        difficulty_level: str,
                                        focus_areas: List[str],
                                        candidate_data: Dict[str, Any]) -> List[str]:
-        """Filter questions based on difficulty and focus areas"""
-        
-        # For now, return all questions - in a real implementation,
-        # questions would be tagged with difficulty and category metadata
-        filtered = questions.copy()
-        
-        # Adjust based on difficulty level
-        experience_years = candidate_data.get('experience_years', 3)
-        
-        if difficulty_level == 'junior' and experience_years > 5:
-            # Mix in some easier questions for senior candidates who want junior-level questions
-            pass
-        elif difficulty_level == 'expert' and experience_years < 5:
-            # Filter out very advanced questions for less experienced candidates
-            pass
-        
-        # Filter based on focus areas
-        if 'real_world' in focus_areas:
-            # Prioritize questions that ask about experience
-            real_world_indicators = ['experience', 'project', 'worked', 'used', 'approach']
-            filtered = [q for q in filtered if any(indicator in q.lower() for indicator in real_world_indicators)] + filtered
-        
-        if 'problem_solving' in focus_areas:
-            # Prioritize debugging and problem-solving questions
-            problem_indicators = ['debug', 'problem', 'issue', 'challenge', 'solve', 'optimize']
-            filtered = [q for q in filtered if any(indicator in q.lower() for indicator in problem_indicators)] + filtered
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_filtered = []
-        for q in filtered:
-            if q not in seen:
-                seen.add(q)
-                unique_filtered.append(q)
-        
-        return unique_filtered
+        """Order questions by how well their tags match the preferred focus areas and difficulty"""
+        
+        difficulties = DIFFICULTY_TAGS.get(difficulty_level, {difficulty_level})
+        focus = set(focus_areas)
+        
+        tiers = {}
+        for text in dict.fromkeys(questions):
+            question_id = self.store.find(text)
+            if question_id is None:
+                # Questions from outside the store carry no metadata
+                rank = 2
+            else:
+                question = self.store.get(question_id)
+                if question.difficulty is not None and question.difficulty not in difficulties:
+                    rank = 3
+                elif question.focus_areas & focus:
+                    rank = 0
+                else:
+                    rank = 1
+            tiers.setdefault(rank, []).append(text)
+        
+        filtered = []
+        for rank in sorted(tiers):
+            random.shuffle(tiers[rank])
+            filtered.extend(tiers[rank])
+        return filtered
     
     def render_question_picker(self, available_questions: Dict[str, List[str]]) -> List[str]:
         """Render a question picker interface for manual selection"""
@@ -0,0 +1,223 @@
+"""
+Location index for salary adjustment
+Token trie over city, region and country names, built once at import
+
+Free-text locations ("New Delhi", "Portland, OR", "Bengaluru, India") are
+normalized to ASCII word tokens and matched leftmost-longest, so "New Delhi"
+resolves to New Delhi rather than Delhi. Region codes only count right after
+a city ("London, ON"), where they pick between cities sharing a name.
+Inputs with no match get one token-level fuzzy pass for misspellings.
+Resolved IDs are memoized per raw input in a bounded LRU.
+"""
+import difflib
+import json
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config import Config
+from utils.market_dataset import DATA_DIR, market_dataset
+
+ALIASES_FILE = os.path.join(DATA_DIR, 'location_aliases.json')
+
+# Tokens shorter than this are never fuzzy-matched (too many near misses)
+FUZZY_MIN_LENGTH = 4
+FUZZY_CUTOFF = 0.85
+
+
+def normalize_tokens(text: str) -> Tuple[str, ...]:
+    """Lower-case ASCII word tokens, accents stripped ('Düsseldorf' -> ('dusseldorf',))"""
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return tuple(re.findall(r'[a-z0-9]+', ascii_text.lower()))
+
+
+def load_aliases(aliases_file: str = ALIASES_FILE) -> Dict[str, Any]:
+    with open(aliases_file, 'r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+class LocationIndex:
+    """Word-token trie over location names with a bounded memo of resolved inputs
+
+    Trie terminals hold ('city', location ID), ('region', (country, code)),
+    ('country', country) and ('remote', location ID) entries. Cities win,
+    then remote; a region or country named alongside a city picks between
+    same-named cities, and on its own resolves to the first (flagship)
+    location listed for it.
+    """
+
+    # Key under which a trie node stores the entries of names that end there
+    _TERMINAL = None
+
+    def __init__(self, locations: List[Dict[str, Any]], aliases: Optional[Dict[str, Any]] = None,
+                 memo_size: int = 4096):
+        aliases = aliases or {}
+        self.locations = locations
+        self.memo_size = memo_size
+        self._root: Dict = {}
+        self._region_codes: Dict[str, Set[Tuple[str, str]]] = {}
+        self._first_in_country: Dict[str, int] = {}
+        self._first_in_region: Dict[Tuple[str, str], int] = {}
+        self._memo: "OrderedDict[str, Optional[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'fuzzy': 0, 'unresolved': 0}
+
+        city_ids: Dict[Tuple[Tuple[str, ...], str], List[int]] = {}
+        remote_id = None
+        for location_id, row in enumerate(locations):
+            if row['country'] == 'Global':
+                remote_id = location_id
+                continue
+            self._add(row['city'], ('city', location_id))
+            city_ids.setdefault((normalize_tokens(row['city']), row['country']), []).append(location_id)
+            self._first_in_country.setdefault(row['country'], location_id)
+            if row.get('region'):
+                self._first_in_region.setdefault((row['country'], row['region']), location_id)
+            self._add(row['country'], ('country', row['country']))
+
+        for key, names in aliases.get('cities', {}).items():
+            city, _, country = key.partition('|')
+            for location_id in city_ids.get((normalize_tokens(city), country), []):
+                for name in names:
+                    self._add(name, ('city', location_id))
+
+        for country, names in aliases.get('countries', {}).items():
+            for name in names:
+                self._add(name, ('country', country))
+
+        for country, regions in aliases.get('regions', {}).items():
+            for code, name in regions.items():
+                self._add(name, ('region', (country, code)))
+                self._region_codes.setdefault(code.lower(), set()).add((country, code))
+
+        if remote_id is not None:
+            for name in aliases.get('remote', []) + [locations[remote_id]['city']]:
+                self._add(name, ('remote', remote_id))
+
+        self._vocabulary = sorted(self._tokens(self._root))
+        self._known_tokens = set(self._vocabulary)
+
+    def _add(self, name: str, entry: Tuple[str, Any]):
+        node = self._root
+        for token in normalize_tokens(name):
+            node = node.setdefault(token, {})
+        entries = node.setdefault(self._TERMINAL, [])
+        if entry not in entries:
+            entries.append(entry)
+
+    def _tokens(self, node: Dict) -> Set[str]:
+        tokens = set()
+        for token, child in node.items():
+            if token is not self._TERMINAL:
+                tokens.add(token)
+                tokens |= self._tokens(child)
+        return tokens
+
+    def _scan(self, tokens: Tuple[str, ...]) -> List[Tuple[int, int, List[Tuple[str, Any]]]]:
+        """Leftmost-longest matches as (start, end, entries)"""
+        matches = []
+        position = 0
+        while position < len(tokens):
+            node = self._root
+            best_end, best_entries = -1, None
+            for cursor in range(position, len(tokens)):
+                node = node.get(tokens[cursor])
+                if node is None:
+                    break
+                if self._TERMINAL in node:
+                    best_end, best_entries = cursor + 1, node[self._TERMINAL]
+            if best_end < 0:
+                position += 1
+                continue
+            matches.append((position, best_end, best_entries))
+            position = best_end
+        return matches
+
+    def _choose(self, tokens: Tuple[str, ...]) -> Optional[int]:
+        matches = self._scan(tokens)
+        cities: List[int] = []
+        countries: Set[str] = set()
+        regions: Set[Tuple[str, str]] = set()
+        remote_id = None
+
+        for start, end, entries in matches:
+            kinds = {kind for kind, _ in entries}
+            for kind, value in entries:
+                if kind == 'city':
+                    cities.append(value)
+                elif kind == 'country' and 'city' not in kinds:
+                    countries.add(value)
+                elif kind == 'region' and 'city' not in kinds:
+                    regions.add(value)
+                elif kind == 'remote':
+                    remote_id = value
+            # Region codes like 'OR' or 'IN' are ordinary words anywhere else
+            if 'city' in kinds and end < len(tokens):
+                regions |= self._region_codes.get(tokens[end], set())
+
+        if cities:
+            def score(location_id: int) -> Tuple[int, int]:
+                row = self.locations[location_id]
+                matched = (row['country'] in countries) + ((row['country'], row.get('region')) in regions)
+                return -matched, cities.index(location_id)
+            return min(cities, key=score)
+
+        if remote_id is not None:
+            return remote_id
+        for region in sorted(regions):
+            if region in self._first_in_region:
+                return self._first_in_region[region]
+        for country in sorted(countries):
+            if country in self._first_in_country:
+                return self._first_in_country[country]
+        return None
+
+    def _correct(self, tokens: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Replace unknown tokens by their closest known token, if close enough"""
+        corrected = []
+        for token in tokens:
+            if len(token) >= FUZZY_MIN_LENGTH and token not in self._known_tokens:
+                close = difflib.get_close_matches(token, self._vocabulary, n=1, cutoff=FUZZY_CUTOFF)
+                token = close[0] if close else token
+            corrected.append(token)
+        return tuple(corrected)
+
+    def resolve(self, text: str) -> Optional[int]:
+        """Location ID for free-text input, or None if nothing matches"""
+        with self._lock:
+            if text in self._memo:
+                self._memo.move_to_end(text)
+                self._stats['hits'] += 1
+                return self._memo[text]
+
+        tokens = normalize_tokens(text)
+        location_id = self._choose(tokens)
+        fuzzy = False
+        if location_id is None:
+            corrected = self._correct(tokens)
+            if corrected != tokens:
+                location_id = self._choose(corrected)
+                fuzzy = location_id is not None
+
+        with self._lock:
+            self._stats['misses'] += 1
+            self._stats['fuzzy'] += fuzzy
+            self._stats['unresolved'] += location_id is None
+            self._memo[text] = location_id
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return location_id
+
+    def stats(self) -> Dict[str, Any]:
+        """Memo hit/miss counters and size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memo_size'] = len(self._memo)
+        return stats
+
+
+# Global instance
+location_index = LocationIndex(market_dataset.locations, load_aliases(), Config.LOCATION_MEMO_SIZE)
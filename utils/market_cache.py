@@ -0,0 +1,151 @@
+"""
+Process-wide cache for market data
+
+Entries are bounded by count (LRU). Once an entry is older than its fresh
+period it is still served for a further stale period while a single
+background refresh per key replaces it (stale-while-revalidate). Entries are
+tagged with the data version they were loaded under; an entry from another
+version is treated as stale, so publishing a new version never empties the
+cache. Concurrent misses for the same key share one fetch (single-flight),
+and unknown keys are cached as None for a shorter period (negative caching).
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from config import Config
+
+# Loads values for a list of keys; keys left out of the result were not loaded (e.g. timed out)
+Loader = Callable[[List[str]], Dict[str, Any]]
+
+_NOT_LOADED = object()
+
+
+class MarketDataCache:
+    """Thread-safe LRU cache with stale-while-revalidate, single-flight loading and negative caching"""
+
+    def __init__(self, max_entries: int = 2048, fresh_seconds: float = 6 * 60 * 60,
+                 stale_seconds: float = 7 * 24 * 60 * 60, negative_seconds: float = 60 * 60,
+                 refresh_workers: int = 2, clock: Callable[[], float] = time.time):
+        self.max_entries = max_entries
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self.negative_seconds = negative_seconds
+        self._clock = clock
+        # key -> (value, fresh until, version); None values are negative entries
+        self._entries: "OrderedDict[str, Tuple[Any, float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='market-refresh')
+        self._stats = {'hits': 0, 'negative_hits': 0, 'stale_hits': 0, 'misses': 0,
+                       'coalesced': 0, 'refreshes': 0, 'load_errors': 0, 'evictions': 0}
+
+    def get_many(self, keys: Iterable[str], loader: Loader, version: Any = None) -> Dict[str, Any]:
+        """Cached values for keys, loading misses through loader
+
+        Fresh and stale entries are returned at once (stale ones, including
+        entries of another version, are refreshed in the background); only
+        keys with no usable entry wait for a load. Keys that could not be
+        loaded are left out of the result.
+        """
+        now = self._clock()
+        results, load, refresh, waiting = {}, [], [], {}
+
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._entries.get(key)
+                if entry is not None:
+                    value, fresh_until, entry_version = entry
+                    if now < fresh_until + self.stale_seconds:
+                        self._entries.move_to_end(key)
+                        results[key] = value
+                        if now < fresh_until and entry_version == version:
+                            self._stats['negative_hits' if value is None else 'hits'] += 1
+                            continue
+                        self._stats['stale_hits'] += 1
+                        if key not in self._inflight:
+                            self._inflight[key] = Future()
+                            refresh.append(key)
+                        continue
+                    del self._entries[key]
+
+                if key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                    self._stats['coalesced'] += 1
+                else:
+                    self._inflight[key] = Future()
+                    load.append(key)
+                    self._stats['misses'] += 1
+
+            self._stats['refreshes'] += len(refresh)
+
+        if refresh:
+            self._refresher.submit(self._load, refresh, loader, version)
+        if load:
+            results.update(self._load(load, loader, version))
+        for key, future in waiting.items():
+            value = future.result()
+            if value is not _NOT_LOADED:
+                results[key] = value
+        return results
+
+    def _load(self, keys: List[str], loader: Loader, version: Any = None) -> Dict[str, Any]:
+        try:
+            loaded = loader(keys)
+        except Exception as e:
+            print(f"⚠️ Market data load failed for {', '.join(keys)}: {e}")
+            loaded = {}
+            with self._lock:
+                self._stats['load_errors'] += 1
+
+        now = self._clock()
+        with self._lock:
+            futures = [self._inflight.pop(key) for key in keys]
+            for key, value in loaded.items():
+                if key in keys:
+                    self._store(key, value, now, version)
+
+        for key, future in zip(keys, futures):
+            future.set_result(loaded.get(key, _NOT_LOADED))
+        return {key: value for key, value in loaded.items() if key in keys}
+
+    def _store(self, key: str, value: Any, now: float, version: Any = None):
+        ttl = self.negative_seconds if value is None else self.fresh_seconds
+        self._entries[key] = (value, now + ttl, version)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/stale/miss counters and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            stats['inflight'] = len(self._inflight)
+        lookups = stats['hits'] + stats['negative_hits'] + stats['stale_hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_rate'] = (lookups - stats['misses'] - stats['coalesced']) / lookups if lookups else 0.0
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def holds(self, keys: Iterable[str], version: Any = None) -> bool:
+        """Whether every key has an entry loaded under version (fresh or stale)"""
+        with self._lock:
+            return all(key in self._entries and self._entries[key][2] == version for key in keys)
+
+# Global instance, shared by every MarketDataProvider in the process
+market_cache = MarketDataCache(
+    max_entries=Config.MARKET_CACHE_MAX_ENTRIES,
+    fresh_seconds=Config.MARKET_CACHE_FRESH_SECONDS,
+    stale_seconds=Config.MARKET_CACHE_STALE_SECONDS,
+    negative_seconds=Config.MARKET_CACHE_NEGATIVE_SECONDS
+)
@@ -3,12 +3,23 @@ Real-time Market Data Integration
 Provides live salary data, job market trends, and technology demand analysis
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from urllib.parse import quote
+import numpy as np
 import streamlit as st
-from dataclasses import dataclass
-import time
+from dataclasses import dataclass, replace
+
+from config import Config
+from utils.market_cache import MarketDataCache, market_cache
+from utils.location_index import location_index
+from utils.market_dataset import MarketDataset, _spread, market_dataset
 
 @dataclass
 class MarketTrend:
@@ -27,130 +38,269 @@ class LocationData:
     tech_hub_score: float
     average_salary_multiplier: float
 
+# Career progression paths matched against the candidate's stack
+CAREER_PATHS = {
+    'full_stack_web': {
+        'technologies': ['javascript', 'react', 'python', 'django', 'postgresql'],
+        'next_level': ['docker', 'kubernetes', 'aws', 'redis'],
+        'career_titles': ['Full Stack Developer', 'Senior Developer', 'Tech Lead']
+    },
+    'backend_specialist': {
+        'technologies': ['python', 'django', 'flask', 'postgresql', 'mysql'],
+        'next_level': ['microservices', 'kafka', 'elasticsearch', 'redis'],
+        'career_titles': ['Backend Developer', 'Senior Backend Engineer', 'Principal Engineer']
+    },
+    'frontend_specialist': {
+        'technologies': ['javascript', 'react', 'vue', 'angular', 'typescript'],
+        'next_level': ['next.js', 'webpack', 'testing', 'accessibility'],
+        'career_titles': ['Frontend Developer', 'Senior Frontend Engineer', 'UI/UX Engineer']
+    },
+    'devops_engineer': {
+        'technologies': ['docker', 'kubernetes', 'aws', 'terraform', 'jenkins'],
+        'next_level': ['helm', 'istio', 'prometheus', 'grafana'],
+        'career_titles': ['DevOps Engineer', 'Senior DevOps Engineer', 'Platform Engineer']
+    }
+}
+
+def experience_bucket(experience_years: int) -> int:
+    """Smallest year count giving the same career level, timeline and advice as experience_years"""
+    if experience_years < 2:
+        return experience_years
+    return 2 if experience_years < 5 else 5
+
+class MarketDataSource:
+    """Where per-technology market figures come from
+
+    Figures are dicts with 'salary' ({'min', 'max', 'median'}), 'demand',
+    'growth' and 'jobs'; None means the technology is unknown. Figures are
+    fixed within a snapshot and only change when a new one is published.
+    """
+
+    def fetch(self, technology: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def snapshot(self) -> str:
+        """Version of the figures fetch() currently returns; called on every lookup, so it must not block"""
+        raise NotImplementedError
+
+    def fetch_many(self, technologies: List[str], timeout: float) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Figures for several technologies (lower-case); ones not fetched by the deadline are left out"""
+        return {tech: self.fetch(tech) for tech in technologies}
+
+    def close(self):
+        pass
+
+
+class LocalMarketDataSource(MarketDataSource):
+    """Figures from the memory-mapped market dataset, with a little variation to simulate live data
+
+    The variation is fixed per technology and dataset version, which is the
+    snapshot, so repeated fetches agree.
+    """
+
+    def __init__(self, variation: float = 0.05, dataset: Optional[MarketDataset] = None):
+        self.variation = variation
+        self.dataset = dataset or market_dataset
+
+    def fetch(self, technology: str) -> Optional[Dict[str, Any]]:
+        tech_id = self.dataset.tech_id(technology)
+        if tech_id is None:
+            return None
+
+        variation = 1 + self.variation * _spread(self.dataset.technologies[tech_id], self.snapshot())
+        figures = self.dataset.figures(tech_id)
+        return {
+            'salary': {key: int(value * variation) for key, value in figures['salary'].items()},
+            'demand': min(100, figures['demand'] * variation),
+            'growth': figures['growth'] * variation,
+            'jobs': int(figures['jobs'] * variation)
+        }
+
+    def snapshot(self) -> str:
+        return self.dataset.version
+
+    def columns(self, technologies: List[str]) -> Dict[str, np.ndarray]:
+        """fetch() figures of known technologies as columns, read from the dataset rows by tech ID"""
+        tech_ids = np.array([self.dataset.tech_id(tech) for tech in technologies], dtype=np.intp)
+        snapshot = self.snapshot()
+        variation = 1 + self.variation * np.array(
+            [_spread(self.dataset.technologies[tech_id], snapshot) for tech_id in tech_ids.tolist()], dtype=np.float64
+        )
+        tech = self.dataset.tech
+        return {
+            'demand': np.minimum(100, tech['demand'][tech_ids] * variation),
+            'salary_median': (tech['salary_median'][tech_ids] * variation).astype(np.int64),
+            'growth': tech['growth'][tech_ids] * variation,
+            'jobs': (tech['jobs'][tech_ids] * variation).astype(np.int64)
+        }
+
+
+class HTTPMarketDataSource(MarketDataSource):
+    """Market data API client: GET {base_url}/technologies/{technology}
+
+    A pooled session keeps connections alive and a stack is fetched
+    concurrently, so it costs about one round trip however many
+    technologies it has. The published snapshot (GET {base_url}/snapshot,
+    {"version": ...}) is re-checked in the background at most every
+    snapshot_check_seconds; until the first answer it is ''.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 2.0, max_workers: int = 16,
+                 snapshot_check_seconds: float = 300.0):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.snapshot_check_seconds = snapshot_check_seconds
+        self._snapshot = ''
+        self._snapshot_due = 0.0
+        self._snapshot_checking = False
+        self._snapshot_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='market-data')
+        self.snapshot()
+
+    def fetch(self, technology: str) -> Optional[Dict[str, Any]]:
+        response = self.session.get(f"{self.base_url}/technologies/{quote(technology, safe='')}",
+                                    timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def snapshot(self) -> str:
+        # Never waits for the API: a due check is started in the background
+        with self._snapshot_lock:
+            if not self._snapshot_checking and time.monotonic() >= self._snapshot_due:
+                self._snapshot_checking = True
+                self._pool.submit(self._check_snapshot)
+            return self._snapshot
+
+    def _check_snapshot(self):
+        snapshot = None
+        try:
+            response = self.session.get(f"{self.base_url}/snapshot", timeout=self.timeout)
+            response.raise_for_status()
+            snapshot = str(response.json()['version'])
+        except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+            # Keep serving the last known snapshot
+            print(f"⚠️ Market data snapshot unavailable: {e}")
+
+        with self._snapshot_lock:
+            if snapshot is not None:
+                self._snapshot = snapshot
+            self._snapshot_checking = False
+            self._snapshot_due = time.monotonic() + self.snapshot_check_seconds
+
+    def fetch_many(self, technologies: List[str], timeout: float) -> Dict[str, Optional[Dict[str, Any]]]:
+        futures = {self._pool.submit(self.fetch, tech): tech for tech in technologies}
+        done, _ = wait(futures, timeout=timeout)
+
+        results = {}
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except (requests.RequestException, ValueError) as e:
+                print(f"⚠️ Market data for {futures[future]} unavailable: {e}")
+        return results
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+def create_market_source() -> MarketDataSource:
+    """Build the source selected by the MARKET_DATA_URL setting"""
+    if Config.MARKET_DATA_URL:
+        return HTTPMarketDataSource(Config.MARKET_DATA_URL, timeout=Config.MARKET_DATA_TIMEOUT_SECONDS,
+                                    max_workers=Config.MARKET_DATA_MAX_WORKERS,
+                                    snapshot_check_seconds=Config.MARKET_SNAPSHOT_CHECK_SECONDS)
+    return LocalMarketDataSource()
+
 class MarketDataProvider:
     """Provides real-time market data from various sources"""
     
-    def __init__(self):
-        self.cache_duration = timedelta(hours=6)  # Cache data for 6 hours
-        self.data_cache = {}
-        
-        # Simulated real-time data (in production, this would connect to real APIs)
-        self.base_salary_data = {
-            'python': {'min': 70000, 'max': 150000, 'median': 95000},
-            'javascript': {'min': 65000, 'max': 140000, 'median': 85000},
-            'react': {'min': 75000, 'max': 150000, 'median': 100000},
-            'django': {'min': 80000, 'max': 140000, 'median': 105000},
-            'flask': {'min': 70000, 'max': 130000, 'median': 90000},
-            'mysql': {'min': 60000, 'max': 120000, 'median': 80000},
-            'postgresql': {'min': 65000, 'max': 125000, 'median': 85000},
-            'docker': {'min': 80000, 'max': 160000, 'median': 110000},
-            'kubernetes': {'min': 90000, 'max': 180000, 'median': 125000},
-            'aws': {'min': 85000, 'max': 170000, 'median': 115000},
-            'azure': {'min': 80000, 'max': 165000, 'median': 110000},
-            'git': {'min': 50000, 'max': 120000, 'median': 75000},
-            'bootstrap': {'min': 45000, 'max': 100000, 'median': 65000}
-        }
-        
-        self.demand_trends = {
-            'python': {'demand': 95, 'growth': 15.2, 'jobs': 45000},
-            'javascript': {'demand': 98, 'growth': 12.8, 'jobs': 52000},
-            'react': {'demand': 92, 'growth': 18.5, 'jobs': 38000},
-            'django': {'demand': 78, 'growth': 8.3, 'jobs': 12000},
-            'flask': {'demand': 65, 'growth': 5.2, 'jobs': 8500},
-            'mysql': {'demand': 85, 'growth': 3.1, 'jobs': 25000},
-            'postgresql': {'demand': 88, 'growth': 12.4, 'jobs': 18000},
-            'docker': {'demand': 89, 'growth': 22.1, 'jobs': 28000},
-            'kubernetes': {'demand': 85, 'growth': 35.7, 'jobs': 15000},
-            'aws': {'demand': 94, 'growth': 20.3, 'jobs': 42000},
-            'azure': {'demand': 87, 'growth': 25.1, 'jobs': 32000},
-            'git': {'demand': 99, 'growth': 2.1, 'jobs': 48000},
-            'bootstrap': {'demand': 72, 'growth': -2.3, 'jobs': 15000}
-        }
-        
-        self.location_data = {
-            'san francisco': LocationData('San Francisco', 'USA', 1.8, 0.95, 1.4),
-            'new york': LocationData('New York', 'USA', 1.6, 0.85, 1.3),
-            'seattle': LocationData('Seattle', 'USA', 1.4, 0.90, 1.25),
-            'london': LocationData('London', 'UK', 1.3, 0.80, 1.15),
-            'berlin': LocationData('Berlin', 'Germany', 1.0, 0.75, 0.95),
-            'toronto': LocationData('Toronto', 'Canada', 1.1, 0.70, 1.05),
-            'bangalore': LocationData('Bangalore', 'India', 0.3, 0.85, 0.25),
-            'remote': LocationData('Remote', 'Global', 1.0, 0.80, 1.1)
-        }
+    def __init__(self, source: Optional[MarketDataSource] = None, cache: Optional[MarketDataCache] = None):
+        self.source = source or create_market_source()
+        # Shared across providers; trends are cached under the lower-case technology name
+        self.cache = cache if cache is not None else market_cache
+        # Deadline for fetching a whole stack; technologies still pending are skipped
+        self.fetch_deadline = Config.MARKET_DATA_TIMEOUT_SECONDS
+        
+        # Location table of the market dataset and the index that resolves free text against it
+        self.dataset = market_dataset
+        self.location_index = location_index
+    
+    def get_snapshot(self) -> str:
+        """Current market data snapshot; cached trends are tagged with the snapshot they came from"""
+        return self.source.snapshot()
     
     def get_technology_market_data(self, technology: str) -> Optional[MarketTrend]:
         """Get real-time market data for a specific technology"""
+        return self.get_technologies_market_data([technology]).get(technology)
+    
+    def get_technologies_market_data(self, technologies: List[str]) -> Dict[str, MarketTrend]:
+        """Market data for several technologies, fetching every cache miss in one concurrent batch"""
         
-        cache_key = f"market_{technology.lower()}"
-        
-        # Check cache first
-        if cache_key in self.data_cache:
-            cached_data, timestamp = self.data_cache[cache_key]
-            if datetime.now() - timestamp < self.cache_duration:
-                return cached_data
-        
-        # Simulate API call delay
-        time.sleep(0.1)
-        
-        tech_lower = technology.lower()
-        
-        if tech_lower not in self.base_salary_data:
-            return None
-        
-        # Add some realistic variation to simulate real-time data
-        import random
-        variation = random.uniform(0.95, 1.05)
-        
-        salary_data = self.base_salary_data[tech_lower]
-        demand_data = self.demand_trends.get(tech_lower, {'demand': 50, 'growth': 0, 'jobs': 1000})
+        # Trends of an older snapshot are served while they are refreshed in the background
+        trends = self.cache.get_many((tech.lower() for tech in technologies), self._load_trends,
+                                     version=self.get_snapshot())
         
-        market_trend = MarketTrend(
+        results = {}
+        for tech in technologies:
+            trend = trends.get(tech.lower())
+            if trend:
+                results[tech] = trend if trend.technology == tech else replace(trend, technology=tech)
+        return results
+    
+    def is_settled(self, technologies: List[str], snapshot: str) -> bool:
+        """Whether every technology is cached for snapshot, as known or unknown (none timed out or outdated)"""
+        return self.cache.holds((tech.lower() for tech in technologies), version=snapshot)
+    
+    def _load_trends(self, technologies: List[str]) -> Dict[str, Optional[MarketTrend]]:
+        """Fetch lower-case technologies from the source (None for unknown ones)"""
+        fetched = self.source.fetch_many(technologies, timeout=self.fetch_deadline)
+        return {tech: self._build_trend(tech, figures) if figures else None for tech, figures in fetched.items()}
+    
+    @staticmethod
+    def _build_trend(technology: str, figures: Dict[str, Any]) -> MarketTrend:
+        return MarketTrend(
             technology=technology,
-            demand_score=min(100, demand_data['demand'] * variation),
-            salary_range={
-                'min': int(salary_data['min'] * variation),
-                'max': int(salary_data['max'] * variation),
-                'median': int(salary_data['median'] * variation)
-            },
-            growth_rate=demand_data['growth'] * variation,
-            job_count=int(demand_data['jobs'] * variation),
+            demand_score=figures['demand'],
+            salary_range=dict(figures['salary']),
+            growth_rate=figures['growth'],
+            job_count=figures['jobs'],
             last_updated=datetime.now()
         )
-        
-        # Cache the result
-        self.data_cache[cache_key] = (market_trend, datetime.now())
-        
-        return market_trend
     
     def get_tech_stack_market_analysis(self, tech_stack: Dict[str, List[str]]) -> Dict[str, Any]:
-        """Analyze market data for an entire tech stack"""
+        """Analyze market data for an entire tech stack
+        
+        Aggregates are NumPy reductions over the stack's figures: dataset rows
+        selected by tech ID for the local source, otherwise an array built
+        from the cached trends. The snapshot they came from is returned too.
+        """
         
         all_technologies = []
         for category, technologies in tech_stack.items():
             all_technologies.extend(technologies)
         
-        market_data = {}
-        total_demand = 0
-        total_jobs = 0
-        salary_ranges = []
-        growth_rates = []
-        
-        for tech in all_technologies:
-            trend = self.get_technology_market_data(tech)
-            if trend:
-                market_data[tech] = trend
-                total_demand += trend.demand_score
-                total_jobs += trend.job_count
-                salary_ranges.append(trend.salary_range['median'])
-                growth_rates.append(trend.growth_rate)
+        snapshot = self.get_snapshot()
+        trends = self.get_technologies_market_data(all_technologies)
         
+        market_data = {tech: trends[tech] for tech in all_technologies if tech in trends}
         if not market_data:
             return {}
         
+        figures = self._stack_figures([tech for tech in all_technologies if tech in trends], trends)
+        salary_ranges = figures['salary_median']
+        
         # Calculate aggregate metrics
-        avg_demand = total_demand / len(market_data)
-        avg_growth = sum(growth_rates) / len(growth_rates)
-        estimated_salary = sum(salary_ranges) / len(salary_ranges)
+        avg_demand = float(figures['demand'].sum()) / len(market_data)
+        avg_growth = float(figures['growth'].mean())
+        estimated_salary = float(salary_ranges.mean())
+        total_jobs = int(figures['jobs'].sum())
         
         # Determine market strength
         if avg_demand >= 90:
@@ -186,30 +336,41 @@ class MarketDataProvider:
             'market_strength': market_strength,
             'average_demand_score': round(avg_demand, 1),
             'estimated_salary_range': {
-                'min': int(min(salary_ranges) * 0.9),
-                'max': int(max(salary_ranges) * 1.1),
+                'min': int(salary_ranges.min() * 0.9),
+                'max': int(salary_ranges.max() * 1.1),
                 'median': int(estimated_salary)
             },
             'average_growth_rate': round(avg_growth, 1),
             'total_job_opportunities': total_jobs,
             'technology_breakdown': market_data,
             'market_insights': insights,
+            'snapshot': snapshot,
             'last_updated': datetime.now().isoformat()
         }
     
+    def _stack_figures(self, technologies: List[str], trends: Dict[str, MarketTrend]) -> Dict[str, np.ndarray]:
+        """Demand, median salary, growth and jobs per priced technology, one column each"""
+        if isinstance(self.source, LocalMarketDataSource):
+            return self.source.columns(technologies)
+        rows = [trends[tech] for tech in technologies]
+        return {
+            'demand': np.array([trend.demand_score for trend in rows], dtype=np.float64),
+            'salary_median': np.array([trend.salary_range['median'] for trend in rows], dtype=np.int64),
+            'growth': np.array([trend.growth_rate for trend in rows], dtype=np.float64),
+            'jobs': np.array([trend.job_count for trend in rows], dtype=np.int64)
+        }
+    
     def get_location_adjusted_salary(self, 
                                    base_salary: int, 
                                    location: str) -> Dict[str, Any]:
         """Adjust salary based on location data"""
         
-        location_lower = location.lower()
-        
-        # Find matching location
         location_info = None
-        for loc_key, loc_data in self.location_data.items():
-            if loc_key in location_lower or location_lower in loc_key:
-                location_info = loc_data
-                break
+        location_id = self.location_index.resolve(location)
+        if location_id is not None:
+            row = self.dataset.location_row(location_id)
+            location_info = LocationData(row['city'], row['country'], row['cost_of_living_index'],
+                                         row['tech_hub_score'], row['average_salary_multiplier'])
         
         if not location_info:
             # Default to moderate adjustment for unknown locations
@@ -227,56 +388,39 @@ class MarketDataProvider:
             'salary_multiplier': location_info.average_salary_multiplier
         }
     
-    def get_career_progression_data(self, 
-                                  current_tech_stack: List[str],
-                                  experience_years: int) -> Dict[str, Any]:
-        """Get career progression recommendations based on market data"""
-        
-        # Define career progression paths
-        progression_paths = {
-            'full_stack_web': {
-                'technologies': ['javascript', 'react', 'python', 'django', 'postgresql'],
-                'next_level': ['docker', 'kubernetes', 'aws', 'redis'],
-                'career_titles': ['Full Stack Developer', 'Senior Developer', 'Tech Lead']
-            },
-            'backend_specialist': {
-                'technologies': ['python', 'django', 'flask', 'postgresql', 'mysql'],
-                'next_level': ['microservices', 'kafka', 'elasticsearch', 'redis'],
-                'career_titles': ['Backend Developer', 'Senior Backend Engineer', 'Principal Engineer']
-            },
-            'frontend_specialist': {
-                'technologies': ['javascript', 'react', 'vue', 'angular', 'typescript'],
-                'next_level': ['next.js', 'webpack', 'testing', 'accessibility'],
-                'career_titles': ['Frontend Developer', 'Senior Frontend Engineer', 'UI/UX Engineer']
-            },
-            'devops_engineer': {
-                'technologies': ['docker', 'kubernetes', 'aws', 'terraform', 'jenkins'],
-                'next_level': ['helm', 'istio', 'prometheus', 'grafana'],
-                'career_titles': ['DevOps Engineer', 'Senior DevOps Engineer', 'Platform Engineer']
-            }
-        }
+    def match_career_path(self, current_tech_stack: List[str]) -> Optional[Tuple[str, Dict[str, Any], int]]:
+        """Best matching career path as (name, path data, matched technologies), if any"""
         
         current_stack_lower = [tech.lower() for tech in current_tech_stack]
         
-        # Find best matching path
         best_path = None
         best_score = 0
         
-        for path_name, path_data in progression_paths.items():
+        for path_name, path_data in CAREER_PATHS.items():
             score = sum(1 for tech in path_data['technologies'] if tech in current_stack_lower)
             if score > best_score:
                 best_score = score
-                best_path = (path_name, path_data)
+                best_path = (path_name, path_data, score)
+        
+        return best_path
+    
+    def get_career_progression_data(self, 
+                                  current_tech_stack: List[str],
+                                  experience_years: int) -> Dict[str, Any]:
+        """Get career progression recommendations based on market data"""
+        
+        best_path = self.match_career_path(current_tech_stack)
         
         if not best_path:
             return {}
         
-        path_name, path_data = best_path
+        path_name, path_data, best_score = best_path
         
         # Get market data for recommended technologies
+        trends = self.get_technologies_market_data(path_data['next_level'])
         recommended_techs = []
         for tech in path_data['next_level']:
-            market_data = self.get_technology_market_data(tech)
+            market_data = trends.get(tech)
             if market_data:
                 recommended_techs.append({
                     'technology': tech,
@@ -316,15 +460,63 @@ class RealTimeMarketIntegration:
         self.market_provider = MarketDataProvider()
         self.update_frequency = timedelta(hours=1)
         self.last_update = {}
+        
+        # Finished analyses for the current snapshot, most recently used last
+        self.memo_size = Config.MARKET_ANALYSIS_MEMO_SIZE
+        self._memo: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._memo_snapshot: Optional[str] = None
+        self._memo_lock = threading.Lock()
     
     def get_comprehensive_market_analysis(self, 
                                         candidate_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Get comprehensive market analysis for a candidate"""
+        """Get comprehensive market analysis for a candidate
+        
+        Analyses are memoized by the set of technologies, experience bucket,
+        resolved location and market data snapshot, so the returned dict may
+        be shared and must not be modified.
+        """
         
         tech_stack = candidate_data.get('tech_stack', {})
         experience_years = int(str(candidate_data.get('experience_years', 3)))
         location = candidate_data.get('location', 'Remote')
         
+        all_technologies = []
+        for technologies in tech_stack.values():
+            all_technologies.extend(technologies)
+        
+        # Unresolved locations are echoed back by name, so they key by name
+        location_id = self.market_provider.location_index.resolve(location)
+        snapshot = self.market_provider.get_snapshot()
+        # Aggregates do not depend on order, case or how technologies are split into categories
+        memo_key = (frozenset(tech.lower() for tech in all_technologies), experience_bucket(experience_years),
+                    location if location_id is None else location_id, snapshot)
+        
+        with self._memo_lock:
+            if snapshot != self._memo_snapshot:
+                self._memo.clear()
+                self._memo_snapshot = snapshot
+            if memo_key in self._memo:
+                self._memo.move_to_end(memo_key)
+                return self._memo[memo_key]
+        
+        # Fetch the stack and the career path's next-level technologies in one concurrent batch
+        career_path = self.market_provider.match_career_path(all_technologies)
+        next_level = career_path[1]['next_level'] if career_path else []
+        self.market_provider.get_technologies_market_data(all_technologies + next_level)
+        
+        analysis = self._build_comprehensive_analysis(tech_stack, all_technologies, experience_years, location)
+        
+        # Analyses missing technologies that timed out, or built from an older snapshot, are not kept
+        if self.market_provider.is_settled(all_technologies + next_level, snapshot):
+            with self._memo_lock:
+                if snapshot == self._memo_snapshot:
+                    self._memo[memo_key] = analysis
+                    while len(self._memo) > self.memo_size:
+                        self._memo.popitem(last=False)
+        return analysis
+    
+    def _build_comprehensive_analysis(self, tech_stack: Dict[str, List[str]], all_technologies: List[str],
+                                      experience_years: int, location: str) -> Dict[str, Any]:
         # Get tech stack market analysis
         market_analysis = self.market_provider.get_tech_stack_market_analysis(tech_stack)
         
@@ -336,10 +528,6 @@ class RealTimeMarketIntegration:
         location_data = self.market_provider.get_location_adjusted_salary(base_salary, location)
         
         # Get career progression data
-        all_technologies = []
-        for technologies in tech_stack.values():
-            all_technologies.extend(technologies)
-        
         career_data = self.market_provider.get_career_progression_data(
             all_technologies, experience_years
         )
@@ -0,0 +1,276 @@
+"""
+Columnar market dataset, memory-mapped at startup
+
+Salary, demand and growth figures for the whole Config.COMMON_TECHNOLOGIES
+catalog and the location table (hundreds of metro areas) are kept as one
+.npy file per column, indexed by technology ID and location ID. Columns are
+opened with np.load(mmap_mode='r'), so worker processes share the same page
+cache instead of each holding a copy.
+
+Each build goes into its own directory named after the format version and a
+content hash of the seed tables, and CURRENT_FILE is switched to it
+atomically. Readers that still map an older build keep working. Build ahead
+of time (e.g. in a container build) with:
+
+    python -m utils.market_dataset
+"""
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Bump whenever the column layout or the way figures are derived changes
+MARKET_FORMAT_VERSION = 1
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'knowledge_base', 'data')
+LOCATIONS_FILE = os.path.join(DATA_DIR, 'market_locations.json')
+DEFAULT_DATASET_DIR = os.path.join(DATA_DIR, 'market')
+CURRENT_FILE = 'current.json'
+
+TECH_COLUMNS = {
+    'salary_min': np.int32, 'salary_max': np.int32, 'salary_median': np.int32,
+    'demand': np.float64, 'growth': np.float64, 'jobs': np.int32
+}
+LOCATION_COLUMNS = {
+    'cost_of_living_index': np.float64, 'tech_hub_score': np.float64, 'average_salary_multiplier': np.float64
+}
+
+# Reference figures for the best-known technologies (others are derived from CATEGORY_PROFILES)
+BASE_SALARY_DATA = {
+    'python': {'min': 70000, 'max': 150000, 'median': 95000},
+    'javascript': {'min': 65000, 'max': 140000, 'median': 85000},
+    'react': {'min': 75000, 'max': 150000, 'median': 100000},
+    'django': {'min': 80000, 'max': 140000, 'median': 105000},
+    'flask': {'min': 70000, 'max': 130000, 'median': 90000},
+    'mysql': {'min': 60000, 'max': 120000, 'median': 80000},
+    'postgresql': {'min': 65000, 'max': 125000, 'median': 85000},
+    'docker': {'min': 80000, 'max': 160000, 'median': 110000},
+    'kubernetes': {'min': 90000, 'max': 180000, 'median': 125000},
+    'aws': {'min': 85000, 'max': 170000, 'median': 115000},
+    'azure': {'min': 80000, 'max': 165000, 'median': 110000},
+    'git': {'min': 50000, 'max': 120000, 'median': 75000},
+    'bootstrap': {'min': 45000, 'max': 100000, 'median': 65000}
+}
+
+DEMAND_TRENDS = {
+    'python': {'demand': 95, 'growth': 15.2, 'jobs': 45000},
+    'javascript': {'demand': 98, 'growth': 12.8, 'jobs': 52000},
+    'react': {'demand': 92, 'growth': 18.5, 'jobs': 38000},
+    'django': {'demand': 78, 'growth': 8.3, 'jobs': 12000},
+    'flask': {'demand': 65, 'growth': 5.2, 'jobs': 8500},
+    'mysql': {'demand': 85, 'growth': 3.1, 'jobs': 25000},
+    'postgresql': {'demand': 88, 'growth': 12.4, 'jobs': 18000},
+    'docker': {'demand': 89, 'growth': 22.1, 'jobs': 28000},
+    'kubernetes': {'demand': 85, 'growth': 35.7, 'jobs': 15000},
+    'aws': {'demand': 94, 'growth': 20.3, 'jobs': 42000},
+    'azure': {'demand': 87, 'growth': 25.1, 'jobs': 32000},
+    'git': {'demand': 99, 'growth': 2.1, 'jobs': 48000},
+    'bootstrap': {'demand': 72, 'growth': -2.3, 'jobs': 15000}
+}
+
+# Typical figures per catalog category, for technologies without reference figures
+CATEGORY_PROFILES = {
+    'languages': {'median': 95000, 'demand': 75, 'growth': 8.0, 'jobs': 15000},
+    'frameworks': {'median': 90000, 'demand': 70, 'growth': 7.0, 'jobs': 9000},
+    'databases': {'median': 85000, 'demand': 70, 'growth': 6.0, 'jobs': 9000},
+    'cloud_platforms': {'median': 110000, 'demand': 78, 'growth': 18.0, 'jobs': 20000},
+    'devops_tools': {'median': 105000, 'demand': 72, 'growth': 15.0, 'jobs': 10000},
+    'development_tools': {'median': 75000, 'demand': 65, 'growth': 4.0, 'jobs': 12000},
+    'web_servers': {'median': 85000, 'demand': 60, 'growth': 2.0, 'jobs': 6000},
+    'message_queues': {'median': 110000, 'demand': 62, 'growth': 12.0, 'jobs': 5000},
+    'api_technologies': {'median': 90000, 'demand': 68, 'growth': 10.0, 'jobs': 8000}
+}
+DEFAULT_PROFILE = {'median': 85000, 'demand': 60, 'growth': 5.0, 'jobs': 5000}
+
+
+def _spread(technology: str, salt: str) -> float:
+    """Stable value in [-1, 1) per technology, so derived figures differ but never change between builds"""
+    return zlib.crc32(f"{salt}:{technology}".encode('utf-8')) / 2 ** 31 - 1
+
+
+def technology_figures() -> Dict[str, Dict[str, Any]]:
+    """Figures for every catalog technology: reference figures where known, else the category profile"""
+    from config import Config
+
+    figures = {}
+    for category, technologies in Config.COMMON_TECHNOLOGIES.items():
+        profile = CATEGORY_PROFILES.get(category, DEFAULT_PROFILE)
+        for tech in technologies:
+            if tech in figures:
+                continue
+            median = int(profile['median'] * (1 + 0.15 * _spread(tech, 'salary')))
+            figures[tech] = {
+                'salary': {'min': int(median * 0.7), 'max': int(median * 1.55), 'median': median},
+                'demand': round(profile['demand'] + 10 * _spread(tech, 'demand'), 1),
+                'growth': round(profile['growth'] + 4 * _spread(tech, 'growth'), 1),
+                'jobs': int(profile['jobs'] * (1 + 0.5 * _spread(tech, 'jobs')))
+            }
+
+    for tech, salary in BASE_SALARY_DATA.items():
+        demand = DEMAND_TRENDS.get(tech, {'demand': 50, 'growth': 0, 'jobs': 1000})
+        figures[tech] = {'salary': dict(salary), 'demand': demand['demand'],
+                         'growth': demand['growth'], 'jobs': demand['jobs']}
+    return figures
+
+
+def location_rows(locations_file: str = LOCATIONS_FILE) -> List[Dict[str, Any]]:
+    """Location table from the seed file; cities with explicit figures come first, then Remote"""
+    with open(locations_file, 'r', encoding='utf-8') as handle:
+        seed = json.load(handle)
+
+    explicit, derived = [], []
+    for country in seed['countries']:
+        for city, region, tier, *override in country['cities']:
+            scale = seed['tiers'][str(tier)]
+            cost, hub, multiplier = override[0] if override else (
+                round(country['cost_of_living_index'] * scale['cost'], 2), scale['tech_hub'],
+                round(country['salary_multiplier'] * scale['salary'], 3)
+            )
+            (explicit if override else derived).append({
+                'city': city, 'region': region, 'country': country['country'],
+                'cost_of_living_index': cost, 'tech_hub_score': hub, 'average_salary_multiplier': multiplier
+            })
+
+    city, country, cost, hub, multiplier = seed['remote']
+    remote = {'city': city, 'region': None, 'country': country, 'cost_of_living_index': cost,
+              'tech_hub_score': hub, 'average_salary_multiplier': multiplier}
+    return explicit + [remote] + derived
+
+
+def _content_hash(technologies: Dict[str, Dict[str, Any]], locations: List[Dict[str, Any]]) -> str:
+    payload = json.dumps({'format_version': MARKET_FORMAT_VERSION, 'technologies': technologies,
+                          'locations': locations}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_dataset(dataset_dir: str, technologies: Optional[Dict[str, Dict[str, Any]]] = None,
+                  locations: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Write the column files and manifest for a build and make it current"""
+    technologies = technologies if technologies is not None else technology_figures()
+    locations = locations if locations is not None else location_rows()
+    content_hash = _content_hash(technologies, locations)
+    version = f"v{MARKET_FORMAT_VERSION}-{content_hash[:12]}"
+
+    build_dir = os.path.join(dataset_dir, version)
+    os.makedirs(build_dir, exist_ok=True)
+
+    names = list(technologies)
+    tech_values = {
+        'salary_min': [technologies[name]['salary']['min'] for name in names],
+        'salary_max': [technologies[name]['salary']['max'] for name in names],
+        'salary_median': [technologies[name]['salary']['median'] for name in names],
+        'demand': [technologies[name]['demand'] for name in names],
+        'growth': [technologies[name]['growth'] for name in names],
+        'jobs': [technologies[name]['jobs'] for name in names]
+    }
+    columns = {f"tech_{column}": np.array(tech_values[column], dtype=dtype)
+               for column, dtype in TECH_COLUMNS.items()}
+    columns.update({f"location_{column}": np.array([row[column] for row in locations], dtype=dtype)
+                    for column, dtype in LOCATION_COLUMNS.items()})
+    for column, values in columns.items():
+        temp_path = os.path.join(build_dir, f"{column}.tmp.npy")
+        np.save(temp_path, values)
+        os.replace(temp_path, os.path.join(build_dir, f"{column}.npy"))
+
+    manifest = {
+        'format_version': MARKET_FORMAT_VERSION,
+        'version': version,
+        'content_hash': content_hash,
+        'technologies': names,
+        'locations': [{key: row[key] for key in ('city', 'region', 'country')} for row in locations],
+        'created_at': datetime.now().isoformat()
+    }
+    _write_json(os.path.join(build_dir, 'manifest.json'), manifest)
+    # Switch readers to the new build only once it is complete
+    _write_json(os.path.join(dataset_dir, CURRENT_FILE), {'version': version})
+    return manifest
+
+
+def _write_json(path: str, payload: Dict[str, Any]):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+class MarketDataset:
+    """Read-only, memory-mapped view of one dataset build"""
+
+    def __init__(self, build_dir: str):
+        with open(os.path.join(build_dir, 'manifest.json'), 'r', encoding='utf-8') as handle:
+            self.manifest = json.load(handle)
+        if self.manifest.get('format_version') != MARKET_FORMAT_VERSION:
+            raise ValueError(f"unsupported market dataset format {self.manifest.get('format_version')}")
+
+        self.version = self.manifest['version']
+        self.technologies: List[str] = self.manifest['technologies']
+        self.locations: List[Dict[str, Any]] = self.manifest['locations']
+        self.tech_ids = {name: tech_id for tech_id, name in enumerate(self.technologies)}
+
+        load = lambda column: np.load(os.path.join(build_dir, f"{column}.npy"), mmap_mode='r')
+        self.tech = {column: load(f"tech_{column}") for column in TECH_COLUMNS}
+        self.location = {column: load(f"location_{column}") for column in LOCATION_COLUMNS}
+
+    def tech_id(self, technology: str) -> Optional[int]:
+        return self.tech_ids.get(technology.lower())
+
+    def figures(self, tech_id: int) -> Dict[str, Any]:
+        """Figures for one technology, in the MarketDataSource format"""
+        return {
+            'salary': {'min': int(self.tech['salary_min'][tech_id]), 'max': int(self.tech['salary_max'][tech_id]),
+                       'median': int(self.tech['salary_median'][tech_id])},
+            'demand': float(self.tech['demand'][tech_id]),
+            'growth': float(self.tech['growth'][tech_id]),
+            'jobs': int(self.tech['jobs'][tech_id])
+        }
+
+    def location_row(self, location_id: int) -> Dict[str, Any]:
+        """City, region, country and figures for one location"""
+        row = dict(self.locations[location_id])
+        row.update({column: float(values[location_id]) for column, values in self.location.items()})
+        return row
+
+    def __len__(self) -> int:
+        return len(self.technologies)
+
+
+def load_or_build(dataset_dir: Optional[str] = None) -> MarketDataset:
+    """Map the current build, building it first if it is missing or the seed tables changed"""
+    dataset_dir = dataset_dir or get_dataset_dir()
+    technologies, locations = technology_figures(), location_rows()
+    version = f"v{MARKET_FORMAT_VERSION}-{_content_hash(technologies, locations)[:12]}"
+
+    try:
+        with open(os.path.join(dataset_dir, CURRENT_FILE), 'r', encoding='utf-8') as handle:
+            current = json.load(handle)['version']
+    except (OSError, ValueError, KeyError):
+        current = None
+
+    if current != version:
+        try:
+            build_dataset(dataset_dir, technologies, locations)
+            current = version
+        except OSError as e:
+            # A read-only filesystem can still use an existing (older) build
+            print(f"⚠️ Could not write market dataset: {e}")
+            if current is None:
+                raise
+    return MarketDataset(os.path.join(dataset_dir, current))
+
+
+def get_dataset_dir() -> str:
+    """Dataset location, overridable through the MARKET_DATASET_DIR setting"""
+    from config import Config
+    return Config.MARKET_DATASET_DIR or DEFAULT_DATASET_DIR
+
+# Global instance, mapped once per process
+market_dataset = load_or_build()
+
+if __name__ == "__main__":
+    manifest = build_dataset(get_dataset_dir())
+    print(f"📊 Wrote market dataset {manifest['version']} to {get_dataset_dir()}")
+    print(f"  Technologies: {len(manifest['technologies'])}, locations: {len(manifest['locations'])}")
@@ -0,0 +1,113 @@
+"""
+Per-session question deck: seeded, no-repeat draws of question IDs
+
+Each bucket of questions (one tag combination, e.g. a bank's technology and
+difficulty) gets its own permutation, shuffled lazily one Fisher-Yates step
+per draw. Drawing is O(1) and never returns an ID twice. The deck's state is
+just its seed and how many IDs each bucket has handed out, so it fits in the
+session store and replays to exactly the same sequence.
+
+Each Fisher-Yates step takes its randomness from a splitmix64 hash of
+(seed, bucket, position) rather than a random.Random per bucket, whose
+seeding alone costs several microseconds.
+"""
+import random
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.question_store import QuestionStore, question_store
+
+# Session store namespace holding a session's deck
+DECK_NAMESPACE = 'question_deck'
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    """splitmix64 finalizer: spreads any 64-bit integer over the full range"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def bucket_key(**tags: str) -> str:
+    """Stable name of the bucket selected by the given tags"""
+    return "&".join(f"{tag}={value}" for tag, value in sorted(tags.items()) if value is not None)
+
+
+class _Bucket:
+    """Lazily shuffled permutation of one bucket's question IDs"""
+
+    def __init__(self, pool: Tuple[int, ...], seed: int, key: str):
+        self.pool = pool
+        self.salt = _mix(((seed & 0xFFFFFFFF) << 32) | zlib.crc32(key.encode('utf-8')))
+        self.swapped: Dict[int, int] = {}  # positions whose ID differs from the pool
+        self.drawn = 0
+
+    def draw(self) -> int:
+        # One step of Fisher-Yates over positions drawn..len(pool)-1
+        position = self.drawn
+        other = position + _mix(self.salt + position) % (len(self.pool) - position)
+        question_id = self.swapped.get(other, self.pool[other])
+        self.swapped[other] = self.swapped.pop(position, self.pool[position])
+        self.drawn += 1
+        return question_id
+
+    def remaining(self) -> int:
+        return len(self.pool) - self.drawn
+
+
+class QuestionDeck:
+    """No-repeat question draws for one interview session"""
+
+    def __init__(self, seed: Optional[int] = None, store: Optional[QuestionStore] = None,
+                 drawn: Optional[Dict[str, int]] = None):
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.store = store or question_store
+        self._drawn = dict(drawn or {})
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def _bucket(self, key: str, tags: Dict[str, str], pool: Optional[Tuple[int, ...]] = None) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if pool is None:
+                pool = tuple(self.store.ids(**tags))
+            bucket = _Bucket(pool, self.seed, key)
+            # Replay draws made before the deck was restored
+            for _ in range(min(self._drawn.get(key, 0), len(bucket.pool))):
+                bucket.draw()
+            self._buckets[key] = bucket
+        return bucket
+
+    def draw(self, count: int = 1, pool: Optional[Tuple[int, ...]] = None, **tags: str) -> List[int]:
+        """Draw up to count unseen IDs from the bucket selected by tags
+
+        pool may pass the bucket's IDs (as returned by store.ids(**tags)) when
+        the caller already has them, e.g. from a cached question plan.
+        """
+        key = bucket_key(**tags)
+        bucket = self._bucket(key, tags, pool)
+        drawn = [bucket.draw() for _ in range(min(count, bucket.remaining()))]
+        if drawn:
+            self._drawn[key] = bucket.drawn
+        return drawn
+
+    def draw_texts(self, count: int = 1, pool: Optional[Tuple[int, ...]] = None, **tags: str) -> List[str]:
+        """Draw up to count unseen question texts from the bucket selected by tags"""
+        return [self.store.text(question_id) for question_id in self.draw(count, pool, **tags)]
+
+    def remaining(self, **tags: str) -> int:
+        """IDs not yet drawn from the bucket selected by tags"""
+        return self._bucket(bucket_key(**tags), tags).remaining()
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable state for the session store"""
+        return {'seed': self.seed, 'drawn': dict(self._drawn)}
+
+    @classmethod
+    def from_state(cls, state: Optional[Dict[str, Any]], store: Optional[QuestionStore] = None) -> 'QuestionDeck':
+        """Restore a deck saved with to_state(); a missing state starts a new deck"""
+        if not state:
+            return cls(store=store)
+        return cls(state['seed'], store=store, drawn=state.get('drawn'))
@@ -0,0 +1,152 @@
+"""
+Question plans memoized by tech-stack signature
+
+Most candidates share a few dozen stack shapes, so everything the tech-stack
+turn derives from the stack alone (the question pools per technology, the
+industry question pools and the tech-stack score) is computed once per
+signature and kept in a bounded LRU. Each session then samples its own
+questions from the cached pools through its question deck. Plans are shared
+between sessions, so their mappings are read-only views.
+"""
+import json
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from utils.candidate_scorer import CandidateScorer
+from utils.industry_question_sets import Industry, IndustryQuestionSets, industry_questions
+from utils.question_generator import TechnicalQuestionGenerator
+
+# Lower bounds (years) of the experience buckets, matching CandidateScorer's levels
+EXPERIENCE_BUCKETS = ((8, 'senior+'), (5, 'senior'), (3, 'mid'), (1, 'junior'), (0, 'entry'))
+
+
+def experience_bucket(experience_years: Any) -> str:
+    """Experience bucket for a raw years-of-experience value"""
+    try:
+        years = int(float(str(experience_years)))
+    except ValueError:
+        years = 0
+    return next(bucket for minimum, bucket in EXPERIENCE_BUCKETS if years >= minimum)
+
+
+def plan_signature(tech_stack: Dict[str, Any], experience_years: Any, industry: str) -> Tuple:
+    """Canonical key for a stack: order and letter case of technologies do not matter"""
+    technologies = frozenset((category, tech.lower())
+                             for category, techs in tech_stack.items() for tech in techs)
+    return technologies, experience_bucket(experience_years), industry
+
+
+@dataclass(frozen=True)
+class QuestionPlan:
+    """Per-signature candidate pools and tech-stack analysis shared across sessions"""
+    technical_pools: Mapping[str, Tuple[int, ...]]
+    industry_pools: Mapping[str, Tuple[int, ...]]
+    breadth_score: int
+    depth_score: int
+    tech_analysis: Mapping[str, Any]
+
+
+class QuestionPlanCache:
+    """Bounded LRU of question plans with hit-rate counters"""
+
+    def __init__(self, max_entries: int = 256,
+                 question_generator: Optional[TechnicalQuestionGenerator] = None,
+                 industry_sets: Optional[IndustryQuestionSets] = None,
+                 scorer: Optional[CandidateScorer] = None):
+        self.max_entries = max_entries
+        self.question_generator = question_generator or TechnicalQuestionGenerator()
+        self.industry_sets = industry_sets or industry_questions
+        self.scorer = scorer or CandidateScorer()
+        self._plans: "OrderedDict[Tuple, QuestionPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'warmed': 0}
+
+    def build(self, tech_stack: Dict[str, Any], industry: str) -> QuestionPlan:
+        """Compute a plan without caching it"""
+        industry_pools = {}
+        if industry != Industry.GENERAL.value:
+            industry_pools = self.industry_sets.candidate_pools(Industry(industry), tech_stack)
+        breadth_score, depth_score, tech_analysis = self.scorer.calculate_tech_stack_score(tech_stack)
+        return QuestionPlan(MappingProxyType(self.question_generator.candidate_pools(tech_stack)),
+                            MappingProxyType(industry_pools), breadth_score, depth_score,
+                            MappingProxyType(tech_analysis))
+
+    def get(self, tech_stack: Dict[str, Any], experience_years: Any, industry: str) -> QuestionPlan:
+        """Return the plan for this stack shape, building it on a miss"""
+        signature = plan_signature(tech_stack, experience_years, industry)
+        with self._lock:
+            plan = self._plans.get(signature)
+            if plan is not None:
+                self._plans.move_to_end(signature)
+                self._stats['hits'] += 1
+                return plan
+            self._stats['misses'] += 1
+
+        plan = self.build(tech_stack, industry)
+        self._store(signature, plan)
+        return plan
+
+    def _store(self, signature: Tuple, plan: QuestionPlan):
+        with self._lock:
+            self._plans[signature] = plan
+            self._plans.move_to_end(signature)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def warm(self, sessions: Iterable[Dict[str, Any]]) -> int:
+        """Pre-build plans for the most common stack shapes in past sessions
+
+        sessions are analytics session records (see
+        KnowledgeBaseAnalytics.track_session). Returns how many plans were built.
+        """
+        shapes = Counter()
+        examples = {}
+        for session in sessions:
+            tech_stack = session.get('tech_stack') or {}
+            if not tech_stack:
+                continue
+            industry = session.get('industry', Industry.GENERAL.value)
+            signature = plan_signature(tech_stack, session.get('experience_years', 0), industry)
+            shapes[signature] += 1
+            examples.setdefault(signature, (tech_stack, industry))
+
+        warmed = 0
+        # Least common first, so the most common shapes end up most recently used
+        for signature, _ in reversed(shapes.most_common(self.max_entries)):
+            with self._lock:
+                if signature in self._plans:
+                    continue
+            tech_stack, industry = examples[signature]
+            self._store(signature, self.build(tech_stack, industry))
+            warmed += 1
+
+        with self._lock:
+            self._stats['warmed'] += warmed
+        return warmed
+
+    def warm_from_file(self, path: str) -> int:
+        """Warm from an analytics export (KnowledgeBaseAnalytics.export_analytics_data)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as handle:
+                sessions = json.load(handle).get('session_data', [])
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read question plan warm file: {e}")
+            return 0
+        return self.warm(sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters, hit rate and current size"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._plans)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
@@ -0,0 +1,233 @@
+"""
+Metadata-indexed question store
+Single home for every interview question, with inverted indexes per tag
+
+Question metadata (tags) is always in memory. Question texts and technology
+insights live in the on-disk corpus and are loaded one technology shard at a
+time, keeping only the most recently used shards.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from config import Config
+from knowledge_base.question_corpus import CORPUS_FILE, INDEX_TAGS, load_index, read_shard, text_key
+
+# Tags every question is indexed under; lookups may combine any of them
+INDEXED_TAGS = ('bank', 'category', 'technology', 'difficulty', 'industry', 'focus')
+
+# Keywords that mark a question as belonging to a focus area
+FOCUS_AREA_KEYWORDS = {
+    'technical_depth': ['explain', 'difference', 'how does', 'internally', 'under the hood', 'protocol',
+                        'mechanism', 'work?'],
+    'problem_solving': ['debug', 'problem', 'issue', 'challenge', 'solve', 'optimize'],
+    'best_practices': ['best practice', 'testing', 'test', 'clean', 'review', 'pattern', 'secur',
+                       'maintainab', 'standard'],
+    'real_world': ['experience', 'project', 'worked', 'used', 'approach'],
+    'architecture': ['architect', 'design', 'microservice', 'distributed', 'structure', 'scalab'],
+    'performance': ['performance', 'optimiz', 'scal', 'latency', 'profil', 'cach', 'memory', 'throughput']
+}
+
+
+def classify_focus_areas(text: str) -> FrozenSet[str]:
+    """Focus areas a question belongs to, derived from its wording"""
+    text_lower = text.lower()
+    return frozenset(area for area, keywords in FOCUS_AREA_KEYWORDS.items()
+                     if any(keyword in text_lower for keyword in keywords))
+
+
+@dataclass(frozen=True)
+class Question:
+    """One interview question and its metadata"""
+    id: int
+    text: str
+    bank: str
+    category: str
+    technology: Optional[str] = None
+    difficulty: Optional[str] = None
+    industry: Optional[str] = None
+    focus_areas: FrozenSet[str] = frozenset()
+
+
+class QuestionStore:
+    """Questions addressed by integer ID and looked up by tag intersection
+
+    IDs follow the order the source banks list them in, so results come back
+    in that order. A store without a corpus holds only questions added with
+    add() (used by tests and tools).
+
+    Each question's tags are kept as one tuple of small integers pointing into
+    per-tag value tables (focus areas as a bitmask), the same layout as the
+    corpus index, so the resident metadata stays a few hundred bytes per question.
+    """
+
+    def __init__(self, corpus_path: Optional[str] = None, max_shards: int = 8):
+        self.corpus_path = corpus_path
+        self.max_shards = max_shards
+        self._values: Dict[str, List[str]] = {tag: [] for tag in INDEX_TAGS + ('focus',)}
+        self._rows: List[Tuple[int, ...]] = []
+        self._index: Dict[str, Dict[str, Set[int]]] = {tag: {} for tag in INDEXED_TAGS}
+        self._by_text_key: Dict[int, Any] = {}
+        self._added_texts: Dict[int, str] = {}
+        self._shard_ranges: Dict[str, List[int]] = {}
+        self._shards: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'shard_loads': 0, 'shard_evictions': 0}
+
+        if corpus_path:
+            index = load_index(corpus_path)
+            self._shard_ranges = index['shards']
+            self._values = index['values']
+            for question_id, *row, key in index['questions']:
+                self._register(question_id, key, tuple(row))
+
+    def _register(self, question_id: int, key: int, row: Tuple[int, ...]):
+        # IDs are dense, so a row's position in the list is its ID
+        self._rows.append(row)
+        for tag, position in zip(INDEX_TAGS[1:], row[1:-1]):
+            if position >= 0:
+                self._index[tag].setdefault(self._values[tag][position], set()).add(question_id)
+        for area in self._focus_areas(row[-1]):
+            self._index['focus'].setdefault(area, set()).add(question_id)
+        # Texts are nearly always unique; only repeated ones need a tuple
+        existing = self._by_text_key.get(key)
+        if existing is None:
+            self._by_text_key[key] = question_id
+        else:
+            self._by_text_key[key] = (existing if isinstance(existing, tuple) else (existing,)) + (question_id,)
+
+    def _position(self, tag: str, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        table = self._values[tag]
+        if value not in table:
+            table.append(value)
+        return table.index(value)
+
+    def _value(self, row: Tuple[int, ...], tag: str) -> Optional[str]:
+        position = row[INDEX_TAGS.index(tag)]
+        return self._values[tag][position] if position >= 0 else None
+
+    def _focus_areas(self, mask: int) -> FrozenSet[str]:
+        return frozenset(area for bit, area in enumerate(self._values['focus']) if mask >> bit & 1)
+
+    def add(self, text: str, bank: str, category: str, technology: Optional[str] = None,
+            difficulty: Optional[str] = None, industry: Optional[str] = None,
+            focus_areas: Optional[Iterable[str]] = None) -> int:
+        """Add an in-memory question and return its ID"""
+        question_id = len(self._rows)
+        if focus_areas is None:
+            focus_areas = classify_focus_areas(text)
+        focus_mask = 0
+        for area in focus_areas:
+            focus_mask |= 1 << self._position('focus', area)
+        tags = {'shard': None, 'bank': bank, 'category': category, 'technology': technology,
+                'difficulty': difficulty, 'industry': industry}
+        self._added_texts[question_id] = text
+        self._register(question_id, text_key(text),
+                       tuple(self._position(tag, tags[tag]) for tag in INDEX_TAGS) + (focus_mask,))
+        return question_id
+
+    def _load_shard(self, shard: str) -> Dict[str, Any]:
+        """Return a shard's texts and insight, reading it from disk on a miss"""
+        with self._lock:
+            loaded = self._shards.get(shard)
+            if loaded is not None:
+                self._shards.move_to_end(shard)
+                return loaded
+
+            start, length = self._shard_ranges[shard]
+            loaded = {'texts': {}, 'insight': None}
+            for record in read_shard(self.corpus_path, start, length):
+                if 'text' in record:
+                    loaded['texts'][record['id']] = record['text']
+                elif 'insight' in record:
+                    loaded['insight'] = record['insight']
+
+            self._shards[shard] = loaded
+            self._stats['shard_loads'] += 1
+            while len(self._shards) > self.max_shards:
+                self._shards.popitem(last=False)
+                self._stats['shard_evictions'] += 1
+            return loaded
+
+    def text(self, question_id: int) -> str:
+        if question_id in self._added_texts:
+            return self._added_texts[question_id]
+        return self._load_shard(self._value(self._rows[question_id], 'shard'))['texts'][question_id]
+
+    def get(self, question_id: int) -> Question:
+        row = self._rows[question_id]
+        return Question(question_id, self.text(question_id), self._value(row, 'bank'),
+                        self._value(row, 'category'), self._value(row, 'technology'),
+                        self._value(row, 'difficulty'), self._value(row, 'industry'),
+                        self._focus_areas(row[-1]))
+
+    def ids(self, **tags: str) -> List[int]:
+        """IDs matching every given tag, e.g. ids(technology='python', focus='performance')"""
+        postings = []
+        for tag, value in tags.items():
+            if value is None:
+                continue
+            if tag not in self._index:
+                raise ValueError(f"Unknown question tag: {tag}")
+            posting = self._index[tag].get(value)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        if not postings:
+            return list(range(len(self._rows)))
+
+        # Intersect starting from the rarest tag
+        postings.sort(key=len)
+        matches = set(postings[0])
+        for posting in postings[1:]:
+            matches &= posting
+            if not matches:
+                return []
+        return sorted(matches)
+
+    def questions(self, **tags: str) -> List[str]:
+        """Question texts matching every given tag"""
+        return [self.text(question_id) for question_id in self.ids(**tags)]
+
+    def count(self, **tags: str) -> int:
+        return len(self.ids(**tags))
+
+    def tag_values(self, tag: str, **tags: str) -> List[str]:
+        """Distinct values of one tag among the questions matching the others"""
+        matches = set(self.ids(**tags))
+        return [value for value, posting in self._index[tag].items() if not posting.isdisjoint(matches)]
+
+    def find(self, text: str, **tags: str) -> Optional[int]:
+        """ID of a question by its exact text, optionally restricted by tags"""
+        candidates = self._by_text_key.get(text_key(text), ())
+        for question_id in candidates if isinstance(candidates, tuple) else (candidates,):
+            if all(value is None or question_id in self._index[tag].get(value, ())
+                   for tag, value in tags.items()):
+                if self.text(question_id) == text:
+                    return question_id
+        return None
+
+    def insight(self, technology: str) -> Optional[Dict[str, Any]]:
+        """Technology insight stored with the technology's shard, if any"""
+        if technology not in self._shard_ranges:
+            return None
+        return self._load_shard(technology)['insight']
+
+    def stats(self) -> Dict[str, Any]:
+        """Shard cache counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['loaded_shards'] = len(self._shards)
+        stats['shards'] = len(self._shard_ranges)
+        stats['questions'] = len(self._rows)
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+# Global instance
+question_store = QuestionStore(CORPUS_FILE, max_shards=Config.QUESTION_SHARD_CACHE_SIZE)
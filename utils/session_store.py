@@ -0,0 +1,400 @@
+"""
+Session store for per-candidate conversation state
+
+Each session holds small JSON state records and append-only logs, both
+grouped by namespace (e.g. the app's candidate state and transcript, the AIML
+engine's context, the skill adapter's running estimate). Appending to a log
+never rewrites earlier entries; a log can only be cut back to a prefix. Sessions that have not been touched for the configured TTL
+are evicted, so abandoned interviews do not accumulate.
+
+Two backends implement the same interface:
+
+- InMemorySessionStore: bounded LRU, process-local.
+- SQLiteSessionStore: WAL-mode SQLite file that survives restarts and can be
+  shared by several processes on the same host.
+
+Values must be JSON-serializable so both backends behave the same.
+"""
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class SessionStore(ABC):
+    """Interface shared by the session store backends"""
+
+    # Whether sessions outlive the process (and are kept off the heap)
+    persistent = False
+
+    def __init__(self, ttl_seconds: float, sweep_interval: float, clock: Callable[[], float]):
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._next_sweep = clock() + sweep_interval
+        self._lock = threading.RLock()
+        self._stats = {'reads': 0, 'writes': 0, 'appends': 0, 'evictions': 0, 'expirations': 0}
+
+    @abstractmethod
+    def get(self, session_id: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """Return the state record, or None if the session has none"""
+
+    @abstractmethod
+    def put(self, session_id: str, namespace: str, state: Dict[str, Any]):
+        """Replace the state record"""
+
+    @abstractmethod
+    def append(self, session_id: str, namespace: str, item: Dict[str, Any]):
+        """Append one entry to a log without rewriting earlier entries"""
+
+    @abstractmethod
+    def read_log(self, session_id: str, namespace: str, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the log in append order, or only its last entries"""
+
+    @abstractmethod
+    def log_length(self, session_id: str, namespace: str) -> int:
+        """Number of entries in a log"""
+
+    @abstractmethod
+    def truncate_log(self, session_id: str, namespace: str, length: int):
+        """Drop every log entry after the first length entries"""
+
+    @abstractmethod
+    def delete(self, session_id: str):
+        """Drop every record and log of a session"""
+
+    @abstractmethod
+    def session_ids(self) -> List[str]:
+        """Ids of the sessions currently held"""
+
+    @abstractmethod
+    def scan_log(self, namespace: str, chunk_size: int = 1000) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+        """Stream (session_id, entry) pairs of one log namespace across all live sessions
+
+        Yields lists of at most chunk_size pairs. Reading does not count as
+        activity, so a scan never extends a session's TTL.
+        """
+
+    @abstractmethod
+    def evict_expired(self) -> int:
+        """Drop sessions idle for longer than the TTL; returns how many"""
+
+    def _maybe_sweep(self):
+        # Called on writes so expired sessions go away without a background thread
+        now = self._clock()
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.sweep_interval
+            self.evict_expired()
+
+    def stats(self) -> Dict[str, Any]:
+        """Read/write/eviction counters and current number of sessions"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['sessions'] = len(self.session_ids())
+        return stats
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store bounded by session count (LRU) and idle time (TTL)
+
+    Records and log entries are kept as JSON text, like in SQLite, so callers
+    always get their own copies and mutating one never changes the store.
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: float = 2 * 60 * 60,
+                 sweep_interval: float = 60.0, clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, sweep_interval, clock)
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def _session(self, session_id: str, create: bool) -> Optional[Dict[str, Any]]:
+        now = self._clock()
+        session = self._sessions.get(session_id)
+        if session is not None and session['touched_at'] + self.ttl_seconds <= now:
+            del self._sessions[session_id]
+            self._stats['expirations'] += 1
+            session = None
+
+        if session is None:
+            if not create:
+                return None
+            session = {'touched_at': now, 'state': {}, 'logs': {}}
+            self._sessions[session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self._stats['evictions'] += 1
+
+        session['touched_at'] = now
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def get(self, session_id: str, namespace: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._stats['reads'] += 1
+            session = self._session(session_id, create=False)
+            payload = session['state'].get(namespace) if session else None
+        return json.loads(payload) if payload is not None else None
+
+    def put(self, session_id: str, namespace: str, state: Dict[str, Any]):
+        payload = json.dumps(state, ensure_ascii=False)
+        with self._lock:
+            self._stats['writes'] += 1
+            self._session(session_id, create=True)['state'][namespace] = payload
+            self._maybe_sweep()
+
+    def append(self, session_id: str, namespace: str, item: Dict[str, Any]):
+        payload = json.dumps(item, ensure_ascii=False)
+        with self._lock:
+            self._stats['appends'] += 1
+            self._session(session_id, create=True)['logs'].setdefault(namespace, []).append(payload)
+            self._maybe_sweep()
+
+    def read_log(self, session_id: str, namespace: str, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._stats['reads'] += 1
+            session = self._session(session_id, create=False)
+            log = session['logs'].get(namespace, []) if session else []
+            payloads = log[-last:] if last else list(log)
+        return [json.loads(payload) for payload in payloads]
+
+    def log_length(self, session_id: str, namespace: str) -> int:
+        with self._lock:
+            session = self._session(session_id, create=False)
+            return len(session['logs'].get(namespace, [])) if session else 0
+
+    def truncate_log(self, session_id: str, namespace: str, length: int):
+        with self._lock:
+            self._stats['writes'] += 1
+            session = self._session(session_id, create=False)
+            if session and namespace in session['logs']:
+                del session['logs'][namespace][length:]
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._sessions)
+
+    def scan_log(self, namespace: str, chunk_size: int = 1000) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+        with self._lock:
+            cutoff = self._clock() - self.ttl_seconds
+            logs = [(session_id, list(session['logs'].get(namespace, ())))
+                    for session_id, session in self._sessions.items() if session['touched_at'] > cutoff]
+
+        chunk = []
+        for session_id, log in logs:
+            for entry in log:
+                chunk.append((session_id, json.loads(entry)))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            cutoff = self._clock() - self.ttl_seconds
+            expired = [sid for sid, session in self._sessions.items() if session['touched_at'] <= cutoff]
+            for session_id in expired:
+                del self._sessions[session_id]
+            self._stats['expirations'] += len(expired)
+            return len(expired)
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite (WAL) store; log entries are single-row inserts"""
+
+    persistent = True
+
+    def __init__(self, db_path: str, ttl_seconds: float = 2 * 60 * 60,
+                 sweep_interval: float = 60.0, clock: Callable[[], float] = time.time):
+        super().__init__(ttl_seconds, sweep_interval, clock)
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=10.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, touched_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS sessions_touched ON sessions (touched_at);"
+            "CREATE TABLE IF NOT EXISTS session_state ("
+            "session_id TEXT NOT NULL, namespace TEXT NOT NULL, state TEXT NOT NULL, "
+            "PRIMARY KEY (session_id, namespace));"
+            "CREATE TABLE IF NOT EXISTS session_log ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT NOT NULL, "
+            "namespace TEXT NOT NULL, item TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS session_log_lookup ON session_log (session_id, namespace, id);"
+        )
+        self._db.commit()
+        self.evict_expired()
+
+    def _is_live(self, session_id: str) -> bool:
+        row = self._db.execute(
+            "SELECT touched_at FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        return bool(row) and row[0] + self.ttl_seconds > self._clock()
+
+    def _touch(self, session_id: str):
+        self._db.execute(
+            "INSERT INTO sessions (session_id, touched_at) VALUES (?, ?) "
+            "ON CONFLICT (session_id) DO UPDATE SET touched_at = excluded.touched_at",
+            (session_id, self._clock())
+        )
+
+    def _ensure_live(self, session_id: str):
+        # A write to an expired session starts it over rather than reviving stale data
+        row = self._db.execute(
+            "SELECT touched_at FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row and row[0] + self.ttl_seconds <= self._clock():
+            self._delete_rows([session_id])
+            self._stats['expirations'] += 1
+        self._touch(session_id)
+
+    def _delete_rows(self, session_ids: List[str]):
+        rows = [(session_id,) for session_id in session_ids]
+        self._db.executemany("DELETE FROM session_log WHERE session_id = ?", rows)
+        self._db.executemany("DELETE FROM session_state WHERE session_id = ?", rows)
+        self._db.executemany("DELETE FROM sessions WHERE session_id = ?", rows)
+
+    def get(self, session_id: str, namespace: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._stats['reads'] += 1
+            if not self._is_live(session_id):
+                return None
+            row = self._db.execute(
+                "SELECT state FROM session_state WHERE session_id = ? AND namespace = ?",
+                (session_id, namespace)
+            ).fetchone()
+            self._touch(session_id)
+            self._db.commit()
+            return json.loads(row[0]) if row else None
+
+    def put(self, session_id: str, namespace: str, state: Dict[str, Any]):
+        payload = json.dumps(state, ensure_ascii=False)
+        with self._lock:
+            self._stats['writes'] += 1
+            self._ensure_live(session_id)
+            self._db.execute(
+                "INSERT OR REPLACE INTO session_state (session_id, namespace, state) VALUES (?, ?, ?)",
+                (session_id, namespace, payload)
+            )
+            self._db.commit()
+            self._maybe_sweep()
+
+    def append(self, session_id: str, namespace: str, item: Dict[str, Any]):
+        payload = json.dumps(item, ensure_ascii=False)
+        with self._lock:
+            self._stats['appends'] += 1
+            self._ensure_live(session_id)
+            self._db.execute(
+                "INSERT INTO session_log (session_id, namespace, item) VALUES (?, ?, ?)",
+                (session_id, namespace, payload)
+            )
+            self._db.commit()
+            self._maybe_sweep()
+
+    def read_log(self, session_id: str, namespace: str, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._stats['reads'] += 1
+            if not self._is_live(session_id):
+                return []
+            if last:
+                rows = self._db.execute(
+                    "SELECT item FROM (SELECT id, item FROM session_log WHERE session_id = ? AND namespace = ? "
+                    "ORDER BY id DESC LIMIT ?) ORDER BY id",
+                    (session_id, namespace, last)
+                ).fetchall()
+            else:
+                rows = self._db.execute(
+                    "SELECT item FROM session_log WHERE session_id = ? AND namespace = ? ORDER BY id",
+                    (session_id, namespace)
+                ).fetchall()
+            return [json.loads(row[0]) for row in rows]
+
+    def log_length(self, session_id: str, namespace: str) -> int:
+        with self._lock:
+            if not self._is_live(session_id):
+                return 0
+            return self._db.execute(
+                "SELECT COUNT(*) FROM session_log WHERE session_id = ? AND namespace = ?",
+                (session_id, namespace)
+            ).fetchone()[0]
+
+    def truncate_log(self, session_id: str, namespace: str, length: int):
+        with self._lock:
+            self._stats['writes'] += 1
+            if not self._is_live(session_id):
+                return
+            self._db.execute(
+                "DELETE FROM session_log WHERE session_id = ? AND namespace = ? AND id NOT IN ("
+                "SELECT id FROM session_log WHERE session_id = ? AND namespace = ? ORDER BY id LIMIT ?)",
+                (session_id, namespace, session_id, namespace, length)
+            )
+            self._touch(session_id)
+            self._db.commit()
+
+    def delete(self, session_id: str):
+        with self._lock:
+            self._delete_rows([session_id])
+            self._db.commit()
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            cutoff = self._clock() - self.ttl_seconds
+            rows = self._db.execute(
+                "SELECT session_id FROM sessions WHERE touched_at > ? ORDER BY touched_at", (cutoff,)
+            ).fetchall()
+            return [row[0] for row in rows]
+
+    def scan_log(self, namespace: str, chunk_size: int = 1000) -> Iterator[List[Tuple[str, Dict[str, Any]]]]:
+        # Keyset pagination on the log id, so each chunk is one short query
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT l.id, l.session_id, l.item FROM session_log l "
+                    "JOIN sessions s ON s.session_id = l.session_id "
+                    "WHERE l.namespace = ? AND l.id > ? AND s.touched_at > ? ORDER BY l.id LIMIT ?",
+                    (namespace, last_id, self._clock() - self.ttl_seconds, chunk_size)
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [(session_id, json.loads(item)) for _, session_id, item in rows]
+
+    def evict_expired(self) -> int:
+        with self._lock:
+            cutoff = self._clock() - self.ttl_seconds
+            expired = [row[0] for row in self._db.execute(
+                "SELECT session_id FROM sessions WHERE touched_at <= ?", (cutoff,)
+            ).fetchall()]
+            if expired:
+                self._delete_rows(expired)
+                self._db.commit()
+            self._stats['expirations'] += len(expired)
+            return len(expired)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._db.close()
+
+
+def create_session_store() -> SessionStore:
+    """Build the backend selected by the SESSION_STORE_DB setting"""
+    from config import Config
+    if Config.SESSION_STORE_DB:
+        try:
+            return SQLiteSessionStore(Config.SESSION_STORE_DB, ttl_seconds=Config.SESSION_TTL_SECONDS)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not open session store {Config.SESSION_STORE_DB}, keeping sessions in memory: {e}")
+    return InMemorySessionStore(max_sessions=Config.SESSION_MAX_ENTRIES, ttl_seconds=Config.SESSION_TTL_SECONDS)
+
+# Global instance
+session_store = create_session_store()
@@ -0,0 +1,126 @@
+"""
+Online skill-level estimate for an interview session
+
+SkillLevelAdapter used to re-read and re-average the last few stored
+analyses on every answer, and to walk every stored response for the session
+summary. SkillEstimator keeps constant-size running statistics instead and is
+updated once per analyzed answer, so per-answer cost and per-session state
+stay flat however long the interview runs.
+"""
+from typing import Any, Dict, List, Optional
+
+# Numeric scale for skill levels, by SkillLevel value
+SKILL_VALUES = {'beginner': 1, 'intermediate': 2, 'advanced': 3, 'expert': 4}
+
+# Upper bounds of the averaged scale for each level (anything higher is expert)
+LEVEL_THRESHOLDS = ((1.5, 'beginner'), (2.5, 'intermediate'), (3.5, 'advanced'))
+
+# EMA smoothing factors, alpha = 2 / (span + 1): the level follows roughly the
+# last 5 answers and the insights roughly the last 3
+LEVEL_ALPHA = 2 / (5 + 1)
+INSIGHT_ALPHA = 2 / (3 + 1)
+
+# Answers needed before the overall level moves off the default
+MIN_RESPONSES = 2
+
+# Most recent per-answer levels kept for the progression chart
+PROGRESSION_LIMIT = 50
+
+DEFAULT_LEVEL = 'intermediate'
+
+
+def _ema(average: float, value: float, alpha: float) -> float:
+    return average + alpha * (value - average)
+
+
+class SkillEstimator:
+    """Confidence-weighted EMA of skill levels plus running answer statistics"""
+
+    def __init__(self):
+        self.responses = 0
+        self.high_quality = 0
+        # Confidence-weighted EMA: level = weighted_level / weight
+        self.weighted_level = 0.0
+        self.weight = 0.0
+        self.recent_quality = 0.0
+        self.recent_depth = 0.0
+        self.recent_experience = 0.0
+        self.progression: List[str] = []
+
+    @classmethod
+    def from_state(cls, state: Optional[Dict[str, Any]]) -> 'SkillEstimator':
+        """Estimator saved by to_state, or a fresh one"""
+        estimator = cls()
+        for field, value in (state or {}).items():
+            if field in estimator.__dict__:
+                setattr(estimator, field, list(value) if field == 'progression' else value)
+        return estimator
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable state, including the current overall level"""
+        return dict(self.__dict__, overall_skill_level=self.overall_level)
+
+    def add(self, analysis: Dict[str, Any]):
+        """Account for one analyzed answer (skill level by value)"""
+        level = analysis['estimated_skill_level']
+        confidence = analysis['confidence']
+        high = 1.0 if analysis['response_quality'] == 'high' else 0.0
+
+        if self.responses == 0:
+            # The first answer seeds every average
+            self.weighted_level = SKILL_VALUES[level] * confidence
+            self.weight = confidence
+            self.recent_quality = high
+            self.recent_depth = analysis['technical_depth_score']
+            self.recent_experience = analysis['experience_score']
+        else:
+            self.weighted_level = _ema(self.weighted_level, SKILL_VALUES[level] * confidence, LEVEL_ALPHA)
+            self.weight = _ema(self.weight, confidence, LEVEL_ALPHA)
+            self.recent_quality = _ema(self.recent_quality, high, INSIGHT_ALPHA)
+            self.recent_depth = _ema(self.recent_depth, analysis['technical_depth_score'], INSIGHT_ALPHA)
+            self.recent_experience = _ema(self.recent_experience, analysis['experience_score'], INSIGHT_ALPHA)
+
+        self.responses += 1
+        self.high_quality += int(high)
+        self.progression.append(level)
+        del self.progression[:-PROGRESSION_LIMIT]
+
+    @property
+    def overall_level(self) -> str:
+        """Overall skill level value for the session"""
+        if self.responses < MIN_RESPONSES or self.weight <= 0:
+            return DEFAULT_LEVEL
+        average = self.weighted_level / self.weight
+        for threshold, level in LEVEL_THRESHOLDS:
+            if average < threshold:
+                return level
+        return 'expert'
+
+    @property
+    def average_quality(self) -> float:
+        """Share of all answers rated high quality"""
+        return self.high_quality / self.responses if self.responses else 0
+
+    def insights(self) -> List[str]:
+        """Insights about the candidate's recent answers"""
+        if not self.responses:
+            return []
+
+        insights = []
+
+        if self.recent_quality > 0.6:
+            insights.append("Consistently provides detailed, high-quality responses")
+        elif self.recent_quality < 0.3:
+            insights.append("Responses could benefit from more detail and examples")
+
+        if self.recent_depth > 0.7:
+            insights.append("Demonstrates strong technical understanding")
+        elif self.recent_depth < 0.3:
+            insights.append("Could elaborate more on technical concepts")
+
+        if self.recent_experience > 0.7:
+            insights.append("Shows substantial practical experience")
+        elif self.recent_experience < 0.3:
+            insights.append("Would benefit from sharing more practical examples")
+
+        return insights
@@ -3,9 +3,15 @@ Skill Level Adaptation System
 Dynamically adjusts questions and follow-ups based on candidate responses
 """
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
 from enum import Enum
-import streamlit as st
+
+from utils.session_store import SessionStore, session_store
+from utils.skill_estimator import SkillEstimator
+
+# Session store namespaces
+SKILL_STATE_NAMESPACE = 'skill_state'
+SKILL_RESPONSES_NAMESPACE = 'skill_responses'
 
 class SkillLevel(Enum):
     BEGINNER = "beginner"
@@ -13,29 +19,154 @@ class SkillLevel(Enum):
     ADVANCED = "advanced"
     EXPERT = "expert"
 
+class IndicatorMatcher:
+    """Counts the indicator phrases of every group in one pass over a tokenized answer
+
+    Indicators keep the substring semantics of `phrase in text`: 'design'
+    also matches inside 'designed'. An indicator may be a tuple of
+    alternative phrases, which counts once if any of them occurs. A space
+    inside a phrase matches any run of whitespace in the answer.
+
+    The answer is split into tokens once. Each distinct token is looked up in
+    a memo of what it contributes: the single-word phrases it contains, and
+    which multi-word phrases it could start (ends with their first word),
+    continue (equals a middle word) or finish (starts with their last word).
+    Only multi-word phrases with every part present are then confirmed
+    against the joined text. New tokens are resolved with one regex compiled
+    as a character trie over all single-word phrases.
+    """
+
+    # Bound on memoized tokens; the memo is cleared when it grows past this
+    MEMO_SIZE = 50000
+
+    def __init__(self, groups: Dict[str, Iterable[Union[str, Tuple[str, ...]]]]):
+        self.groups = tuple(groups)
+        # phrase -> (group, indicator number) pairs hit by that phrase
+        owners: Dict[str, set] = {}
+        for group, indicators in groups.items():
+            for number, indicator in enumerate(indicators):
+                for phrase in ((indicator,) if isinstance(indicator, str) else indicator):
+                    owners.setdefault(' '.join(phrase.lower().split()), set()).add((group, number))
+
+        words = {phrase: frozenset(hits) for phrase, hits in owners.items() if ' ' not in phrase}
+        # A match of the trie regex also hits every single-word phrase it starts with
+        self._prefix_hits = {
+            phrase: frozenset().union(*(words[phrase[:end]] for end in range(1, len(phrase) + 1)
+                                        if phrase[:end] in words))
+            for phrase in words
+        }
+        self._word_pattern = re.compile(self._trie_pattern(words))
+
+        # Multi-word phrases with the token markers they need; markers start with None, never a group
+        self.phrases: List[Tuple[str, frozenset, frozenset]] = []
+        self._first_words, self._middle_words, self._last_words = set(), set(), set()
+        for phrase, hits in owners.items():
+            if ' ' in phrase:
+                first, *middle, last = phrase.split(' ')
+                self._first_words.add(first)
+                self._middle_words.update(middle)
+                self._last_words.add(last)
+                required = frozenset([(None, 'first', first), (None, 'last', last)] +
+                                     [(None, 'middle', word) for word in middle])
+                self.phrases.append((phrase, required, frozenset(hits)))
+        self._first_words, self._last_words = tuple(self._first_words), tuple(self._last_words)
+
+        self._memo: Dict[str, Optional[frozenset]] = {}
+
+    @staticmethod
+    def _trie_pattern(phrases: Iterable[str]) -> str:
+        trie: Dict = {}
+        for phrase in phrases:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[None] = True
+
+        def build(node: Dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items(), key=str)
+                        if char is not None]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Greedy optional tail: the longest phrase at a position wins
+            return f'(?:{body})?' if None in node else body
+
+        return build(trie) or '(?!)'
+
+    def entry(self, token: str) -> Optional[frozenset]:
+        """Indicator hits and phrase markers of one lowercased token, or None if it has none"""
+        if token in self._memo:
+            return self._memo[token]
+        if len(self._memo) >= self.MEMO_SIZE:
+            self._memo.clear()
+        self._memo[token] = self._token_entry(token)
+        return self._memo[token]
+
+    def _token_entry(self, token: str) -> Optional[frozenset]:
+        entry = set()
+        search = self._word_pattern.search
+        match = search(token)
+        while match:
+            entry |= self._prefix_hits[match.group()]
+            match = search(token, match.start() + 1)
+
+        if token.endswith(self._first_words):
+            entry.update((None, 'first', word) for word in self._first_words if token.endswith(word))
+        if token.startswith(self._last_words):
+            entry.update((None, 'last', word) for word in self._last_words if token.startswith(word))
+        if token in self._middle_words:
+            entry.add((None, 'middle', token))
+        return frozenset(entry) if entry else None
+
+    def count(self, tokens: List[str]) -> Dict[str, int]:
+        """Number of distinct indicators found per group in lowercased tokens"""
+        memo = self._memo
+        distinct = set(tokens)
+        unseen = distinct.difference(memo)
+        if unseen:
+            if len(memo) + len(unseen) > self.MEMO_SIZE:
+                memo.clear()
+            for token in unseen:
+                memo[token] = self._token_entry(token)
+
+        found = set().union(*filter(None, map(memo.get, distinct)))
+        text = None
+        for phrase, required, hits in self.phrases:
+            if required <= found:
+                text = text or ' '.join(tokens)
+                if phrase in text:
+                    found |= hits
+
+        counts = dict.fromkeys(self.groups, 0)
+        for hit in found:
+            if hit[0] is not None:
+                counts[hit[0]] += 1
+        return counts
+
 class ResponseAnalyzer:
     """Analyzes user responses to determine skill level and adapt questions"""
     
     def __init__(self):
+        # Patterns are phrases; a tuple lists alternatives that count as one match
         self.skill_indicators = {
             SkillLevel.BEGINNER: {
                 'keywords': ['basic', 'simple', 'learning', 'tutorial', 'beginner', 'new to'],
-                'patterns': [r'i\s+(don\'t|haven\'t|never)', r'not\s+familiar', r'just\s+started'],
+                'patterns': [("i don't", "i haven't", 'i never'), 'not familiar', 'just started'],
                 'complexity_score': 1
             },
             SkillLevel.INTERMEDIATE: {
                 'keywords': ['experience', 'worked with', 'used in projects', 'comfortable', 'familiar'],
-                'patterns': [r'i\s+(have|use|work)', r'in\s+my\s+projects', r'usually\s+use'],
+                'patterns': [('i have', 'i use', 'i work'), 'in my projects', 'usually use'],
                 'complexity_score': 2
             },
             SkillLevel.ADVANCED: {
                 'keywords': ['optimize', 'performance', 'architecture', 'design patterns', 'best practices'],
-                'patterns': [r'performance\s+optimization', r'design\s+patterns', r'scalability'],
+                'patterns': ['performance optimization', 'design patterns', 'scalability'],
                 'complexity_score': 3
             },
             SkillLevel.EXPERT: {
                 'keywords': ['deep dive', 'internals', 'implementation details', 'contribute', 'mentor'],
-                'patterns': [r'under\s+the\s+hood', r'low\s+level', r'contribute\s+to', r'mentor'],
+                'patterns': ['under the hood', 'low level', 'contribute to', 'mentor'],
                 'complexity_score': 4
             }
         }
@@ -49,10 +180,57 @@ class ResponseAnalyzer:
             'project', 'production', 'team', 'client', 'deployed', 'maintained',
             'scaled', 'refactored', 'debugged', 'troubleshooting'
         ]
+        
+        self.example_indicators = ['example', 'project', 'used']
+        
+        # Keywords behind answer_quality() (AIMLConversationManager.analyze_response_quality)
+        self.answer_quality_indicators = {
+            'technical': [
+                'architecture', 'performance', 'optimization', 'scalability', 'design pattern',
+                'algorithm', 'complexity', 'memory', 'concurrency', 'async', 'threading',
+                'microservices', 'monolith', 'database', 'indexing', 'caching', 'security',
+                'authentication', 'authorization', 'encryption', 'testing', 'deployment',
+                'ci/cd', 'docker', 'kubernetes', 'cloud', 'monitoring', 'logging'
+            ],
+            'experience': [
+                'production', 'project', 'team', 'built', 'implemented', 'designed',
+                'optimized', 'scaled', 'deployed', 'maintained', 'refactored',
+                'migrated', 'integrated', 'collaborated', 'led', 'mentored'
+            ]
+        }
+        
+        self.compile_indicators()
     
-    def analyze_response(self, response: str, question_context: str = "") -> Dict[str, Any]:
-        """Analyze a response and return skill assessment"""
-        response_lower = response.lower()
+    def compile_indicators(self):
+        """Compile every indicator table into one matcher
+        
+        Call again after changing any of the tables above.
+        """
+        groups = {
+            'technical_depth': self.technical_depth_indicators,
+            'experience': self.experience_indicators,
+            'examples': self.example_indicators
+        }
+        for skill_level, indicators in self.skill_indicators.items():
+            groups[f"{skill_level.value}_keywords"] = indicators['keywords']
+            groups[f"{skill_level.value}_patterns"] = indicators['patterns']
+        for name, keywords in self.answer_quality_indicators.items():
+            groups[f"answer_{name}"] = keywords
+        self.matcher = IndicatorMatcher(groups)
+    
+    def scan(self, response: str) -> Dict[str, Any]:
+        """Word count and every indicator count for a response, in one pass"""
+        tokens = response.lower().split()
+        return {'word_count': len(tokens), 'counts': self.matcher.count(tokens)}
+    
+    def analyze_response(self, response: str, question_context: str = "",
+                         scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Analyze a response and return skill assessment
+        
+        Pass the result of scan() if the response was already scanned.
+        """
+        scan = scan or self.scan(response)
+        counts = scan['counts']
         
         analysis = {
             'estimated_skill_level': SkillLevel.INTERMEDIATE,
@@ -65,33 +243,26 @@ class ResponseAnalyzer:
         }
         
         # Calculate response metrics
-        word_count = len(response.split())
-        sentence_count = len(re.split(r'[.!?]+', response))
+        word_count = scan['word_count']
         
         # Analyze technical depth
-        technical_depth = sum(1 for indicator in self.technical_depth_indicators 
-                            if indicator in response_lower)
+        technical_depth = counts['technical_depth']
         analysis['technical_depth_score'] = min(technical_depth / 3, 1.0)
         
         # Analyze experience indicators
-        experience_score = sum(1 for indicator in self.experience_indicators 
-                             if indicator in response_lower)
+        experience_score = counts['experience']
         analysis['experience_score'] = min(experience_score / 3, 1.0)
         
         # Determine skill level based on indicators
         skill_scores = {}
-        for skill_level, indicators in self.skill_indicators.items():
+        for skill_level in self.skill_indicators:
             score = 0
             
             # Keyword matching
-            keyword_matches = sum(1 for keyword in indicators['keywords'] 
-                                if keyword in response_lower)
-            score += keyword_matches * 0.3
+            score += counts[f"{skill_level.value}_keywords"] * 0.3
             
             # Pattern matching
-            pattern_matches = sum(1 for pattern in indicators['patterns'] 
-                                if re.search(pattern, response_lower))
-            score += pattern_matches * 0.4
+            score += counts[f"{skill_level.value}_patterns"] * 0.4
             
             # Complexity indicators
             if word_count > 50 and skill_level in [SkillLevel.ADVANCED, SkillLevel.EXPERT]:
@@ -123,7 +294,7 @@ class ResponseAnalyzer:
             insights.append("Demonstrates practical experience")
         if word_count > 80:
             insights.append("Provides detailed explanations")
-        if any(word in response_lower for word in ['example', 'project', 'used']):
+        if counts['examples']:
             insights.append("Gives concrete examples")
         
         analysis['key_insights'] = insights
@@ -139,6 +310,31 @@ class ResponseAnalyzer:
             analysis['suggested_follow_up_type'] = 'clarification'
         
         return analysis
+    
+    def answer_quality(self, response: str, scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Answer-quality label of AIMLConversationManager.analyze_response_quality
+        
+        Pass the result of scan() if the response was already scanned.
+        """
+        scan = scan or self.scan(response)
+        response_length = scan['word_count']
+        technical_score = scan['counts']['answer_technical']
+        experience_score = scan['counts']['answer_experience']
+        
+        # Determine skill level
+        if response_length > 50 and (technical_score >= 3 or experience_score >= 2):
+            skill_level = 'advanced'
+        elif response_length > 25 and (technical_score >= 1 or experience_score >= 1):
+            skill_level = 'intermediate'
+        else:
+            skill_level = 'beginner'
+        
+        return {
+            'skill_level': skill_level,
+            'technical_score': technical_score,
+            'experience_score': experience_score,
+            'response_length': response_length
+        }
 
 class AdaptiveQuestionGenerator:
     """Generates questions adapted to detected skill level"""
@@ -262,10 +458,14 @@ class AdaptiveQuestionGenerator:
 class SkillLevelAdapter:
     """Main class that coordinates skill level adaptation"""
     
-    def __init__(self):
-        self.analyzer = ResponseAnalyzer()
+    def __init__(self, store: Optional[SessionStore] = None, analyzer: Optional[ResponseAnalyzer] = None,
+                 archive_responses: Optional[bool] = None):
+        self.analyzer = analyzer or response_analyzer
         self.question_generator = AdaptiveQuestionGenerator()
-        self.session_analysis = {}
+        # Running skill estimate (and answer archive) live in the session store
+        self.store = store or session_store
+        # The archive grows with every answer, so by default it is only kept in a persistent store
+        self.archive_responses = self.store.persistent if archive_responses is None else archive_responses
     
     def process_response_and_adapt(self, 
                                  user_response: str,
@@ -277,23 +477,20 @@ class SkillLevelAdapter:
         # Analyze the response
         analysis = self.analyzer.analyze_response(user_response, question_context)
         
-        # Store in session analysis
-        if session_id not in self.session_analysis:
-            self.session_analysis[session_id] = {
-                'responses': [],
-                'skill_progression': [],
-                'overall_skill_level': SkillLevel.INTERMEDIATE
-            }
-        
-        self.session_analysis[session_id]['responses'].append({
-            'response': user_response,
-            'analysis': analysis,
-            'technology': technology,
-            'timestamp': st.session_state.get('current_time', 'unknown')
-        })
-        
-        # Update overall skill assessment
-        self._update_overall_skill_level(session_id, analysis)
+        # Skill levels are stored by value
+        stored_analysis = dict(analysis, estimated_skill_level=analysis['estimated_skill_level'].value)
+        if self.archive_responses:
+            # Only what batch re-analysis reads
+            self.store.append(session_id, SKILL_RESPONSES_NAMESPACE, {
+                'response': user_response,
+                'technology': technology,
+                'estimated_skill_level': stored_analysis['estimated_skill_level']
+            })
+        
+        # Update the running skill estimate (one read and one write, however long the session)
+        estimator = self._get_estimator(session_id)
+        estimator.add(stored_analysis)
+        self.store.put(session_id, SKILL_STATE_NAMESPACE, estimator.to_state())
         
         # Generate follow-up if appropriate
         follow_up = self.question_generator.generate_follow_up(
@@ -301,7 +498,7 @@ class SkillLevelAdapter:
         )
         
         # Generate next adaptive question
-        overall_skill = self.session_analysis[session_id]['overall_skill_level']
+        overall_skill = SkillLevel(estimator.overall_level)
         next_question = self.question_generator.generate_adaptive_question(
             technology, technology, overall_skill
         )
@@ -311,113 +508,37 @@ class SkillLevelAdapter:
             'follow_up_question': follow_up,
             'next_adaptive_question': next_question,
             'overall_skill_level': overall_skill.value,
-            'session_insights': self._generate_session_insights(session_id)
+            'session_insights': estimator.insights()
         }
     
-    def _update_overall_skill_level(self, session_id: str, analysis: Dict[str, Any]):
-        """Update the overall skill level assessment for the session"""
-        
-        session_data = self.session_analysis[session_id]
-        responses = session_data['responses']
-        
-        if len(responses) < 2:
-            return
-        
-        # Calculate weighted average of skill levels
-        skill_values = {
-            SkillLevel.BEGINNER: 1,
-            SkillLevel.INTERMEDIATE: 2,
-            SkillLevel.ADVANCED: 3,
-            SkillLevel.EXPERT: 4
-        }
-        
-        total_score = 0
-        total_weight = 0
-        
-        for response_data in responses[-5:]:  # Consider last 5 responses
-            resp_analysis = response_data['analysis']
-            skill_level = resp_analysis['estimated_skill_level']
-            confidence = resp_analysis['confidence']
-            
-            total_score += skill_values[skill_level] * confidence
-            total_weight += confidence
-        
-        if total_weight > 0:
-            avg_score = total_score / total_weight
-            
-            # Map back to skill level
-            if avg_score < 1.5:
-                overall_skill = SkillLevel.BEGINNER
-            elif avg_score < 2.5:
-                overall_skill = SkillLevel.INTERMEDIATE
-            elif avg_score < 3.5:
-                overall_skill = SkillLevel.ADVANCED
-            else:
-                overall_skill = SkillLevel.EXPERT
-            
-            session_data['overall_skill_level'] = overall_skill
+    def _get_estimator(self, session_id: str) -> SkillEstimator:
+        """Running skill estimate for the session"""
+        return SkillEstimator.from_state(self.store.get(session_id, SKILL_STATE_NAMESPACE))
+    
+    def _get_overall_skill_level(self, session_id: str) -> SkillLevel:
+        """Current overall skill level for the session"""
+        return SkillLevel(self._get_estimator(session_id).overall_level)
     
     def _generate_session_insights(self, session_id: str) -> List[str]:
         """Generate insights about the candidate's performance"""
-        
-        if session_id not in self.session_analysis:
-            return []
-        
-        session_data = self.session_analysis[session_id]
-        responses = session_data['responses']
-        
-        if not responses:
-            return []
-        
-        insights = []
-        
-        # Analyze response quality trend
-        recent_responses = responses[-3:]
-        avg_quality = sum(1 for r in recent_responses 
-                         if r['analysis']['response_quality'] == 'high') / len(recent_responses)
-        
-        if avg_quality > 0.6:
-            insights.append("Consistently provides detailed, high-quality responses")
-        elif avg_quality < 0.3:
-            insights.append("Responses could benefit from more detail and examples")
-        
-        # Analyze technical depth
-        avg_tech_depth = sum(r['analysis']['technical_depth_score'] 
-                           for r in recent_responses) / len(recent_responses)
-        
-        if avg_tech_depth > 0.7:
-            insights.append("Demonstrates strong technical understanding")
-        elif avg_tech_depth < 0.3:
-            insights.append("Could elaborate more on technical concepts")
-        
-        # Analyze experience indicators
-        avg_experience = sum(r['analysis']['experience_score'] 
-                           for r in recent_responses) / len(recent_responses)
-        
-        if avg_experience > 0.7:
-            insights.append("Shows substantial practical experience")
-        elif avg_experience < 0.3:
-            insights.append("Would benefit from sharing more practical examples")
-        
-        return insights
+        return self._get_estimator(session_id).insights()
     
     def get_session_summary(self, session_id: str) -> Dict[str, Any]:
         """Get comprehensive session analysis summary"""
         
-        if session_id not in self.session_analysis:
-            return {}
+        estimator = self._get_estimator(session_id)
         
-        session_data = self.session_analysis[session_id]
+        if not estimator.responses:
+            return {}
         
         return {
-            'overall_skill_level': session_data['overall_skill_level'].value,
-            'total_responses': len(session_data['responses']),
-            'session_insights': self._generate_session_insights(session_id),
-            'skill_progression': [r['analysis']['estimated_skill_level'].value 
-                                for r in session_data['responses']],
-            'average_response_quality': sum(1 for r in session_data['responses'] 
-                                          if r['analysis']['response_quality'] == 'high') / len(session_data['responses']) if session_data['responses'] else 0
+            'overall_skill_level': estimator.overall_level,
+            'total_responses': estimator.responses,
+            'session_insights': estimator.insights(),
+            'skill_progression': list(estimator.progression),
+            'average_response_quality': estimator.average_quality
         }
 
-# Global instance
+# Global instances
+response_analyzer = ResponseAnalyzer()
 skill_adapter = SkillLevelAdapter()
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Shared technology term index
+Word-boundary aware trie over the technology catalog, built once at import
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+from config import Config
+
+
+class TechMatch(NamedTuple):
+    """A single technology mention found in free text"""
+    category: str
+    canonical: str
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex notion of a word character"""
+    return char.isalnum() or char == '_'
+
+
+class TechTermIndex:
+    """Character trie over technology terms with leftmost-longest matching
+
+    Every catalog term is inserted once. Matching starts only at word
+    boundaries and only accepts a term if it also ends on a word boundary,
+    so 'go' never matches inside 'django' and 'git' never matches inside
+    'github'. A space inside a term matches any run of whitespace, which
+    lets multi-word terms like 'spring boot' match as one mention.
+    """
+
+    # Key under which a trie node stores the terms that end there
+    _TERMINAL = None
+
+    def __init__(self, catalog: Dict[str, List[str]],
+                 aliases: Optional[Dict[str, str]] = None):
+        self._root: Dict = {}
+        self.categories: Tuple[str, ...] = tuple(catalog.keys())
+        self.term_count = 0
+
+        canonical_categories: Dict[str, Tuple[str, ...]] = {}
+        for category, technologies in catalog.items():
+            for tech in technologies:
+                self.add_term(tech, tech, category)
+                canonical_categories[tech] = canonical_categories.get(tech, ()) + (category,)
+
+        # Aliases inherit every category of the technology they resolve to
+        for alias, canonical in (aliases or {}).items():
+            for category in canonical_categories.get(canonical, ()):
+                self.add_term(alias, canonical, category)
+
+        # Read-only view of canonical name -> categories for callers
+        self.lookup: Mapping[str, Tuple[str, ...]] = MappingProxyType(canonical_categories)
+
+    def add_term(self, term: str, canonical: str, category: str):
+        """Insert a term that resolves to the given canonical name and category"""
+        node = self._root
+        for char in ' '.join(term.lower().split()):
+            node = node.setdefault(char, {})
+
+        entries = node.get(self._TERMINAL, ())
+        entry = (canonical, category)
+        if entry not in entries:
+            if not entries:
+                self.term_count += 1
+            node[self._TERMINAL] = entries + (entry,)
+
+    def find_all(self, text: str) -> List[TechMatch]:
+        """Find every technology mention in a single left-to-right pass
+
+        Returns one match per (mention, category); a term listed under
+        several categories (e.g. 'prometheus') yields one match for each.
+        """
+        text_lower = text.lower()
+        length = len(text_lower)
+        matches: List[TechMatch] = []
+        root = self._root
+
+        position = 0
+        while position < length:
+            char = text_lower[position]
+            if char not in root or (position > 0 and _is_word_char(text_lower[position - 1])
+                                    and _is_word_char(char)):
+                position += 1
+                continue
+
+            node = root
+            cursor = position
+            best_end = -1
+            best_entries = ()
+
+            while cursor < length:
+                char = text_lower[cursor]
+                if char.isspace():
+                    if ' ' not in node:
+                        break
+                    node = node[' ']
+                    while cursor < length and text_lower[cursor].isspace():
+                        cursor += 1
+                else:
+                    if char not in node:
+                        break
+                    node = node[char]
+                    cursor += 1
+
+                entries = node.get(self._TERMINAL)
+                if entries and (cursor == length or not _is_word_char(text_lower[cursor])
+                                or not _is_word_char(text_lower[cursor - 1])):
+                    best_end = cursor
+                    best_entries = entries
+
+            if best_end < 0:
+                position += 1
+                continue
+
+            for canonical, category in best_entries:
+                matches.append(TechMatch(category, canonical, position, best_end))
+            position = best_end
+
+        return matches
+
+    def group_by_category(self, matches: List[TechMatch]) -> Dict[str, List[str]]:
+        """Group matches into {category: [canonical, ...]} without duplicates"""
+        grouped: Dict[str, List[str]] = {}
+        for match in matches:
+            names = grouped.setdefault(match.category, [])
+            if match.canonical not in names:
+                names.append(match.canonical)
+        return grouped
+
+    def extract(self, text: str) -> Dict[str, List[str]]:
+        """Convenience wrapper returning technologies grouped by category"""
+        return self.group_by_category(self.find_all(text))
+
+
+# Global instance
+tech_index = TechTermIndex(Config.COMMON_TECHNOLOGIES, Config.TECHNOLOGY_ALIASES)
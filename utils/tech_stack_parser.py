@@ -0,0 +1,76 @@
+"""
+Unified tech stack parser
+Single entry point for turning free text into a categorized tech stack
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+
+from utils.tech_index import TechMatch, TechTermIndex, tech_index
+
+
+@dataclass(frozen=True)
+class ParsedTechStack:
+    """Normalized, immutable result of parsing one piece of text"""
+    text: str
+    matches: Tuple[TechMatch, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.matches)
+
+    @property
+    def technologies(self) -> FrozenSet[str]:
+        """Canonical (lowercase) names of every technology mentioned"""
+        return frozenset(match.canonical for match in self.matches)
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        """Categories that have at least one technology, in mention order"""
+        return tuple(dict.fromkeys(match.category for match in self.matches))
+
+    def by_category(self) -> Dict[str, List[str]]:
+        """Return a fresh {category: [display name, ...]} dict
+
+        This is the shape stored in candidate_data['tech_stack'] and
+        consumed by the question generators and the scorer.
+        """
+        grouped: Dict[str, List[str]] = {}
+        for match in self.matches:
+            names = grouped.setdefault(match.category, [])
+            display = TechStackParser.display_name(match.canonical)
+            if display not in names:
+                names.append(display)
+        return grouped
+
+
+class TechStackParser:
+    """Parses tech mentions using the shared, precomputed tech index
+
+    Results are memoized per text so that the several components that look
+    at the same message during a turn (exit/AIML routing, AIML context
+    extraction, tech stack collection) only tokenize and match it once.
+    """
+
+    def __init__(self, index: TechTermIndex = tech_index, cache_size: int = 256):
+        self.index = index
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+
+    @staticmethod
+    def display_name(canonical: str) -> str:
+        """Human friendly form of a canonical technology name"""
+        return canonical.title()
+
+    def parse(self, text: str) -> ParsedTechStack:
+        """Parse free text into a ParsedTechStack"""
+        return self._parse_cached(text or "")
+
+    def _parse(self, text: str) -> ParsedTechStack:
+        return ParsedTechStack(text=text, matches=tuple(self.index.find_all(text)))
+
+    def cache_info(self):
+        """Expose memoization statistics for debugging"""
+        return self._parse_cached.cache_info()
+
+
+# Global instance
+tech_stack_parser = TechStackParser()